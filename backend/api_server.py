@@ -3,17 +3,30 @@ Flask API Server for Internship Matching System
 Provides REST endpoints for the ML-based internship matching service
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context, g
 from flask_cors import CORS
 from internship_matcher import InternshipMatcher
+from job_queue import JobQueue, QueueFullError, JobTooLargeError
+import resume_ingestion
+import metrics
+import catalogue_listing
+from catalogue_views import CatalogueViews
+import compression
+from json_provider import FastJSONProvider
 import json
 import traceback
+import hashlib
+import math
+import threading
+import time
 import sys
 import os
 import requests
 
 # Add the ml_models directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'ml_models'))
+from reason_engine import EXPLAIN_LEVELS
+from stage_timing import TIMINGS
 
 # Import the ML-based matcher
 try:
@@ -31,7 +44,25 @@ except ImportError as e:
     JOB_RECOMMENDER_AVAILABLE = False
     print(f"⚠️ Job recommender not available. Please check ml_models/job_recommender.py: {e}")
 
+# Translation mode: 'proxy' forwards to the standalone translation service,
+# 'inprocess' runs the translation engine (and its cache) inside this server
+TRANSLATION_MODE = os.environ.get('TRANSLATION_MODE', 'proxy').lower()
+TRANSLATION_SERVICE_URL = os.environ.get('TRANSLATION_SERVICE_URL', 'http://localhost:5001/translate_batch')
+
+try:
+    import translation_service
+    TRANSLATION_ENGINE_AVAILABLE = translation_service.TRANSLATOR_AVAILABLE
+except ImportError as e:
+    TRANSLATION_ENGINE_AVAILABLE = False
+    print(f"⚠️ In-process translation not available. Please check backend/translation_service.py: {e}")
+
+if TRANSLATION_MODE == 'inprocess' and not TRANSLATION_ENGINE_AVAILABLE:
+    print("⚠️ TRANSLATION_MODE=inprocess requested but the translation engine is unavailable, using proxy mode")
+    TRANSLATION_MODE = 'proxy'
+
 app = Flask(__name__)
+# orjson-backed JSON encoding (falls back to the json module) with NumPy/pandas support
+app.json = FastJSONProvider(app)
 # Enable CORS for all routes with specific configuration
 CORS(app, resources={
     r"/*": {
@@ -41,15 +72,92 @@ CORS(app, resources={
     }
 })
 
+# Per-stage timings for each response in an X-Timing header: always when TIMING_HEADER=1,
+# otherwise only for requests that send an X-Timing header themselves
+TIMING_HEADER = os.environ.get('TIMING_HEADER', '0').lower() in ('1', 'true', 'yes')
+
+
+# Prometheus metrics served by /metrics
+METRICS = metrics.Registry()
+HTTP_REQUESTS = METRICS.counter('http_requests_total', 'HTTP requests handled, by route, method and status',
+                                ['route', 'method', 'status'])
+HTTP_LATENCY = METRICS.histogram('http_request_duration_seconds', 'HTTP request latency by route',
+                                 ['route', 'method'])
+TRANSLATION_PROXY_LATENCY = METRICS.histogram('translation_proxy_duration_seconds',
+                                              'Latency of requests proxied to the translation service')
+TRANSLATION_PROXY_ERRORS = METRICS.counter('translation_proxy_errors_total',
+                                           'Failed requests to the translation service, by reason', ['reason'])
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    start = g.get('request_start')
+    if start is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        HTTP_REQUESTS.inc(route=route, method=request.method, status=response.status_code)
+        HTTP_LATENCY.observe(time.perf_counter() - start, route=route, method=request.method)
+    return response
+
+
+@app.after_request
+def compress_response(response):
+    return compression.compress_response(response, request.accept_encodings)
+
+
+@app.before_request
+def start_stage_trace():
+    """Collect the pipeline stage timings recorded while handling this request."""
+    g.stage_trace, g.stage_trace_token = TIMINGS.start_trace()
+
+
+@app.after_request
+def add_timing_header(response):
+    trace = g.get('stage_trace')
+    if trace is not None and trace.stages and (TIMING_HEADER or 'X-Timing' in request.headers):
+        response.headers['X-Timing'] = trace.header_value()
+    return response
+
+
+@app.teardown_request
+def end_stage_trace(exc):
+    token = g.pop('stage_trace_token', None)
+    if token is not None:
+        TIMINGS.end_trace(token)
+
+
+# Mount the translation endpoints (/translation/translate, /translation/languages, ...)
+if TRANSLATION_MODE == 'inprocess':
+    app.register_blueprint(translation_service.translation_bp, url_prefix='/translation')
+
 # Initialize the matchers globally
 matcher = None
 ml_matcher = None
 ml_model_loaded = False
 
+# /stats and the /users, /internships listings (built from the matcher on first use)
+catalogue_views = None
+
+# Which ML model file was loaded, how long it took and when (reported by /metrics)
+model_info = {}
+
+# Resume uploads are parsed and scored by a background worker pool
+RESUME_WORKERS = int(os.environ.get('RESUME_WORKERS', 4))
+RESUME_QUEUE_SIZE = int(os.environ.get('RESUME_QUEUE_SIZE', 200))
+resume_queue = None
+
+# /job_recommend and /explain share one job recommender, loaded on first use
+job_recommender = None
+job_recommender_lock = threading.Lock()
+
 
 def initialize_matchers():
     """Initialize both rule-based and ML-based matchers with dataset paths."""
-    global matcher, ml_matcher, ml_model_loaded
+    global matcher, ml_matcher, ml_model_loaded, model_info, catalogue_views
     try:
         # Get the root directory (parent of backend directory)
         root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -63,6 +171,7 @@ def initialize_matchers():
             user_dataset_path=user_dataset_path,
             internship_dataset_path=internship_dataset_path
         )
+        catalogue_views = CatalogueViews(matcher)
         print("✅ Rule-based Internship Matcher initialized successfully")
         
         # Initialize ML-based matcher if available
@@ -73,10 +182,12 @@ def initialize_matchers():
                     internship_dataset_path=internship_dataset_path
                 )
                 # Try to load the pre-trained model
+                load_start = time.perf_counter()
                 try:
                     model_path = os.path.join(root_dir, 'ml_models', 'internship_matcher_model.joblib')
                     ml_matcher.load_model(model_path)
                     ml_model_loaded = True
+                    model_source = 'loaded'
                     print("✅ ML-based Internship Matcher initialized successfully")
                 except Exception as e:
                     print(f"⚠️ Could not load pre-trained ML model: {e}")
@@ -85,7 +196,15 @@ def initialize_matchers():
                     model_path = os.path.join(root_dir, 'ml_models', 'internship_matcher_model.joblib')
                     ml_matcher.save_model(model_path)
                     ml_model_loaded = True
+                    model_source = 'trained'
                     print("✅ ML model trained and saved")
+                model_info = {
+                    'file': os.path.basename(model_path),
+                    'version': model_version(model_path),
+                    'source': model_source,
+                    'load_seconds': time.perf_counter() - load_start,
+                    'loaded_at': time.time()
+                }
             except Exception as e:
                 print(f"❌ Error initializing ML matcher: {e}")
                 ml_model_loaded = False
@@ -98,14 +217,24 @@ def initialize_matchers():
         return False
 
 
+def model_version(model_path):
+    """Short content hash identifying a model file."""
+    digest = hashlib.sha256()
+    with open(model_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+
 @app.route('/', methods=['GET'])
 def home():
     """API documentation and status endpoint."""
-    return jsonify({
+    response = jsonify({
         'service': 'Internship Matching System API',
         'version': '1.0.0',
         'status': 'active' if matcher else 'inactive',
         'ml_model_status': 'available' if ml_model_loaded else 'not available',
+        'translation_mode': TRANSLATION_MODE,
         'endpoints': {
             'GET /': 'API documentation',
             'GET /health': 'Health check',
@@ -114,12 +243,38 @@ def home():
             'POST /ml_recommend': 'Get internship recommendations (ML-based)',
             'POST /ai_recommend': 'Get AI recommendations from frontend form',
             'POST /job_recommend': 'Get job recommendations using trained ML model',
+            'POST /explain': 'Get the recommendation reason for one internship or job on demand',
             'GET /user/<user_id>': 'Get user information',
-            'GET /users': 'List all users',
-            'GET /internships': 'List all internships'
+            'GET /users': 'List users (paginated, filterable)',
+            'GET /internships': 'List internships (paginated, filterable)',
+            'POST /translate_batch': 'Translate texts (in-process or proxied to the translation service)',
+            'POST /resume_recommend': 'Upload resume PDFs and queue them for parsing and recommendations',
+            'GET /resume_jobs/<job_id>': 'Poll a resume job for its results',
+            'GET /resume_jobs/<job_id>/stream': 'Stream resume job results as server-sent events',
+            'GET /resume_jobs/metrics': 'Resume queue depth and throughput',
+            'GET /timings': 'Per-stage latency histograms for the recommendation pipelines',
+            'GET /metrics': 'Prometheus metrics',
+            'DELETE /timings': 'Reset the stage latency histograms'
         },
         'description': 'ML-based system for matching students with internships based on preferences and enrollment rules'
     })
+    etag = hashlib.sha1(response.get_data()).hexdigest()
+    return conditional_response(etag, lambda: response)
+
+
+def conditional_response(etag, build):
+    """Answer 304 if If-None-Match names `etag` (or a compressed variant), else build() the response."""
+    matched = compression.matching_etag(request.if_none_match, etag)
+    if matched:
+        # Echo the variant the client holds
+        response = Response(status=304)
+        response.set_etag(matched)
+    else:
+        response = build()
+        response.set_etag(etag)
+    # Let clients and proxies cache the body but revalidate on every request
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 @app.route('/health', methods=['GET'])
@@ -138,48 +293,13 @@ def health_check():
 
 @app.route('/stats', methods=['GET'])
 def get_stats():
-    """Get system statistics."""
+    """Get system statistics (precomputed; supports If-None-Match)."""
     if not matcher:
         return jsonify({'error': 'System not initialized'}), 500
     
     try:
-        # Domain distribution
-        user_domains = {}
-        for user in matcher.users:
-            domain = user.preferred_domain
-            user_domains[domain] = user_domains.get(domain, 0) + 1
-        
-        internship_domains = {}
-        for internship in matcher.internships:
-            domain = internship.domain
-            internship_domains[domain] = internship_domains.get(domain, 0) + 1
-        
-        # Enrollment status distribution
-        enrollment_stats = {}
-        for user in matcher.users:
-            status = user.enrollment_status
-            enrollment_stats[status] = enrollment_stats.get(status, 0) + 1
-        
-        # Location distribution
-        user_locations = {}
-        for user in matcher.users:
-            location = user.preferred_location
-            user_locations[location] = user_locations.get(location, 0) + 1
-        
-        internship_locations = {}
-        for internship in matcher.internships:
-            location = internship.location
-            internship_locations[location] = internship_locations.get(location, 0) + 1
-        
-        return jsonify({
-            'total_users': len(matcher.users),
-            'total_internships': len(matcher.internships),
-            'user_domains': user_domains,
-            'internship_domains': internship_domains,
-            'enrollment_distribution': enrollment_stats,
-            'user_locations': user_locations,
-            'internship_locations': internship_locations
-        })
+        stats, etag = catalogue_views.stats.snapshot_with_etag()
+        return conditional_response(etag, lambda: jsonify(stats))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -198,18 +318,24 @@ def get_recommendations():
         
         user_id = data['user_id']
         top_k = data.get('top_k', 3)  # Default to top 3
+        explain = get_explain_level(data)
+        salary_options = get_salary_options(data)
         
         # Validate user_id
         if not isinstance(user_id, int) or user_id < 1 or user_id > 100:
             return jsonify({'error': 'user_id must be an integer between 1 and 100'}), 400
+        if not explain:
+            return jsonify({'error': EXPLAIN_ERROR}), 400
+        if not salary_options:
+            return jsonify({'error': SALARY_OPTIONS_ERROR}), 400
         
         # Get user info
         user_info = matcher.get_user_info(user_id)
         if not user_info:
             return jsonify({'error': f'User {user_id} not found'}), 404
         
-        # Get recommendations
-        recommendations = matcher.get_top_recommendations(user_id, top_k)
+        # Get recommendations (rule-based results are always ranked by stipend)
+        recommendations = matcher.get_top_recommendations(user_id, top_k, explain, min_salary=salary_options[0])
         
         return jsonify({
             'user_id': user_id,
@@ -237,13 +363,20 @@ def get_ml_recommendations():
         
         user_id = data['user_id']
         top_k = data.get('top_k', 3)  # Default to top 3
+        explain = get_explain_level(data)
+        salary_options = get_salary_options(data)
         
         # Validate user_id
         if not isinstance(user_id, int) or user_id < 1 or user_id > 100:
             return jsonify({'error': 'user_id must be an integer between 1 and 100'}), 400
+        if not explain:
+            return jsonify({'error': EXPLAIN_ERROR}), 400
+        if not salary_options:
+            return jsonify({'error': SALARY_OPTIONS_ERROR}), 400
+        min_salary, sort = salary_options
         
         # Get recommendations from ML model
-        recommendations = ml_matcher.get_recommendations(user_id, top_k)
+        recommendations = ml_matcher.get_recommendations(user_id, top_k, explain, min_salary=min_salary, sort=sort)
         
         # Get user info from rule-based matcher (same data)
         user_info = matcher.get_user_info(user_id) if matcher else {}
@@ -289,27 +422,26 @@ def get_ai_recommendations():
             response.headers.add('Access-Control-Allow-Origin', '*')
             return response
         
+        explain = get_explain_level(data)
+        if not explain:
+            response = jsonify({'error': EXPLAIN_ERROR})
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response, 400
+        salary_options = get_salary_options(data)
+        if not salary_options:
+            response = jsonify({'error': SALARY_OPTIONS_ERROR})
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response, 400
+        min_salary, sort = salary_options
+        
         # Extract form fields and map to user profile
-        # Note: This is a simplified mapping based on the form fields
-        user_profile = {
-            'name': data.get('name', ''),
-            'citizenship': data.get('citizenship', 'Indian'),
-            'age': data.get('age', 0),
-            'education': data.get('eduMin', ''),
-            'skills': data.get('skills', ''),
-            'preferred_domain': data.get('domain', ''),
-            'preferred_location': data.get('location', ''),
-            'internship_duration': data.get('duration', '12 Months'),
-            'enrollment_status': map_enrollment_status(data.get('edu', '')),
-            'family_income': data.get('income', ''),
-            'aadhaar_linked': data.get('aadhaarLink', 'no'),
-            'govt_job_family': data.get('govtJob', 'no')
-        }
+        user_profile = build_user_profile(data)
         
         print(f"Processing AI recommendation for user profile: {user_profile}")
         
         # Get recommendations directly from ML model without modifying dataset files
-        recommendations = ml_matcher.get_recommendations_for_profile(user_profile, 3)
+        recommendations = ml_matcher.get_recommendations_for_profile(user_profile, 3, explain,
+                                                                     min_salary=min_salary, sort=sort)
         
         print(f"Generated recommendations: {recommendations}")
         
@@ -346,6 +478,56 @@ def get_ai_recommendations():
         return error_response
 
 
+def build_user_profile(data):
+    """Map frontend form fields to a user profile."""
+    # Note: This is a simplified mapping based on the form fields
+    return {
+        'name': data.get('name', ''),
+        'citizenship': data.get('citizenship', 'Indian'),
+        'age': data.get('age', 0),
+        'education': data.get('eduMin', ''),
+        'skills': data.get('skills', ''),
+        'preferred_domain': data.get('domain', ''),
+        'preferred_location': data.get('location', ''),
+        'internship_duration': data.get('duration', '12 Months'),
+        'enrollment_status': map_enrollment_status(data.get('edu', '')),
+        'family_income': data.get('income', ''),
+        'aadhaar_linked': data.get('aadhaarLink', 'no'),
+        'govt_job_family': data.get('govtJob', 'no')
+    }
+
+
+EXPLAIN_ERROR = f"explain must be one of {list(EXPLAIN_LEVELS)}"
+
+
+def get_explain_level(data, default='full'):
+    """Return the requested reason detail level ('none', 'short' or 'full'), or None if invalid."""
+    explain = str(data.get('explain', default)).lower()
+    return explain if explain in EXPLAIN_LEVELS else None
+
+
+SORT_ORDERS = ('relevance', 'salary')
+SALARY_OPTIONS_ERROR = f"min_salary must be a non-negative number (INR/year) and sort one of {list(SORT_ORDERS)}"
+
+
+def get_salary_options(data):
+    """Return (min_salary, sort) from a request body (min_salary None when absent), or None if invalid."""
+    min_salary = data.get('min_salary')
+    if min_salary is not None:
+        if isinstance(min_salary, bool):
+            return None
+        try:
+            min_salary = float(min_salary)
+        except (TypeError, ValueError):
+            return None
+        if math.isnan(min_salary) or min_salary < 0:
+            return None
+    sort = str(data.get('sort', 'relevance')).lower()
+    if sort not in SORT_ORDERS:
+        return None
+    return min_salary, sort
+
+
 def map_enrollment_status(form_value):
     """Map form enrollment status to system values."""
     mapping = {
@@ -450,59 +632,86 @@ def get_user(user_id):
         return jsonify({'error': str(e)}), 500
 
 
+def list_catalogue(listing, items_key: str, total_key: str):
+    """
+    Serve one page of a catalogue listing from its precomputed indexes.
+    
+    Query parameters: limit, offset or cursor, fields (comma-separated), the listing's
+    filters and, for internships, min_salary/max_salary on stipend_value (INR/year).
+    """
+    args = request.args
+    try:
+        limit = int(args.get('limit', catalogue_listing.DEFAULT_LIMIT))
+        offset = int(args.get('offset', 0))
+        low = float(args['min_salary']) if 'min_salary' in args else None
+        high = float(args['max_salary']) if 'max_salary' in args else None
+    except ValueError:
+        return jsonify({'error': 'limit and offset must be integers, min_salary and max_salary numbers'}), 400
+    if not 1 <= limit <= catalogue_listing.MAX_LIMIT or offset < 0:
+        return jsonify({'error': f'limit must be between 1 and {catalogue_listing.MAX_LIMIT} '
+                                 f'and offset must not be negative'}), 400
+    if 'cursor' in args and 'offset' in args:
+        return jsonify({'error': 'Use either cursor or offset, not both'}), 400
+    if (low is not None or high is not None) and not listing.range_field:
+        return jsonify({'error': 'min_salary and max_salary are only supported for internships'}), 400
+    
+    fields = None
+    if args.get('fields'):
+        fields = [field.strip() for field in args['fields'].split(',') if field.strip()]
+        unknown = [field for field in fields if field not in listing.fields]
+        if unknown:
+            return jsonify({'error': f'Unknown fields: {", ".join(unknown)}',
+                            'available_fields': list(listing.fields)}), 400
+    filters = {name: args[name] for name in listing.filters if name in args}
+    
+    if 'cursor' in args:
+        try:
+            catalogue_listing.decode_cursor(args['cursor'])
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    
+    def build_page():
+        # Full rows come back as cached JSON fragments, projected rows as dicts
+        total, rows, next_cursor = listing.query(filters, low, high, fields, limit, offset, args.get('cursor'),
+                                                 as_fragments=fields is None)
+        envelope = {
+            total_key: total,
+            'count': len(rows),
+            'limit': limit,
+            'offset': None if 'cursor' in args else offset,
+            'next_cursor': next_cursor
+        }
+        if fields is None:
+            return app.json.fragment_response(envelope, items_key, rows)
+        envelope[items_key] = rows
+        return jsonify(envelope)
+    
+    # The page only depends on the catalogue version and the query
+    query = '&'.join(f'{key}={value}' for key, value in sorted(args.items(multi=True)))
+    etag = hashlib.sha1(f'{listing.version}?{query}'.encode('utf-8')).hexdigest()
+    return conditional_response(etag, build_page)
+
+
 @app.route('/users', methods=['GET'])
 def get_all_users():
-    """Get list of all users with basic information."""
+    """List users (paginated; filters: domain, location, enrollment_status)."""
     if not matcher:
         return jsonify({'error': 'System not initialized'}), 500
     
     try:
-        users_list = []
-        for user in matcher.users:
-            users_list.append({
-                'user_id': user.user_id,
-                'education': user.education,
-                'preferred_domain': user.preferred_domain,
-                'preferred_location': user.preferred_location,
-                'enrollment_status': user.enrollment_status,
-                'internship_duration': user.internship_duration
-            })
-        
-        return jsonify({
-            'total_users': len(users_list),
-            'users': users_list
-        })
-        
+        return list_catalogue(catalogue_views.user_listing, 'users', 'total_users')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/internships', methods=['GET'])
 def get_all_internships():
-    """Get list of all internships."""
+    """List internships (paginated; filters: domain, location, actively_hiring, min_salary, max_salary)."""
     if not matcher:
         return jsonify({'error': 'System not initialized'}), 500
     
     try:
-        internships_list = []
-        for internship in matcher.internships:
-            internships_list.append({
-                'internship_id': internship.internship_id,
-                'company': internship.company,
-                'role': internship.role,
-                'domain': internship.domain,
-                'location': internship.location,
-                'type': internship.type,
-                'duration': internship.duration,
-                'stipend': internship.stipend,
-                'stipend_value': internship.stipend_value
-            })
-        
-        return jsonify({
-            'total_internships': len(internships_list),
-            'internships': internships_list
-        })
-        
+        return list_catalogue(catalogue_views.internship_listing, 'internships', 'total_internships')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -521,9 +730,15 @@ def batch_recommendations():
         
         user_ids = data['user_ids']
         top_k = data.get('top_k', 3)
+        explain = get_explain_level(data)
+        salary_options = get_salary_options(data)
         
         if not isinstance(user_ids, list):
             return jsonify({'error': 'user_ids must be an array'}), 400
+        if not explain:
+            return jsonify({'error': EXPLAIN_ERROR}), 400
+        if not salary_options:
+            return jsonify({'error': SALARY_OPTIONS_ERROR}), 400
         
         results = []
         for user_id in user_ids:
@@ -543,7 +758,8 @@ def batch_recommendations():
                     })
                     continue
                 
-                recommendations = matcher.get_top_recommendations(user_id, top_k)
+                recommendations = matcher.get_top_recommendations(user_id, top_k, explain,
+                                                                  min_salary=salary_options[0])
                 results.append({
                     'user_id': user_id,
                     'user_info': user_info,
@@ -569,7 +785,7 @@ def batch_recommendations():
 
 @app.route('/translate_batch', methods=['POST'])
 def translate_batch():
-    """Proxy endpoint for translation service"""
+    """Translate texts in-process or through the standalone translation service."""
     try:
         # Get the data from the request
         data = request.get_json()
@@ -577,28 +793,157 @@ def translate_batch():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Forward the request to the translation service
-        translation_service_url = 'http://localhost:5001/translate_batch'
+        if TRANSLATION_MODE == 'inprocess':
+            return translate_batch_inprocess(data)
         
+        # Forward the request to the translation service
+        proxy_start = time.perf_counter()
         try:
-            response = requests.post(translation_service_url, json=data, timeout=10)
+            response = requests.post(TRANSLATION_SERVICE_URL, json=data, timeout=10)
+            TRANSLATION_PROXY_LATENCY.observe(time.perf_counter() - proxy_start)
             
             if response.status_code == 200:
                 return jsonify(response.json()), 200
             else:
+                TRANSLATION_PROXY_ERRORS.inc(reason=f'status_{response.status_code}')
                 return jsonify({'error': f'Translation service error: {response.status_code}'}), response.status_code
                 
         except requests.exceptions.ConnectionError:
+            TRANSLATION_PROXY_ERRORS.inc(reason='connection')
             return jsonify({'error': 'Translation service is not available. Please make sure the translation service is running on port 5001.'}), 503
         except requests.exceptions.Timeout:
+            TRANSLATION_PROXY_LATENCY.observe(time.perf_counter() - proxy_start)
+            TRANSLATION_PROXY_ERRORS.inc(reason='timeout')
             return jsonify({'error': 'Translation service timeout'}), 504
         except Exception as e:
+            TRANSLATION_PROXY_ERRORS.inc(reason='other')
             return jsonify({'error': f'Error connecting to translation service: {str(e)}'}), 500
             
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def translate_batch_inprocess(data):
+    """Translate a batch with the in-process engine, mirroring the service's responses."""
+    if 'texts' not in data or 'target_lang' not in data:
+        return jsonify({'error': 'Missing texts or target_lang in request'}), 400
+    
+    try:
+        translations = translation_service.engine.translate_batch(data['texts'], data['target_lang'])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({
+        'translations': translations,
+        'target_lang': data['target_lang']
+    }), 200
+
+
+def get_resume_queue():
+    """Create the resume job queue on first use."""
+    global resume_queue
+    if resume_queue is None:
+        resume_queue = JobQueue(process_resume, workers=RESUME_WORKERS, max_queue_size=RESUME_QUEUE_SIZE)
+    return resume_queue
+
+
+def process_resume(item):
+    """Parse one uploaded resume and score it with the ML matcher (runs on a queue worker)."""
+    text = resume_ingestion.extract_text_from_pdf(item['content'])
+    profile = resume_ingestion.parse_resume_text(text, source=item['filename'])
+    recommendations = ml_matcher.get_recommendations_for_profile(profile, item['top_k'])
+    return {
+        'filename': item['filename'],
+        'user_profile': profile,
+        'recommendations': recommendations,
+        'total_recommendations': len(recommendations)
+    }
+
+
+@app.route('/resume_recommend', methods=['POST'])
+def resume_recommend():
+    """Queue uploaded resume PDFs for parsing and recommendations, returning a job id."""
+    if not ml_model_loaded or not ml_matcher:
+        return jsonify({'error': 'ML model not available or not initialized'}), 500
+    
+    if not resume_ingestion.PDF_SUPPORT_AVAILABLE:
+        return jsonify({'error': 'PDF support not available. Please install pypdf.'}), 500
+    
+    try:
+        files = request.files.getlist('resumes') + request.files.getlist('resume')
+        if not files:
+            return jsonify({'error': 'Upload one or more PDF files in the "resumes" field'}), 400
+        
+        # Checked before queueing so the workers never see a bad value
+        try:
+            top_k = int(request.form.get('top_k', 3))
+        except ValueError:
+            top_k = 0
+        if top_k < 1:
+            return jsonify({'error': 'top_k must be a positive integer'}), 400
+        
+        items = []
+        for file in files:
+            if not file.filename.lower().endswith('.pdf'):
+                return jsonify({'error': f'{file.filename} is not a PDF file'}), 400
+            items.append({'filename': file.filename, 'content': file.read(), 'top_k': top_k})
+        
+        try:
+            job = get_resume_queue().submit(items)
+        except JobTooLargeError as e:
+            # Retrying cannot help: the upload must be split
+            return jsonify({'error': str(e)}), 413
+        except QueueFullError as e:
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = '5'
+            return response, 503
+        
+        return jsonify({
+            'job_id': job.job_id,
+            'status': job.status,
+            'total': job.total,
+            'status_url': f'/resume_jobs/{job.job_id}',
+            'stream_url': f'/resume_jobs/{job.job_id}/stream'
+        }), 202
+        
+    except Exception as e:
+        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+
+
+@app.route('/resume_jobs/metrics', methods=['GET'])
+def resume_queue_metrics():
+    """Get resume queue depth and throughput counters."""
+    return jsonify(get_resume_queue().metrics())
+
+
+@app.route('/resume_jobs/<job_id>', methods=['GET'])
+def get_resume_job(job_id):
+    """Poll a resume job for its status and the results completed so far."""
+    job = get_resume_queue().get(job_id)
+    if not job:
+        return jsonify({'error': f'Job {job_id} not found'}), 404
+    
+    return jsonify(job.to_dict())
+
+
+@app.route('/resume_jobs/<job_id>/stream', methods=['GET'])
+def stream_resume_job(job_id):
+    """Stream resume job results as server-sent events while they complete."""
+    job = get_resume_queue().get(job_id)
+    if not job:
+        return jsonify({'error': f'Job {job_id} not found'}), 404
+    
+    timeout = request.args.get('timeout', 30.0, type=float)
+    
+    def generate():
+        for result in job.iter_results(timeout):
+            yield f"event: result\ndata: {app.json.dumps(result)}\n\n"
+        yield f"event: done\ndata: {app.json.dumps(job.to_dict(include_results=False))}\n\n"
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+
 @app.route('/job_recommend', methods=['POST'])
 def get_job_recommendations():
     """Get job recommendations using the trained ML model."""
@@ -611,17 +956,15 @@ def get_job_recommendations():
         if not data:
             return jsonify({'error': 'No data provided in request body'}), 400
         
-        # Get the root directory
-        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Initialize job recommender with dataset and model paths
-        jobs_dataset_path = os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv')
-        model_path = os.path.join(root_dir, 'ml_models', 'jobs_matcher_model.joblib')
+        explain = get_explain_level(data)
+        if not explain:
+            return jsonify({'error': EXPLAIN_ERROR}), 400
+        salary_options = get_salary_options(data)
+        if not salary_options:
+            return jsonify({'error': SALARY_OPTIONS_ERROR}), 400
+        min_salary, sort = salary_options
         
-        recommender = JobRecommender(
-            jobs_dataset_path=jobs_dataset_path,
-            model_path=model_path
-        )
+        recommender = get_job_recommender()
         
         # Extract user information from request
         skills = data.get('skills', '')
@@ -630,7 +973,8 @@ def get_job_recommendations():
         top_k = data.get('top_k', 5)
         
         # Get recommendations
-        recommendations = recommender.get_recommendations(skills, location, experience, top_k)
+        recommendations = recommender.get_recommendations(skills, location, experience, top_k, explain,
+                                                          min_salary=min_salary, sort=sort)
         
         return jsonify({
             'user_input': {
@@ -647,11 +991,179 @@ def get_job_recommendations():
         return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
 
 
+@app.route('/timings', methods=['GET'])
+def get_timings():
+    """Per-stage latency histograms, grouped by pipeline."""
+    return jsonify({
+        'sample_rate': TIMINGS.sample_rate,
+        'pipelines': TIMINGS.snapshot()
+    })
+
+
+@app.route('/timings', methods=['DELETE'])
+def reset_timings():
+    """Reset the stage latency histograms."""
+    TIMINGS.reset()
+    return jsonify({'status': 'reset'})
+
+
+@METRICS.register_collector
+def collect_app_metrics():
+    """Scrape-time gauges: model, catalogue sizes, caches, queues and pipeline stage timings."""
+    families = [metrics.MetricFamily('ml_model_loaded', 'Whether the ML internship model is loaded').add(
+        1 if ml_model_loaded else 0)]
+    if model_info:
+        families.extend([
+            metrics.MetricFamily('ml_model_info', 'Loaded ML model file and version').add(
+                1, file=model_info['file'], version=model_info['version'], source=model_info['source']),
+            metrics.MetricFamily('ml_model_load_seconds', 'Time taken to load (or train) the ML model').add(
+                model_info['load_seconds']),
+            metrics.MetricFamily('ml_model_loaded_timestamp_seconds', 'When the ML model was loaded').add(
+                model_info['loaded_at'])
+        ])
+    
+    catalogue = metrics.MetricFamily('catalogue_size', 'Rows in each loaded catalogue')
+    if matcher:
+        catalogue.add(len(matcher.internships), catalogue='internships')
+        catalogue.add(len(matcher.users), catalogue='users')
+    if ml_model_loaded and ml_matcher:
+        catalogue.add(len(ml_matcher.model['internship_features']), catalogue='ml_internships')
+    families.append(catalogue)
+    
+    if TRANSLATION_MODE == 'inprocess':
+        stats = translation_service.engine.cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        families.extend([
+            metrics.MetricFamily('translation_cache_hits_total', 'Translation cache hits', 'counter').add(stats['hits']),
+            metrics.MetricFamily('translation_cache_misses_total', 'Translation cache misses', 'counter').add(
+                stats['misses']),
+            metrics.MetricFamily('translation_cache_entries', 'Cached translations').add(stats['size']),
+            metrics.MetricFamily('translation_cache_hit_ratio', 'Translation cache hit ratio').add(
+                stats['hits'] / lookups if lookups else 0.0)
+        ])
+    
+    if resume_queue:
+        queue_metrics = resume_queue.metrics()
+        for key, documentation in [('queue_depth', 'Resumes waiting in the queue'),
+                                   ('max_queue_size', 'Resume queue capacity'),
+                                   ('workers', 'Resume worker threads'),
+                                   ('active_workers', 'Resume workers currently processing'),
+                                   ('jobs_tracked', 'Resume jobs held for polling')]:
+            families.append(metrics.MetricFamily(f'resume_queue_{key}', documentation).add(queue_metrics[key]))
+        for key, documentation in [('jobs_submitted', 'Resume jobs accepted'),
+                                   ('jobs_rejected', 'Resume jobs rejected because the queue was full'),
+                                   ('items_processed', 'Resumes processed'),
+                                   ('items_failed', 'Resumes that failed to process')]:
+            families.append(metrics.MetricFamily(f'resume_queue_{key}_total', documentation, 'counter').add(
+                queue_metrics[key]))
+    
+    families.extend([
+        metrics.MetricFamily('compressed_body_cache_hits_total', 'Responses served from the compressed body cache',
+                             'counter').add(compression.CACHE.hits),
+        metrics.MetricFamily('compressed_body_cache_misses_total', 'Responses compressed and added to the cache',
+                             'counter').add(compression.CACHE.misses)
+    ])
+    
+    stages = metrics.MetricFamily('pipeline_stage_duration_seconds', 'Recommendation pipeline stage latency',
+                                  'histogram')
+    for (pipeline, stage), histogram in sorted(TIMINGS.histograms().items()):
+        stages.samples.extend(metrics.histogram_samples(histogram, {'pipeline': pipeline, 'stage': stage}))
+    families.append(stages)
+    
+    return families
+
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus text-format metrics."""
+    return Response(METRICS.render(), content_type=metrics.CONTENT_TYPE)
+
+
+def create_job_recommender():
+    """Initialize the job recommender with its dataset and model paths."""
+    # Get the root directory
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    jobs_dataset_path = os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv')
+    model_path = os.path.join(root_dir, 'ml_models', 'jobs_matcher_model.joblib')
+    
+    return JobRecommender(
+        jobs_dataset_path=jobs_dataset_path,
+        model_path=model_path
+    )
+
+
+def get_job_recommender():
+    """Create the shared job recommender on first use (loading the model and building its indexes once)."""
+    global job_recommender
+    if job_recommender is None:
+        with job_recommender_lock:
+            # Requests that waited on the lock reuse the recommender the first one built
+            if job_recommender is None:
+                job_recommender = create_job_recommender()
+    return job_recommender
+
+
+@app.route('/explain', methods=['POST'])
+def explain_recommendation():
+    """
+    Generate the reason for a single recommendation on demand.
+    
+    Pairs with explain='none' on the recommendation endpoints: clients fetch
+    reasons only for the results a user actually opens.
+    
+    Body: {'internship_id': ..., <ai_recommend form fields>} for the ML internship model, or
+    {'model': 'job', 'job_id': ..., 'skills': ..., 'location': ..., 'experience': ...} for jobs.
+    'explain' may be 'short' or 'full' (default).
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({'error': 'No data provided in request body'}), 400
+    
+    explain = get_explain_level(data)
+    if explain not in ('short', 'full'):
+        return jsonify({'error': "explain must be 'short' or 'full'"}), 400
+    
+    model = data.get('model', 'ml')
+    try:
+        if model == 'ml':
+            if not ml_model_loaded or not ml_matcher:
+                return jsonify({'error': 'ML model not available or not initialized'}), 500
+            if not isinstance(data.get('internship_id'), int):
+                return jsonify({'error': 'internship_id must be an integer'}), 400
+            item_id = data['internship_id']
+            reason = ml_matcher.explain(build_user_profile(data), item_id, explain)
+        elif model == 'job':
+            if not JOB_RECOMMENDER_AVAILABLE:
+                return jsonify({'error': 'Job recommender not available'}), 500
+            if not isinstance(data.get('job_id'), int):
+                return jsonify({'error': 'job_id must be an integer'}), 400
+            item_id = data['job_id']
+            reason = get_job_recommender().explain(
+                data.get('skills', ''), data.get('location', 'any'), data.get('experience', '0-2 years'),
+                item_id, explain
+            )
+        else:
+            return jsonify({'error': "model must be 'ml' or 'job'"}), 400
+    except KeyError as e:
+        return jsonify({'error': str(e.args[0])}), 404
+    except Exception as e:
+        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+    
+    return jsonify({
+        'model': model,
+        'id': item_id,
+        'explain': explain,
+        'reason': reason
+    })
+
+
 if __name__ == '__main__':
     print("🚀 Starting Internship Matching API Server...")
     
     # Initialize the matchers
     if initialize_matchers():
+        print(f"🌐 Translation mode: {TRANSLATION_MODE}")
         print("🌐 Server starting on http://localhost:5000")
         print("📖 API documentation available at http://localhost:5000")
         app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,217 @@
+"""
+Paginated, filterable listings of the user and internship catalogues
+Rows are converted to dicts once when the listing is built and indexed by each
+filterable attribute (value -> sorted row positions) and by stipend (sorted
+order), so a /users or /internships page is a few index intersections and a
+slice instead of a scan of the whole catalogue. A row's JSON is only produced
+the first time it is served and cached from then on, so rows nobody pages
+through are never serialized.
+"""
+
+import base64
+import hashlib
+import threading
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from json_provider import dumps_bytes
+
+# Field name -> getter for the serialized rows
+USER_FIELDS = {
+    'user_id': lambda user: user.user_id,
+    'education': lambda user: user.education,
+    'preferred_domain': lambda user: user.preferred_domain,
+    'preferred_location': lambda user: user.preferred_location,
+    'enrollment_status': lambda user: user.enrollment_status,
+    'internship_duration': lambda user: user.internship_duration
+}
+
+INTERNSHIP_FIELDS = {
+    'internship_id': lambda internship: internship.internship_id,
+    'company': lambda internship: internship.company,
+    'role': lambda internship: internship.role,
+    'domain': lambda internship: internship.domain,
+    'location': lambda internship: internship.location,
+    'type': lambda internship: internship.type,
+    'duration': lambda internship: internship.duration,
+    'stipend': lambda internship: internship.stipend,
+    'stipend_value': lambda internship: internship.stipend_value,
+    'actively_hiring': lambda internship: internship.actively_hiring
+}
+
+# Query parameter -> field matched exactly (case-insensitive)
+USER_FILTERS = {
+    'domain': 'preferred_domain',
+    'location': 'preferred_location',
+    'enrollment_status': 'enrollment_status'
+}
+
+INTERNSHIP_FILTERS = {
+    'domain': 'domain',
+    'location': 'location',
+    'actively_hiring': 'actively_hiring'
+}
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+def _normalize(value) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    value = str(value).strip().lower()
+    if value in ('1', 'yes'):
+        return 'true'
+    if value in ('0', 'no'):
+        return 'false'
+    return value
+
+
+def encode_cursor(position: int) -> str:
+    return base64.urlsafe_b64encode(str(position).encode('ascii')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> int:
+    """Row position a cursor points after (raises ValueError if it is malformed)."""
+    try:
+        position = int(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii'))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if position < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return position
+
+
+class CatalogueListing:
+    """Serialized catalogue rows with value and range indexes for filtered, paginated listing."""
+
+    def __init__(self, fields: Dict[str, Callable], filters: Dict[str, str], range_field: Optional[str] = None,
+                 items: list = (), source: str = ''):
+        """
+        Args:
+            fields: Field name -> getter for the listed rows
+            filters: Query parameter -> field matched exactly (case-insensitive)
+            range_field: Numeric field indexed for min/max queries
+            items: Catalogue rows
+            source: Key of the dataset the rows were loaded from (e.g. dataset_cache.dataset_key()); the
+                version of an unchanged, un-ingested catalogue is derived from it alone
+        """
+        self.fields = fields
+        self.filters = filters
+        self.range_field = range_field
+        self._lock = threading.Lock()
+        self.rebuild(items, source)
+
+    def rebuild(self, items: list, source: str = ''):
+        """Re-index every row (used on load and reload)."""
+        with self._lock:
+            self.rows = []
+            # Row position -> JSON bytes, filled as rows are served
+            self._fragments: Dict[int, bytes] = {}
+            self._positions: Dict[str, Dict[str, np.ndarray]] = {field: {} for field in self.filters.values()}
+            self._range_order = np.empty(0, dtype=np.int64)
+            self._range_values = np.empty(0, dtype=np.float64)
+            self._source = source
+            # Unique per build, so ingested states (and listings without a source) never share a version
+            self._token = uuid.uuid4().hex
+            self._ingests = -1
+            self._append(list(items))
+
+    def add(self, items: list):
+        """Append newly ingested rows; existing cursors stay valid."""
+        items = list(items)
+        if items:
+            with self._lock:
+                self._append(items)
+
+    def _append(self, items: list):
+        start = len(self.rows)
+        rows = [{name: getter(item) for name, getter in self.fields.items()} for item in items]
+        self.rows.extend(rows)
+
+        for field, index in self._positions.items():
+            new_positions = {}
+            for offset, row in enumerate(rows):
+                new_positions.setdefault(_normalize(row[field]), []).append(start + offset)
+            for value, positions in new_positions.items():
+                positions = np.asarray(positions, dtype=np.int64)
+                index[value] = np.concatenate([index[value], positions]) if value in index else positions
+
+        if self.range_field:
+            # Merge the new rows into the sorted order (after equal values, as a stable sort would)
+            values = np.asarray([row[self.range_field] for row in rows], dtype=np.float64)
+            order = np.argsort(values, kind='stable')
+            at = np.searchsorted(self._range_values, values[order], side='right')
+            self._range_order = np.insert(self._range_order, at, start + order)
+            self._range_values = np.insert(self._range_values, at, values[order])
+
+        # The version (used for ETags) changes with every ingest without serializing any rows
+        self._ingests += 1
+        key = f'{self._source}:{len(self.rows)}'
+        if self._ingests or not self._source:
+            key += f':{self._token}:{self._ingests}'
+        self.version = hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _fragment(self, position: int) -> bytes:
+        fragment = self._fragments.get(position)
+        if fragment is None:
+            fragment = self._fragments[position] = dumps_bytes(self.rows[position])
+        return fragment
+
+    def _range_positions(self, low: Optional[float], high: Optional[float]) -> np.ndarray:
+        start = 0 if low is None else np.searchsorted(self._range_values, low, side='left')
+        end = len(self._range_values) if high is None else np.searchsorted(self._range_values, high, side='right')
+        return np.sort(self._range_order[start:end])
+
+    def query(self, filters: Dict[str, str], low: Optional[float] = None, high: Optional[float] = None,
+              fields: Optional[List[str]] = None, limit: int = DEFAULT_LIMIT, offset: int = 0,
+              cursor: Optional[str] = None, as_fragments: bool = False) -> Tuple[int, List, Optional[str]]:
+        """
+        Return (matching row count, page of rows, next cursor).
+
+        Args:
+            filters: Query parameter -> value, matched exactly (case-insensitive)
+            low, high: Inclusive bounds on the range field
+            fields: Fields to include in each row (all when None)
+            limit: Page size
+            offset: Rows to skip (ignored when a cursor is given)
+            cursor: Cursor from a previous page's next_cursor
+            as_fragments: Return full rows as cached JSON bytes (ignored with fields)
+        """
+        with self._lock:
+            matched = None
+            for param, value in filters.items():
+                positions = self._positions[self.filters[param]].get(_normalize(value), np.empty(0, dtype=np.int64))
+                matched = positions if matched is None else np.intersect1d(matched, positions, assume_unique=True)
+            if self.range_field and (low is not None or high is not None):
+                positions = self._range_positions(low, high)
+                matched = positions if matched is None else np.intersect1d(matched, positions, assume_unique=True)
+
+            total = len(self.rows) if matched is None else len(matched)
+            if cursor is not None:
+                after = decode_cursor(cursor)
+                start = after + 1 if matched is None else int(np.searchsorted(matched, after, side='right'))
+            else:
+                start = offset
+            page = np.arange(start, min(start + limit, total)) if matched is None else matched[start:start + limit]
+            page = [int(position) for position in page]
+
+            if as_fragments and fields is None:
+                rows = [self._fragment(position) for position in page]
+            else:
+                rows = [self.rows[position] for position in page]
+                if fields is not None:
+                    rows = [{field: row[field] for field in fields} for row in rows]
+            next_cursor = encode_cursor(page[-1]) if page and start + limit < total else None
+            return total, rows, next_cursor
+
+
+def user_listing(users: list = (), source: str = '') -> CatalogueListing:
+    return CatalogueListing(USER_FIELDS, USER_FILTERS, items=users, source=source)
+
+
+def internship_listing(internships: list = (), source: str = '') -> CatalogueListing:
+    return CatalogueListing(INTERNSHIP_FIELDS, INTERNSHIP_FILTERS, range_field='stipend_value', items=internships,
+                            source=source)
@@ -0,0 +1,89 @@
+"""
+Precomputed catalogue statistics for the /stats endpoint
+Distributions are built once with pandas value_counts when the datasets are
+loaded and then updated incrementally as users or internships are ingested, so
+serving /stats never rescans the catalogue.
+"""
+
+import hashlib
+import json
+import threading
+from collections import Counter
+from typing import Dict, Iterable
+
+import pandas as pd
+
+# Snapshot key -> (catalogue, attribute counted)
+DISTRIBUTIONS = {
+    'user_domains': ('users', 'preferred_domain'),
+    'internship_domains': ('internships', 'domain'),
+    'enrollment_distribution': ('users', 'enrollment_status'),
+    'user_locations': ('users', 'preferred_location'),
+    'internship_locations': ('internships', 'location')
+}
+
+
+def _value_counts(items: list, attribute: str) -> Counter:
+    values = pd.Series([getattr(item, attribute) for item in items], dtype=object)
+    return Counter({key: int(count) for key, count in values.value_counts(sort=False).items()})
+
+
+class CatalogueStats:
+    """Domain, enrollment and location distributions of the loaded users and internships."""
+
+    def __init__(self, users: list = (), internships: list = ()):
+        self._lock = threading.Lock()
+        self.rebuild(users, internships)
+
+    def rebuild(self, users: list, internships: list):
+        """Recompute every distribution from scratch (used on load and reload)."""
+        catalogues = {'users': list(users), 'internships': list(internships)}
+        with self._lock:
+            self.totals = {name: len(items) for name, items in catalogues.items()}
+            self.distributions = {key: _value_counts(catalogues[catalogue], attribute)
+                                  for key, (catalogue, attribute) in DISTRIBUTIONS.items()}
+            self._changed()
+
+    def add(self, catalogue: str, items: Iterable):
+        """Fold newly ingested users or internships into the distributions."""
+        items = list(items)
+        if not items:
+            return
+        with self._lock:
+            self.totals[catalogue] += len(items)
+            for key, (name, attribute) in DISTRIBUTIONS.items():
+                if name == catalogue:
+                    self.distributions[key].update(getattr(item, attribute) for item in items)
+            self._changed()
+
+    def _changed(self):
+        self._snapshot = None
+        self._etag = None
+
+    def _current(self):
+        if self._snapshot is None:
+            snapshot = {
+                'total_users': self.totals['users'],
+                'total_internships': self.totals['internships']
+            }
+            for key, counts in self.distributions.items():
+                snapshot[key] = dict(counts)
+            body = json.dumps(snapshot, sort_keys=True, default=str).encode('utf-8')
+            self._snapshot, self._etag = snapshot, hashlib.sha1(body).hexdigest()
+        return self._snapshot, self._etag
+
+    def snapshot(self) -> Dict:
+        """The /stats payload (cached until the next change)."""
+        with self._lock:
+            return self._current()[0]
+
+    @property
+    def etag(self) -> str:
+        """Content hash of the current snapshot."""
+        with self._lock:
+            return self._current()[1]
+
+    def snapshot_with_etag(self):
+        """(snapshot, etag) taken together so they always match."""
+        with self._lock:
+            return self._current()
@@ -0,0 +1,67 @@
+"""
+Lazily built /stats aggregates and /users, /internships listings
+The matcher only loads the catalogue it ranks. The statistics and the listing
+indexes are API concerns, so each is built from the matcher's users and
+internships the first time its endpoint is called and then kept in step with the
+matcher: rows ingested with add_users / add_internships are folded in
+incrementally, and a reload (load_datasets) rebuilds them on the next call.
+"""
+
+import threading
+
+from catalogue_stats import CatalogueStats
+from catalogue_listing import CatalogueListing, user_listing, internship_listing
+
+
+class CatalogueViews:
+    """Stats and listings of one InternshipMatcher's catalogue, built on first use."""
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self._lock = threading.Lock()
+        # View name -> (view, matcher generation, users synced, internships synced)
+        self._views = {}
+
+    def _sync(self, name: str, build, add):
+        """
+        Return the named view, building it or folding in newly ingested rows first.
+
+        Args:
+            name: View name
+            build: (users, internships) -> a new view
+            add: (view, new users, new internships) -> None
+        """
+        matcher = self.matcher
+        with self._lock:
+            # Snapshot the lengths first; rows ingested meanwhile are picked up on the next call
+            generation, users, internships = matcher.generation, len(matcher.users), len(matcher.internships)
+            cached = self._views.get(name)
+            if cached is None or cached[1] != generation:
+                view = build(matcher.users[:users], matcher.internships[:internships])
+            else:
+                view, _, synced_users, synced_internships = cached
+                add(view, matcher.users[synced_users:users], matcher.internships[synced_internships:internships])
+            self._views[name] = (view, generation, users, internships)
+            return view
+
+    def _source(self, catalogue: str) -> str:
+        """Dataset key the matcher loaded a catalogue from ('' when unknown)."""
+        return self.matcher.dataset_keys.get(catalogue, '')
+
+    @property
+    def stats(self) -> CatalogueStats:
+        def add(stats, users, internships):
+            stats.add('users', users)
+            stats.add('internships', internships)
+        return self._sync('stats', CatalogueStats, add)
+
+    @property
+    def user_listing(self) -> CatalogueListing:
+        return self._sync('users', lambda users, internships: user_listing(users, self._source('users')),
+                          lambda listing, users, internships: listing.add(users))
+
+    @property
+    def internship_listing(self) -> CatalogueListing:
+        return self._sync('internships',
+                          lambda users, internships: internship_listing(internships, self._source('internships')),
+                          lambda listing, users, internships: listing.add(internships))
@@ -0,0 +1,110 @@
+"""
+Response compression and ETag helpers for the read endpoints
+Bodies are compressed with brotli (when installed) or gzip according to the
+request's Accept-Encoding. Responses that carry a strong ETag are compressed
+once per encoding and served from a small LRU cache afterwards. Each encoding
+gets its own ETag (`"<etag>-gzip"`), so If-None-Match accepts any variant.
+"""
+
+import gzip
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# brotli is optional; gzip is always available
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+ENCODINGS = ('br', 'gzip') if BROTLI_AVAILABLE else ('gzip',)
+
+# Bodies smaller than this are sent as-is
+MIN_SIZE = 1024
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/plain', 'text/html')
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def choose_encoding(accept_encodings) -> Optional[str]:
+    """Best supported encoding for a werkzeug Accept-Encoding header (None for identity)."""
+    return accept_encodings.best_match(ENCODINGS)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def variant_etag(etag: str, encoding: str) -> str:
+    return f'{etag}-{encoding}'
+
+
+def matching_etag(if_none_match, etag: str) -> Optional[str]:
+    """The ETag or compressed variant named by If-None-Match, or None."""
+    for tag in (etag,) + tuple(variant_etag(etag, encoding) for encoding in ENCODINGS):
+        if if_none_match.contains(tag):
+            return tag
+    return None
+
+
+class CompressedBodyCache:
+    """LRU of compressed bodies keyed by (ETag, encoding)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, str], bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compress(self, etag: str, encoding: str, body: bytes) -> bytes:
+        key = (etag, encoding)
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compressed
+            self.misses += 1
+        compressed = compress(body, encoding)
+        with self._lock:
+            self._entries[key] = compressed
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compressed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+CACHE = CompressedBodyCache()
+
+
+def compress_response(response, accept_encodings):
+    """Compress a Flask response in place when the client accepts it and it is worth it."""
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(accept_encodings)
+    body = response.get_data()
+    if encoding is None or len(body) < MIN_SIZE:
+        return response
+
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        compressed = CACHE.get_or_compress(etag, encoding, body)
+        response.set_etag(variant_etag(etag, encoding))
+    else:
+        compressed = compress(body, encoding)
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    return response
@@ -0,0 +1,108 @@
+"""
+Precomputed user-domain x internship-domain compatibility table
+The rule-based matcher compares a user's preferred domain with internship
+domains by substring containment plus a few related-keyword special cases.
+Both sides have only a handful of distinct values, so every pair is decided once
+(at load time, and for new values on ingest) and stored in a small int8 table;
+user domains that only appear in queries are decided per call and not stored.
+Domain filtering is then a table row lookup followed by a bitmap fetch, and the
+recommendation reasons read their "matches" / "related to" wording from the
+same table.
+"""
+
+import threading
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# Domain keywords that count as related whenever both sides mention them
+RELATED_DOMAIN_KEYWORDS = ('data', 'machine', 'ai')
+
+# Table values
+NO_MATCH = 0
+RELATED = 1       # shares a RELATED_DOMAIN_KEYWORDS keyword
+MATCH = 2         # same domain or one contains the other
+
+
+def match_level(user_domain: str, domain: str) -> int:
+    """Compatibility of two lowercased domains."""
+    if user_domain in domain or domain in user_domain:
+        return MATCH
+    if any(keyword in user_domain and keyword in domain for keyword in RELATED_DOMAIN_KEYWORDS):
+        return RELATED
+    return NO_MATCH
+
+
+class DomainCompatibility:
+    """match_level() for every (user domain, internship domain) pair seen so far."""
+
+    def __init__(self, user_domains: Iterable[str] = (), domains: Iterable[str] = ()):
+        self._lock = threading.Lock()
+        self.rebuild(user_domains, domains)
+
+    def rebuild(self, user_domains: Iterable[str], domains: Iterable[str]):
+        """Recompute the table for these user and internship domains (matched case-insensitively)."""
+        with self._lock:
+            self._user_domains: Dict[str, int] = {}
+            self._domains: Dict[str, int] = {}
+            self._domain_values = np.empty(0, dtype=object)
+            self._table = np.zeros((0, 0), dtype=np.int8)
+            self._add(user_domains, domains)
+
+    def add(self, user_domains: Iterable[str] = (), domains: Iterable[str] = ()):
+        """Extend the table with new user and/or internship domains; known pairs are not recomputed."""
+        with self._lock:
+            self._add(user_domains, domains)
+
+    def _add(self, user_domains: Iterable[str], domains: Iterable[str]):
+        new_users = [value for value in dict.fromkeys(str(value).lower() for value in user_domains)
+                     if value not in self._user_domains]
+        new_domains = [value for value in dict.fromkeys(str(value).lower() for value in domains)
+                       if value not in self._domains]
+        if not new_users and not new_domains:
+            return
+        for value in new_users:
+            self._user_domains[value] = len(self._user_domains)
+        for value in new_domains:
+            self._domains[value] = len(self._domains)
+
+        table = np.zeros((len(self._user_domains), len(self._domains)), dtype=np.int8)
+        rows, columns = self._table.shape
+        table[:rows, :columns] = self._table
+        # Only the new row and column blocks need deciding
+        user_values, values = list(self._user_domains), list(self._domains)
+        for i, user_domain in enumerate(user_values):
+            for j in range(columns if i < rows else 0, len(values)):
+                table[i, j] = match_level(user_domain, values[j])
+        self._table = table
+        self._domain_values = np.array(values, dtype=object)
+
+    def _row(self, user_domain: str):
+        """(table row, internship domain values) for a user domain."""
+        user_domain = str(user_domain).lower()
+        with self._lock:
+            row = self._user_domains.get(user_domain)
+            table, values = self._table, self._domain_values
+        if row is not None:
+            return table[row], values
+        # A domain first seen at query time (e.g. free text from a client) is decided on the fly and not
+        # stored, so arbitrary input cannot grow the table
+        return np.array([match_level(user_domain, value) for value in values], dtype=np.int8), values
+
+    def level(self, user_domain: str, domain: str) -> int:
+        """MATCH, RELATED or NO_MATCH for a user domain and an internship domain."""
+        domain = str(domain).lower()
+        row, _ = self._row(user_domain)
+        column = self._domains.get(domain)
+        if column is None or column >= len(row):
+            return match_level(str(user_domain).lower(), domain)
+        return int(row[column])
+
+    def compatible_domains(self, user_domain: str, minimum: int = RELATED) -> List[str]:
+        """Internship domains (lowercased) whose level for the user domain is at least minimum."""
+        row, values = self._row(user_domain)
+        return values[row >= minimum].tolist()
+
+    @property
+    def shape(self):
+        return self._table.shape
@@ -1,7 +1,64 @@
+import math
 import pandas as pd
 import numpy as np
+import os
+import sys
+import threading
 from typing import List, Dict, Tuple
 
+# Add the ml_models directory to the Python path for the shared helpers
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ml_models'))
+from domain_classifier import SIMPLE_ROLE_DOMAINS
+from reason_engine import validate_explain_level
+from stage_timing import TIMINGS
+from dataset_cache import load_dataset, dataset_key
+from salary_parser import parse_salaries, parse_salary
+from salary_index import SalaryIndex
+from bitmap_index import BitmapIndex, salary_bands
+from rule_pipeline import RulePipeline, Rule, ALL_ROWS, StageCount
+from domain_compatibility import DomainCompatibility, MATCH
+
+# Internship attributes indexed as bitmaps for the rule filters
+BITMAP_FIELDS = ('location', 'domain', 'actively_hiring', 'salary_band')
+
+# Internships materialized per (preferred domain, preferred location) bucket, best paid first
+MATERIALIZED_TOP_K = 50
+
+# Per-internship column arrays available to custom ColumnRules
+RULE_COLUMNS = {
+    'type': lambda internship: internship.type,
+    'duration': lambda internship: internship.duration,
+    'stipend_value': lambda internship: internship.stipend_value,
+    'actively_hiring': lambda internship: internship.actively_hiring
+}
+
+
+def location_rows(user, pipeline: RulePipeline):
+    """The user's preferred location or remote; remote users accept every location."""
+    user_location = user.preferred_location.lower()
+    if user_location == 'remote':
+        return None
+    return pipeline.bitmaps.any_of('location', [user_location, 'remote'])
+
+
+def default_rules(domain_compatibility: DomainCompatibility) -> List[Rule]:
+    """The rule-based matcher's filter stages, in order."""
+    def domain_rows(user, pipeline: RulePipeline):
+        # More flexible domain matching (direct, partial or related), read off the compatibility table
+        return pipeline.bitmaps.any_of('domain', domain_compatibility.compatible_domains(user.preferred_domain))
+    
+    return [
+        # If no matches after domain filter, use all internships
+        Rule('domain_filter', domain_rows, fallback=ALL_ROWS, key=lambda user: user.preferred_domain.lower()),
+        # If no matches after location filter, use domain filtered results
+        Rule('location_filter', location_rows, fallback='domain_filter',
+             key=lambda user: user.preferred_location.lower()),
+        # Less strict duration filtering - include all for now
+        Rule('duration_filter'),
+        # Simplified enrollment rules for real-world dataset; if nothing is left, take the first 20 location matches
+        Rule('enrollment_rules', fallback='location_filter', fallback_limit=20)
+    ]
+
 
 class UserProfile:
     """Represents a user profile with all relevant information for internship matching."""
@@ -43,7 +100,8 @@ class Internship:
     """Represents an internship opportunity."""
     
     def __init__(self, internship_id: int, company: str, role: str, domain: str,
-                 location: str, type_: str, duration: str, stipend: str):
+                 location: str, type_: str, duration: str, stipend: str, actively_hiring: bool = True,
+                 salary_range: Tuple[float, float, float] = None):
         self.internship_id = internship_id
         self.company = company
         self.role = role
@@ -52,33 +110,40 @@ class Internship:
         self.type = type_
         self.duration = duration
         self.stipend = stipend
-        self.stipend_value = self._parse_stipend(stipend)
+        self.actively_hiring = actively_hiring
+        
+        # Salary range in INR/year (None when the stipend has no amount); stipend_value ranks by the midpoint
+        if salary_range is None:
+            salary_range = parse_salary(stipend)
+        self.salary_min, self.salary_max, self.salary_mid = (
+            None if math.isnan(value) else value for value in salary_range
+        )
+        self.stipend_value = self.salary_mid or 0.0
     
-    def _parse_stipend(self, stipend: str) -> int:
-        """Parse stipend string to numerical value for ranking."""
-        if stipend.lower() == 'unpaid':
-            return 0
-        try:
-            # Extract numbers from stipend string (e.g., "20000 INR" -> 20000)
-            import re
-            numbers = re.findall(r'\d+', stipend)
-            if numbers:
-                return int(numbers[0])
-        except:
-            pass
-        return 0
+    @staticmethod
+    def _stipend_of(data: Dict):
+        return data.get('Stipend', data.get('salary', 'Unpaid'))
     
     @classmethod
-    def from_dict(cls, data: Dict):
+    def from_records(cls, records: List[Dict]) -> List['Internship']:
+        """Create Internships from CSV rows, parsing all stipends in one vectorized pass."""
+        stipends = pd.Series([cls._stipend_of(record) for record in records], dtype=object)
+        salary_ranges = parse_salaries(stipends).to_numpy().tolist()
+        return [cls.from_dict(record, salary_range) for record, salary_range in zip(records, salary_ranges)]
+    
+    @classmethod
+    def from_dict(cls, data: Dict, salary_range: Tuple[float, float, float] = None):
         """Create Internship from dictionary (CSV row)."""
         # Handle both original and real-world dataset column names
         internship_id = data.get('InternshipID', data.get('actively_hiring', 0))
         company = data.get('Company', data.get('company_name', ''))
         role = data.get('Role', data.get('Type_of_job', ''))
         location = data.get('Location', data.get('location', ''))
-        stipend = data.get('Stipend', data.get('salary', 'Unpaid'))
+        stipend = cls._stipend_of(data)
         duration = data.get('Duration', data.get('experience', ''))
         type_ = data.get('Type', 'Full-time')  # Default value
+        # Blank actively_hiring cells (NaN in the CSV) count as not hiring
+        actively_hiring = data.get('ActivelyHiring', data.get('actively_hiring', 1)) in (1, True, '1', 'true')
         
         # Extract domain from role if not directly available
         domain = data.get('Domain', cls._extract_domain(role))
@@ -91,23 +156,15 @@ class Internship:
             location=location,
             type_=type_,
             duration=duration,
-            stipend=stipend
+            stipend=stipend,
+            actively_hiring=actively_hiring,
+            salary_range=salary_range
         )
     
     @staticmethod
     def _extract_domain(role):
         """Extract domain from job role."""
-        role_lower = str(role).lower()
-        if 'data' in role_lower or 'analyst' in role_lower:
-            return 'Data Science'
-        elif 'developer' in role_lower or 'engineer' in role_lower:
-            return 'Web Development'
-        elif 'design' in role_lower:
-            return 'Design'
-        elif 'sales' in role_lower or 'business' in role_lower:
-            return 'Business Development'
-        else:
-            return 'General'
+        return SIMPLE_ROLE_DOMAINS.classify(role)
 
 
 class InternshipMatcher:
@@ -120,21 +177,54 @@ class InternshipMatcher:
         self.internships_df = None
         self.users = []
         self.internships = []
+        # Bumped on every (re)load so views built from the catalogue know to rebuild
+        self.generation = 0
+        # Catalogue -> dataset_key() of the file it was loaded from
+        self.dataset_keys: Dict[str, str] = {}
+        self.salary_index = SalaryIndex()
+        self.bitmaps = BitmapIndex(BITMAP_FIELDS)
+        self.columns: Dict[str, np.ndarray] = {}
+        self.domain_compatibility = DomainCompatibility()
+        self.pipeline = RulePipeline(self.bitmaps, self.columns, default_rules(self.domain_compatibility))
+        # Pipeline bucket key -> (a user in the bucket, top positions by stipend, stage counts)
+        self._bucket_tops: Dict[tuple, Tuple[UserProfile, List[int], List[StageCount]]] = {}
+        self._bucket_version = None
+        self._bucket_lock = threading.Lock()
+        self._positions: Dict[int, int] = {}
         self.load_datasets()
     
     def load_datasets(self):
         """Load both user and internship datasets from CSV files."""
         try:
-            self.users_df = pd.read_csv(self.user_dataset_path)
-            self.internships_df = pd.read_csv(self.internship_dataset_path)
+            # Shared, cached frames with NaN values replaced by ''
+            self.users_df = load_dataset(self.user_dataset_path, fill_value='')
+            self.internships_df = load_dataset(self.internship_dataset_path, fill_value='')
+            
+            # Convert to object lists for easier manipulation; categorical columns hand every
+            # row the same string object for a repeated value
+            self.users = [UserProfile.from_dict(record) for record in self.users_df.to_dict('records')]
+            internship_records = self.internships_df.to_dict('records')
             
-            # Handle NaN values
-            self.users_df = self.users_df.fillna('')
-            self.internships_df = self.internships_df.fillna('')
+            # Label domains for the whole catalogue in one pass when the dataset has no Domain column
+            role_col = 'Role' if 'Role' in self.internships_df.columns else 'Type_of_job'
+            if 'Domain' not in self.internships_df.columns and role_col in self.internships_df.columns:
+                domains = SIMPLE_ROLE_DOMAINS.label(self.internships_df[role_col])
+                for record, domain in zip(internship_records, domains):
+                    record['Domain'] = domain
             
-            # Convert to object lists for easier manipulation
-            self.users = [UserProfile.from_dict(row.to_dict()) for _, row in self.users_df.iterrows()]
-            self.internships = [Internship.from_dict(row.to_dict()) for _, row in self.internships_df.iterrows()]
+            self.internships = Internship.from_records(internship_records)
+            self.dataset_keys = {'users': dataset_key(self.user_dataset_path),
+                                 'internships': dataset_key(self.internship_dataset_path)}
+            self.generation += 1
+            self._positions = {id(internship): position for position, internship in enumerate(self.internships)}
+            self.salary_index.rebuild(*self._salary_index_rows(self.internships))
+            self.bitmaps.rebuild(self._bitmap_rows(self.internships))
+            self.columns.update(self._column_rows(self.internships))
+            self.domain_compatibility.rebuild([user.preferred_domain for user in self.users],
+                                              self.bitmaps.values('domain'))
+            self.pipeline.invalidate()
+            self._bucket_tops = {}
+            self._materialize_buckets(self.users)
             
             print(f"Loaded {len(self.users)} user profiles and {len(self.internships)} internships")
             
@@ -142,71 +232,89 @@ class InternshipMatcher:
             print(f"Error loading datasets: {e}")
             raise
     
+    def add_users(self, records: List[Dict]) -> List[UserProfile]:
+        """Ingest new user rows (same columns as the CSV) and update the indexes."""
+        users = [UserProfile.from_dict(record) for record in records]
+        self.users.extend(users)
+        self.domain_compatibility.add(user_domains=[user.preferred_domain for user in users])
+        self._materialize_buckets(users)
+        return users
+    
+    def add_internships(self, records: List[Dict]) -> List[Internship]:
+        """Ingest new internship rows (same columns as the CSV) and update the indexes."""
+        internships = Internship.from_records(records)
+        for position, internship in enumerate(internships, start=len(self.internships)):
+            self._positions[id(internship)] = position
+        self.internships.extend(internships)
+        self.salary_index.add(*self._salary_index_rows(internships))
+        self.bitmaps.add(self._bitmap_rows(internships))
+        for name, values in self._column_rows(internships).items():
+            self.columns[name] = np.concatenate([self.columns[name], values])
+        self.domain_compatibility.add(domains=[internship.domain for internship in internships])
+        self.pipeline.invalidate()
+        self._materialize_buckets(refresh=True)
+        return internships
+    
+    @staticmethod
+    def _salary_index_rows(internships: List[Internship]):
+        """Salaries and bucket keys (location, domain) for the salary index."""
+        salaries = [internship.stipend_value for internship in internships]
+        keys = {'location': [internship.location for internship in internships],
+                'domain': [internship.domain for internship in internships]}
+        return salaries, keys
+    
+    @staticmethod
+    def _bitmap_rows(internships: List[Internship]):
+        """Attribute values per internship for the bitmap index."""
+        return {'location': [internship.location for internship in internships],
+                'domain': [internship.domain for internship in internships],
+                'actively_hiring': [internship.actively_hiring for internship in internships],
+                'salary_band': salary_bands([internship.stipend_value for internship in internships])}
+    
+    @staticmethod
+    def _column_rows(internships: List[Internship]) -> Dict[str, np.ndarray]:
+        """RULE_COLUMNS arrays for the given internships."""
+        return {name: np.asarray([getter(internship) for internship in internships])
+                for name, getter in RULE_COLUMNS.items()}
+    
+    def _restrict(self, internships: List[Internship], stage: str, user: UserProfile) -> List[Internship]:
+        """The internships of a list accepted by one pipeline stage on its own (list order kept)."""
+        mask = self.bitmaps.mask(self.pipeline.stage_rows(stage, user))
+        return [internship for internship in internships if mask[self._positions[id(internship)]]]
+    
     def apply_domain_filter(self, user: UserProfile, internships: List[Internship]) -> List[Internship]:
         """Filter internships by domain match."""
-        # More flexible domain matching
-        user_domain = user.preferred_domain.lower()
-        filtered = []
-        for internship in internships:
-            internship_domain = internship.domain.lower()
-            # Direct match
-            if user_domain == internship_domain:
-                filtered.append(internship)
-            # Partial match
-            elif user_domain in internship_domain or internship_domain in user_domain:
-                filtered.append(internship)
-            # Special cases for data science
-            elif ('data' in user_domain and 'data' in internship_domain) or \
-                 ('machine' in user_domain and 'machine' in internship_domain) or \
-                 ('ai' in user_domain and 'ai' in internship_domain):
-                filtered.append(internship)
-        return filtered
+        return self._restrict(internships, 'domain_filter', user)
     
     def apply_location_filter(self, user: UserProfile, internships: List[Internship]) -> List[Internship]:
         """Filter internships by location match or remote availability."""
-        filtered = []
-        user_location = user.preferred_location.lower()
-        for internship in internships:
-            internship_location = internship.location.lower()
-            # Direct location match
-            if internship_location == user_location:
-                filtered.append(internship)
-            # Allow Remote for any location
-            elif internship_location == 'remote':
-                filtered.append(internship)
-            # If user prefers remote, include remote internships
-            elif user_location == 'remote' and internship_location == 'remote':
-                filtered.append(internship)
-            # Include all locations for remote users (more flexible)
-            elif user_location == 'remote':
-                filtered.append(internship)
-        
-        return filtered
+        return self._restrict(internships, 'location_filter', user)
     
     def apply_duration_filter(self, user: UserProfile, internships: List[Internship]) -> List[Internship]:
         """Filter internships by duration match."""
-        # Less strict duration filtering - include all for now
-        return internships
+        return self._restrict(internships, 'duration_filter', user)
     
     def apply_enrollment_rules(self, user: UserProfile, internships: List[Internship]) -> List[Internship]:
         """Apply enrollment-based filtering rules."""
-        # Simplified enrollment rules for real-world dataset
-        return internships
+        return self._restrict(internships, 'enrollment_rules', user)
     
     def rank_by_stipend(self, internships: List[Internship]) -> List[Internship]:
         """Rank internships by stipend (highest first)."""
         return sorted(internships, key=lambda x: x.stipend_value, reverse=True)
     
-    def generate_recommendation_reason(self, user: UserProfile, internship: Internship) -> str:
-        """Generate explanation for why this internship is recommended."""
+    def generate_recommendation_reason(self, user: UserProfile, internship: Internship, detail: str = 'full') -> str:
+        """Generate explanation for why this internship is recommended ('short' keeps the domain clause only)."""
         reasons = []
         
         # Domain match
-        if user.preferred_domain.lower() in internship.domain.lower() or internship.domain.lower() in user.preferred_domain.lower():
+        if self.domain_compatibility.level(user.preferred_domain, internship.domain) == MATCH:
             reasons.append(f"matches your preferred domain in {user.preferred_domain}")
         else:
             reasons.append(f"related to your skills in {user.preferred_domain}")
         
+        if detail == 'short':
+            return f"This internship {reasons[0]}."
+        
         # Enrollment rule explanation
         if user.enrollment_status.lower() == 'full-time':
             reasons.append(f"offers a {internship.type} role since you are currently {user.enrollment_status}")
@@ -232,8 +340,52 @@ class InternshipMatcher:
         
         return f"This internship {', '.join(reasons)}."
     
-    def get_top_recommendations(self, user_id: int, top_k: int = 3) -> List[Dict]:
-        """Get top K internship recommendations for a specific user."""
+    def _rank_rows(self, user: UserProfile, k: int, min_salary: float = None, clock=None):
+        """(Top k row positions by stipend, stage counts) from a full pipeline run."""
+        result = self.pipeline.run(user, clock)
+        if not self.bitmaps.count(result.rows):
+            return [], result.counts
+        return self.salary_index.top(k, min_salary=min_salary, allowed=self.bitmaps.mask(result.rows)), result.counts
+    
+    def _materialize_buckets(self, users: List[UserProfile] = (), refresh: bool = False):
+        """
+        Store the top MATERIALIZED_TOP_K internships for the pipeline buckets of these users.
+        
+        refresh re-ranks every stored bucket (after ingest); buckets are dropped when the rules change.
+        """
+        with self._bucket_lock:
+            tops = self._bucket_tops if self._bucket_version == self.pipeline.version else {}
+            self._bucket_version = self.pipeline.version
+            if refresh:
+                users = [user for user, _, _ in tops.values()] + list(users)
+                tops = {}
+            tops = dict(tops)
+            for user in users:
+                key = self.pipeline.bucket_key(user)
+                if key is not None and key not in tops:
+                    tops[key] = (user, *self._rank_rows(user, MATERIALIZED_TOP_K))
+            self._bucket_tops = tops
+    
+    def _bucket_top(self, user: UserProfile):
+        """Materialized (top positions, stage counts) for the user's bucket, or None if the rules have no bucket key."""
+        key = self.pipeline.bucket_key(user)
+        if key is None:
+            return None
+        entry = self._bucket_tops.get(key) if self._bucket_version == self.pipeline.version else None
+        if entry is None:
+            self._materialize_buckets([user])
+            entry = self._bucket_tops.get(key)
+        return (entry[1], entry[2]) if entry is not None else None
+    
+    def get_top_recommendations(self, user_id: int, top_k: int = 3, explain: str = 'full',
+                                min_salary: float = None) -> List[Dict]:
+        """
+        Get top K internship recommendations for a specific user (explain: 'none', 'short' or 'full').
+        
+        Recommendations are ranked by stipend; min_salary (INR/year) drops internships paying less.
+        """
+        explain = validate_explain_level(explain)
+        
         # Find user
         user = None
         for u in self.users:
@@ -244,45 +396,25 @@ class InternshipMatcher:
         if not user:
             raise ValueError(f"User with ID {user_id} not found")
         
-        # Apply all filters step by step
-        filtered_internships = self.internships.copy()
-        
-        # 1. Domain filter (more flexible)
-        domain_filtered = self.apply_domain_filter(user, filtered_internships)
-        print(f"After domain filter: {len(domain_filtered)} internships")
-        
-        # If no matches after domain filter, use all internships (fallback)
-        if len(domain_filtered) == 0:
-            domain_filtered = filtered_internships
-        
-        # 2. Location filter (more flexible)
-        location_filtered = self.apply_location_filter(user, domain_filtered)
-        print(f"After location filter: {len(location_filtered)} internships")
-        
-        # If no matches after location filter, use domain filtered results
-        if len(location_filtered) == 0:
-            location_filtered = domain_filtered
-        
-        # 3. Duration filter (less strict)
-        duration_filtered = self.apply_duration_filter(user, location_filtered)
-        print(f"After duration filter: {len(duration_filtered)} internships")
-        
-        # 4. Enrollment rules (less strict)
-        enrollment_filtered = self.apply_enrollment_rules(user, duration_filtered)
-        print(f"After enrollment rules: {len(enrollment_filtered)} internships")
-        
-        # If no matches after all filters, use some internships (fallback)
-        if len(enrollment_filtered) == 0:
-            enrollment_filtered = location_filtered[:20]  # Take first 20 as fallback
-        
-        if not enrollment_filtered:
-            return []
-        
-        # 5. Rank by stipend
-        ranked_internships = self.rank_by_stipend(enrollment_filtered)
-        
-        # 6. Get top K
-        top_internships = ranked_internships[:top_k]
+        clock = TIMINGS.clock('rule_based')
+        bucket_top = self._bucket_top(user) if top_k <= MATERIALIZED_TOP_K else None
+        if bucket_top is not None:
+            # 1-6. Every user with this preferred domain and location gets the same list: look it up
+            top_positions, counts = bucket_top
+            if min_salary is not None:
+                # The list is best paid first, so the internships paying enough are a prefix of it
+                top_positions = [position for position in top_positions
+                                 if self.internships[position].stipend_value >= min_salary]
+            top_positions = top_positions[:top_k]
+            clock.lap('bucket_lookup')
+        else:
+            # 1-4. Domain, location, duration and enrollment stages of the rule pipeline (with their fallbacks)
+            # 5-6. Top K by stipend, read off the salary index instead of sorting the filtered rows
+            top_positions, counts = self._rank_rows(user, top_k, min_salary, clock)
+            clock.lap('rank')
+        for stage, count, _ in counts:
+            print(f"After {stage.replace('_', ' ')}: {count} internships")
+        top_internships = [self.internships[position] for position in top_positions]
         
         # 7. Generate recommendations with reasons
         recommendations = []
@@ -295,10 +427,12 @@ class InternshipMatcher:
                 'location': internship.location,
                 'type': internship.type,
                 'duration': internship.duration,
-                'stipend': internship.stipend,
-                'reason': self.generate_recommendation_reason(user, internship)
+                'stipend': internship.stipend
             }
+            if explain != 'none':
+                recommendation['reason'] = self.generate_recommendation_reason(user, internship, explain)
             recommendations.append(recommendation)
+        clock.lap('format')
         
         return recommendations
     
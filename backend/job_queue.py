@@ -0,0 +1,212 @@
+"""
+In-process job queue backed by a pool of worker threads
+Used by the API server to process uploaded resumes without holding Flask request threads.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional
+import queue
+import threading
+import time
+import traceback
+import uuid
+
+
+class QueueFullError(Exception):
+    """Raised when a job does not fit in the queue right now (backpressure; retrying later can succeed)."""
+
+
+class JobTooLargeError(ValueError):
+    """Raised when a job has more items than the queue can ever hold (retrying cannot succeed)."""
+
+
+class Job:
+    """A batch of items processed by the queue, with results collected as they complete."""
+
+    def __init__(self, items: List):
+        self.job_id = uuid.uuid4().hex
+        self.total = len(items)
+        self.results = []
+        self.failed = 0
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._condition = threading.Condition()
+
+    @property
+    def status(self) -> str:
+        if self.finished_at is not None:
+            return 'done'
+        if self.started_at is not None:
+            return 'running'
+        return 'queued'
+
+    def _start(self):
+        """Mark the job running when a worker picks up its first item."""
+        with self._condition:
+            if self.started_at is None:
+                self.started_at = time.time()
+
+    def _add_result(self, result: Dict, failed: bool):
+        with self._condition:
+            self.results.append(result)
+            if failed:
+                self.failed += 1
+            if len(self.results) == self.total:
+                self.finished_at = time.time()
+            self._condition.notify_all()
+
+    def iter_results(self, timeout: float = 30.0) -> Iterator[Dict]:
+        """Yield results as they arrive until the job is done or no result arrives within timeout."""
+        sent = 0
+        while True:
+            with self._condition:
+                if sent == len(self.results) and self.finished_at is None:
+                    self._condition.wait(timeout)
+                pending = self.results[sent:]
+                done = self.finished_at is not None
+            if not pending and not done:
+                return
+            for result in pending:
+                yield result
+            sent += len(pending)
+            if done and sent == self.total:
+                return
+
+    def to_dict(self, include_results: bool = True) -> Dict:
+        """Summarize the job for API responses."""
+        with self._condition:
+            data = {
+                'job_id': self.job_id,
+                'status': self.status,
+                'total': self.total,
+                'completed': len(self.results),
+                'failed': self.failed,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at
+            }
+            if include_results:
+                data['results'] = list(self.results)
+        return data
+
+
+class JobQueue:
+    """Bounded FIFO of work items processed by background worker threads."""
+
+    def __init__(self, handler: Callable, workers: int = 4, max_queue_size: int = 200,
+                 max_finished_jobs: int = 1000):
+        """
+        Initialize the job queue and start its workers.
+
+        Args:
+            handler: Function called with each item; its return value is the item's result
+            workers: Number of worker threads
+            max_queue_size: Maximum number of items waiting to be processed
+            max_finished_jobs: Number of finished jobs kept for polling
+        """
+        self.handler = handler
+        self.max_queue_size = max_queue_size
+        self.max_finished_jobs = max_finished_jobs
+        self._queue = queue.Queue()
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._active_workers = 0
+        self._stopped = False
+        self.jobs_submitted = 0
+        self.jobs_rejected = 0
+        self.items_processed = 0
+        self.items_failed = 0
+
+        self._workers = []
+        for i in range(workers):
+            worker = threading.Thread(target=self._worker_loop, name=f'job-queue-worker-{i}', daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, items: List) -> Job:
+        """
+        Queue a job for all items.
+
+        Raises JobTooLargeError if the job has more items than max_queue_size (it could never
+        fit), and QueueFullError if it does not fit behind the items currently waiting.
+        """
+        if not items:
+            raise ValueError('A job needs at least one item')
+        if len(items) > self.max_queue_size:
+            raise JobTooLargeError(f'A job can have at most {self.max_queue_size} items ({len(items)} given)')
+
+        job = Job(items)
+        with self._lock:
+            if self._stopped:
+                raise QueueFullError('Job queue is shut down')
+            if self._queue.qsize() + len(items) > self.max_queue_size:
+                self.jobs_rejected += 1
+                raise QueueFullError(
+                    f'Job queue is full ({self._queue.qsize()} of {self.max_queue_size} items waiting)')
+            self._jobs[job.job_id] = job
+            self._evict_finished_jobs()
+            self.jobs_submitted += 1
+            for item in items:
+                self._queue.put((job, item))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if unknown or evicted."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def metrics(self) -> Dict:
+        """Queue depth and throughput counters."""
+        with self._lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue_size': self.max_queue_size,
+                'workers': len(self._workers),
+                'active_workers': self._active_workers,
+                'jobs_tracked': len(self._jobs),
+                'jobs_submitted': self.jobs_submitted,
+                'jobs_rejected': self.jobs_rejected,
+                'items_processed': self.items_processed,
+                'items_failed': self.items_failed
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs and let the workers exit once the queue drains."""
+        with self._lock:
+            self._stopped = True
+        for _ in self._workers:
+            self._queue.put(None)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _evict_finished_jobs(self):
+        """Drop the oldest finished jobs beyond max_finished_jobs. Caller holds the lock."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def _worker_loop(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            job, item = entry
+            job._start()
+            with self._lock:
+                self._active_workers += 1
+            failed = False
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                traceback.print_exc()
+                failed = True
+                result = {'error': str(e)}
+            finally:
+                with self._lock:
+                    self._active_workers -= 1
+                    self.items_processed += 1
+                    if failed:
+                        self.items_failed += 1
+            job._add_result(result, failed)
@@ -0,0 +1,72 @@
+"""
+Fast JSON serialization for the API
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths serialize NumPy and pandas scalars/arrays natively, so the
+ML endpoints can return values straight from DataFrames. Static catalogue rows
+can be serialized once and spliced into responses as cached fragments.
+"""
+
+import datetime
+import json
+from typing import Any, Dict, List
+
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+# orjson is optional; without it responses are encoded with the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Coerce NumPy/pandas values, then defer to Flask's extra types (dates, UUIDs, dataclasses)."""
+    if type(obj).__name__ in ('NAType', 'NaTType'):
+        return None
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray) or (hasattr(obj, 'tolist') and not isinstance(obj, datetime.date)):
+        # Arrays, pandas Series/Index and other array-likes
+        return obj.tolist()
+    return DefaultJSONProvider.default(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON with sorted keys (the API's response encoding)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=_default, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson when available."""
+
+    default = staticmethod(_default)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if ORJSON_AVAILABLE and not kwargs:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if not ORJSON_AVAILABLE or self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
+
+    def fragment_response(self, envelope: Dict, key: str, fragments: List[bytes]):
+        """
+        Respond with `envelope` plus `key` holding a list of pre-serialized JSON fragments.
+
+        The fragments are joined as-is, so serializing the rows is skipped entirely.
+        """
+        head = dumps_bytes(envelope)[:-1]
+        separator = b',' if len(head) > 1 else b''
+        body = b''.join([head, separator, dumps_bytes(key), b':[', b','.join(fragments), b']}\n'])
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,155 @@
+"""
+Minimal Prometheus text-format metrics (exposition format 0.0.4) with no external dependencies
+
+Counters and histograms are updated as requests are handled; values that already
+live elsewhere (catalogue sizes, queue depths, cache counters) are read at scrape
+time by collector functions registered on the registry.
+"""
+
+import os
+import sys
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Add the ml_models directory to the Python path for the shared helpers
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ml_models'))
+from stage_timing import Histogram, DEFAULT_BUCKETS
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# (sample name suffix, labels, value)
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_sample(name: str, labels: Dict[str, str], value) -> str:
+    if labels:
+        label_text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+        return f'{name}{{{label_text}}} {_format_value(value)}'
+    return f'{name} {_format_value(value)}'
+
+
+def histogram_samples(histogram: Histogram, labels: Dict[str, str]) -> List[Sample]:
+    """Bucket, sum and count samples for a stage_timing Histogram."""
+    samples = []
+    for bound, count in histogram.cumulative_counts():
+        samples.append(('_bucket', dict(labels, le='+Inf' if bound == float('inf') else f'{bound:g}'), count))
+    samples.append(('_sum', labels, histogram.sum))
+    samples.append(('_count', labels, histogram.count))
+    return samples
+
+
+class MetricFamily:
+    """A named metric with HELP/TYPE metadata and its samples."""
+
+    def __init__(self, name: str, documentation: str, metric_type: str = 'gauge', samples: Iterable[Sample] = ()):
+        self.name = name
+        self.type = metric_type
+        self.documentation = documentation
+        self.samples = list(samples)
+
+    def add(self, value, suffix: str = '', **labels):
+        self.samples.append((suffix, labels, value))
+        return self
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type}']
+        lines.extend(_format_sample(self.name + suffix, labels, value) for suffix, labels, value in self.samples)
+        return '\n'.join(lines)
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            values = sorted(self._values.items())
+        return MetricFamily(self.name, self.documentation, 'counter',
+                            [('', dict(zip(self.labelnames, key)), value) for key, value in values])
+
+
+class LabeledHistogram:
+    """Histogram family with one stage_timing Histogram per label combination."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self.buckets))
+        histogram.observe(seconds)
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            items = sorted(self._histograms.items())
+        family = MetricFamily(self.name, self.documentation, 'histogram')
+        for key, histogram in items:
+            family.samples.extend(histogram_samples(histogram, dict(zip(self.labelnames, key))))
+        return family
+
+
+class Registry:
+    """Holds metrics and scrape-time collectors and renders them in text format."""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> LabeledHistogram:
+        metric = LabeledHistogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]):
+        """Register a function returning MetricFamily objects computed at scrape time."""
+        self._collectors.append(collector)
+        return collector
+
+    def render(self) -> str:
+        families = [metric.collect() for metric in self._metrics]
+        for collector in self._collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                print(f"⚠️ Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+        return '\n'.join(family.render() for family in families) + '\n'
@@ -0,0 +1,322 @@
+"""
+Bulk resume ingestion pipeline
+Extracts text from resume PDFs in a process pool, parses skills, education and
+location into matcher-ready profiles and streams them into batch scoring with
+MLInternshipMatcher.
+
+PDF text extraction needs pypdf (or the older PyPDF2) to be installed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import argparse
+import glob
+import io
+import json
+import os
+import re
+import sys
+
+# Add the ml_models directory to the Python path for the shared helpers
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ml_models'))
+from domain_classifier import SKILL_DOMAINS
+
+# PDF text extraction is optional so the parsers can be used on plain text
+try:
+    from pypdf import PdfReader
+    PDF_SUPPORT_AVAILABLE = True
+except ImportError:
+    try:
+        from PyPDF2 import PdfReader
+        PDF_SUPPORT_AVAILABLE = True
+    except ImportError:
+        PdfReader = None
+        PDF_SUPPORT_AVAILABLE = False
+
+# Skill dictionary (same keywords as the browser extractor in frontend/js/ai.js)
+SKILL_KEYWORDS = [
+    'python', 'java', 'javascript', 'html', 'css', 'sql', 'c++', 'c#', 'php', 'ruby', 'swift', 'kotlin',
+    'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
+    'mysql', 'postgresql', 'mongodb', 'redis', 'firebase',
+    'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp',
+    'machine learning', 'data science', 'artificial intelligence', 'deep learning', 'neural networks',
+    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
+    'ui/ux', 'figma', 'adobe xd', 'sketch', 'photoshop', 'illustrator',
+    'excel', 'tableau', 'power bi', 'data analysis', 'statistics',
+    'communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking',
+    'content writing', 'copywriting', 'seo', 'digital marketing', 'sales', 'marketing',
+    'accounting', 'financial analysis', 'recruitment', 'manual testing', 'automation testing'
+]
+
+# Education keywords mapped to display values (bare 'be'/'me'/'ma' are left out as they are common words)
+EDUCATION_MAP = {
+    # Bachelor's degrees
+    'bca': 'BCA',
+    'bba': 'BBA',
+    'bcom': 'B.Com',
+    'b.com': 'B.Com',
+    'b.sc': 'B.Sc',
+    'bachelor of science': 'B.Sc',
+    'bachelor of commerce': 'B.Com',
+    'bachelor of arts': 'BA',
+    'ba': 'BA',
+    'btech': 'B.Tech',
+    'b.tech': 'B.Tech',
+    'b.e': 'B.E',
+    'bachelor of engineering': 'B.E',
+    'bachelor of technology': 'B.Tech',
+    'bachelor': 'Bachelor',
+    'b.pharma': 'B.Pharma',
+    'bachelor of pharmacy': 'B.Pharma',
+    'b.des': 'B.Des',
+
+    # Master's degrees
+    'mca': 'MCA',
+    'mba': 'MBA',
+    'mcom': 'M.Com',
+    'm.com': 'M.Com',
+    'm.sc': 'M.Sc',
+    'master of science': 'M.Sc',
+    'master of commerce': 'M.Com',
+    'master of arts': 'MA',
+    'mtech': 'M.Tech',
+    'm.tech': 'M.Tech',
+    'm.e': 'M.E',
+    'master of engineering': 'M.E',
+    'master of technology': 'M.Tech',
+    'master': 'Master',
+
+    # Other qualifications
+    'diploma': 'Diploma',
+    'iti': 'ITI',
+    'class 10': 'Class 10',
+    'class x': 'Class 10',
+    '10th': 'Class 10',
+    'secondary': 'Class 10',
+    'class 12': 'Class 12',
+    'class xii': 'Class 12',
+    '12th': 'Class 12',
+    'higher secondary': 'Class 12'
+}
+
+EDUCATION_HIERARCHY = {
+    'Class 10': 1,
+    'Class 12': 2,
+    'ITI': 3,
+    'Diploma': 4,
+    'Bachelor': 5, 'BCA': 5, 'BBA': 5, 'B.Com': 5, 'B.Sc': 5, 'BA': 5,
+    'B.E': 5, 'B.Tech': 5, 'B.Pharma': 5, 'B.Des': 5,
+    'Master': 6, 'MCA': 6, 'MBA': 6, 'M.Com': 6, 'M.Sc': 6, 'MA': 6, 'M.E': 6, 'M.Tech': 6
+}
+
+# Location aliases mapped to the spelling used in the jobs dataset
+LOCATION_ALIASES = {
+    'bangalore': 'Bangalore', 'bengaluru': 'Bangalore',
+    'mumbai': 'Mumbai', 'bombay': 'Mumbai',
+    'new delhi': 'Delhi', 'delhi': 'Delhi',
+    'gurgaon': 'Gurgaon', 'gurugram': 'Gurgaon',
+    'noida': 'Noida',
+    'pune': 'Pune',
+    'chennai': 'Chennai', 'madras': 'Chennai',
+    'hyderabad': 'Hyderabad',
+    'kolkata': 'Kolkata', 'calcutta': 'Kolkata',
+    'ahmedabad': 'Ahmedabad',
+    'jaipur': 'Jaipur',
+    'chandigarh': 'Chandigarh',
+    'indore': 'Indore',
+    'lucknow': 'Lucknow',
+    'remote': 'Remote', 'work from home': 'Remote'
+}
+
+def _keyword_pattern(keywords: Iterable[str], flags=re.IGNORECASE) -> re.Pattern:
+    """Compile keywords into one alternation, longest first, bounded by non-word characters."""
+    alternatives = sorted(set(keywords), key=len, reverse=True)
+    body = '|'.join(re.escape(k).replace(r'\ ', r'\s+') for k in alternatives)
+    return re.compile(rf'(?<![\w+#.])({body})(?![\w+#])', flags)
+
+
+SKILL_PATTERN = _keyword_pattern(SKILL_KEYWORDS)
+EDUCATION_PATTERN = _keyword_pattern(EDUCATION_MAP)
+LOCATION_PATTERN = _keyword_pattern(LOCATION_ALIASES)
+NAME_LABEL_PATTERN = re.compile(r'name\s*[:\-]\s*([A-Za-z][A-Za-z .\'\-]{1,49})', re.IGNORECASE)
+NAME_LINE_PATTERN = re.compile(r'^[ \t]*([A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+){1,3})[ \t]*$', re.MULTILINE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+SKILL_ORDER = {skill: i for i, skill in enumerate(SKILL_KEYWORDS)}
+
+
+def _format_skill(skill: str) -> str:
+    """Capitalize a skill keyword for display (e.g. 'machine learning' -> 'Machine Learning')."""
+    return ' '.join(word[:1].upper() + word[1:] for word in skill.split(' '))
+
+
+def extract_text_from_pdf(pdf_source) -> str:
+    """Extract text from all pages of a PDF given a path or raw bytes."""
+    if not PDF_SUPPORT_AVAILABLE:
+        raise RuntimeError("PDF support not available. Please install pypdf.")
+
+    if isinstance(pdf_source, (bytes, bytearray)):
+        pdf_source = io.BytesIO(pdf_source)
+    reader = PdfReader(pdf_source)
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def extract_skills(text: str) -> List[str]:
+    """Find dictionary skills in the text, in dictionary order."""
+    found = {WHITESPACE_PATTERN.sub(' ', m.lower()) for m in SKILL_PATTERN.findall(text)}
+    return [_format_skill(skill) for skill in sorted(found, key=SKILL_ORDER.get)]
+
+
+def extract_education(text: str) -> str:
+    """Return the highest education level mentioned in the text."""
+    best = ''
+    for keyword in EDUCATION_PATTERN.findall(text):
+        value = EDUCATION_MAP[WHITESPACE_PATTERN.sub(' ', keyword.lower())]
+        if EDUCATION_HIERARCHY.get(value, 0) > EDUCATION_HIERARCHY.get(best, 0):
+            best = value
+    return best
+
+
+def extract_location(text: str) -> str:
+    """Return the first known location mentioned in the text."""
+    match = LOCATION_PATTERN.search(text)
+    if not match:
+        return ''
+    return LOCATION_ALIASES[WHITESPACE_PATTERN.sub(' ', match.group(1).lower())]
+
+
+def extract_name(text: str) -> str:
+    """Return the candidate name from a 'Name:' label or a capitalized line near the top."""
+    match = NAME_LABEL_PATTERN.search(text)
+    if match:
+        return match.group(1).strip()
+    match = NAME_LINE_PATTERN.search(text[:500])
+    return match.group(1) if match else ''
+
+
+def infer_domain(skills: List[str]) -> str:
+    """Infer a preferred domain from the extracted skills."""
+    return SKILL_DOMAINS.classify(', '.join(skills))
+
+
+def parse_resume_text(text: str, source: str = '') -> Dict:
+    """Turn resume text into a profile accepted by MLInternshipMatcher.get_recommendations_for_profile."""
+    skills = extract_skills(text)
+    return {
+        'source': source,
+        'name': extract_name(text),
+        'skills': ', '.join(skills),
+        'education': extract_education(text),
+        'preferred_domain': infer_domain(skills),
+        'preferred_location': extract_location(text),
+        'internship_duration': '',
+        'enrollment_status': ''
+    }
+
+
+def parse_resume(path: str) -> Dict:
+    """Extract and parse a single resume PDF. Runs inside pool workers."""
+    try:
+        return parse_resume_text(extract_text_from_pdf(path), source=path)
+    except Exception as e:
+        return {'source': path, 'error': str(e)}
+
+
+def iter_profiles(paths: Iterable[str], workers: Optional[int] = None, chunksize: int = 8) -> Iterator[Dict]:
+    """
+    Parse resume PDFs in a process pool, yielding profiles in input order.
+
+    Args:
+        paths: Resume PDF paths
+        workers: Number of worker processes (defaults to the CPU count)
+        chunksize: Number of files handed to a worker at a time
+    """
+    if workers == 1:
+        for path in paths:
+            yield parse_resume(path)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for profile in executor.map(parse_resume, paths, chunksize=chunksize):
+            yield profile
+
+
+def score_profiles(profiles: Iterable[Dict], ml_matcher, top_k: int = 5,
+                   batch_size: int = 64) -> Iterator[Tuple[Dict, List[Dict]]]:
+    """
+    Stream profiles into MLInternshipMatcher batch scoring.
+
+    Yields (profile, recommendations) pairs in input order as each batch completes.
+    Profiles that failed to parse stay in their place in the batch and get an empty
+    recommendation list.
+    """
+    batch = []
+    scorable = 0
+    for profile in profiles:
+        batch.append(profile)
+        if 'error' not in profile:
+            scorable += 1
+        if scorable >= batch_size:
+            yield from _score_batch(batch, ml_matcher, top_k, batch_size)
+            batch = []
+            scorable = 0
+
+    if batch:
+        yield from _score_batch(batch, ml_matcher, top_k, batch_size)
+
+
+def _score_batch(batch: List[Dict], ml_matcher, top_k: int, batch_size: int) -> Iterator[Tuple[Dict, List[Dict]]]:
+    """Score the parsed profiles of a batch and pair every profile with its result, in order."""
+    parsed = [profile for profile in batch if 'error' not in profile]
+    scored = iter(ml_matcher.get_recommendations_for_profiles(parsed, top_k, batch_size) if parsed else [])
+    for profile in batch:
+        yield profile, ([] if 'error' in profile else next(scored))
+
+
+def ingest_resumes(paths: Iterable[str], ml_matcher, top_k: int = 5, workers: Optional[int] = None,
+                   batch_size: int = 64) -> Iterator[Tuple[Dict, List[Dict]]]:
+    """Parse resume PDFs in parallel and score them as they arrive."""
+    return score_profiles(iter_profiles(paths, workers), ml_matcher, top_k, batch_size)
+
+
+def main():
+    """Ingest resumes from the command line and write one JSON line per resume."""
+    parser = argparse.ArgumentParser(description='Bulk resume ingestion and recommendation')
+    parser.add_argument('inputs', nargs='+', help='Resume PDF files or directories')
+    parser.add_argument('--output', default='-', help='Output JSON lines file (default: stdout)')
+    parser.add_argument('--top-k', type=int, default=5, help='Recommendations per resume')
+    parser.add_argument('--workers', type=int, default=None, help='Parser processes')
+    parser.add_argument('--batch-size', type=int, default=64, help='Profiles per scoring batch')
+    args = parser.parse_args()
+
+    paths = []
+    for item in args.inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(glob.glob(os.path.join(item, '**', '*.pdf'), recursive=True)))
+        else:
+            paths.append(item)
+
+    # Get the root directory (parent of backend directory)
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.append(os.path.join(root_dir, 'ml_models'))
+    from ml_internship_matcher import MLInternshipMatcher
+
+    ml_matcher = MLInternshipMatcher(
+        user_dataset_path=os.path.join(root_dir, 'dataset', 'Candidates_cleaned.csv'),
+        internship_dataset_path=os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'),
+        model_path=os.path.join(root_dir, 'ml_models', 'internship_matcher_model.joblib')
+    )
+    if not ml_matcher.model:
+        ml_matcher.train_model()
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for profile, recommendations in ingest_resumes(paths, ml_matcher, args.top_k, args.workers, args.batch_size):
+            output.write(json.dumps({'profile': profile, 'recommendations': recommendations}, default=str) + '\n')
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
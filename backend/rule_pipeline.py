@@ -0,0 +1,235 @@
+"""
+Declarative rule pipeline for the rule-based matcher
+A pipeline is an ordered list of rules. Each rule compiles into a vectorized
+predicate over the catalogue - value bitmaps from the BitmapIndex OR-ed
+together, or a boolean mask over a column array - and each stage ANDs the rows
+it accepts into the surviving set. Every stage's result is kept, so a fallback
+("the domain stage's rows", "the first 20 rows of the location stage") is a
+lookup rather than a re-run, and the surviving count per stage comes back with
+the result.
+
+Custom rules are added with RulePipeline.add(): a Rule with any predicate
+(user, pipeline) -> bitmap / boolean mask / None (no restriction), a ValueRule
+deciding per distinct attribute value, or a ColumnRule over a column array.
+A rule's key names what about the user its result depends on; when every rule
+has one, users with the same bucket_key() get the same rows.
+"""
+
+import os
+import sys
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Add the ml_models directory to the Python path for the shared helpers
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ml_models'))
+from bitmap_index import BitmapIndex
+
+# Fallback target meaning every row of the catalogue
+ALL_ROWS = 'all'
+
+# Per-value decisions cached per rule before the cache is reset
+MAX_CACHED_KEYS = 4096
+
+# (stage name, rows surviving the stage, whether its fallback was used)
+StageCount = Tuple[str, int, bool]
+
+
+class Rule:
+    """A pipeline stage: a predicate over the catalogue and what to use when it leaves no rows."""
+
+    def __init__(self, name: str, predicate: Optional[Callable] = None, fallback: Optional[str] = None,
+                 fallback_limit: Optional[int] = None, key: Optional[Callable[..., Hashable]] = None):
+        """
+        Args:
+            name: Stage name (used in counts, timings and as a fallback target)
+            predicate: (user, pipeline) -> packed bitmap, boolean mask over all rows, or None for no restriction
+            fallback: Stage whose rows replace an empty result (ALL_ROWS for every row); None keeps it empty
+            fallback_limit: Keep only the first N rows of the fallback
+            key: user -> hashable; users with equal keys get the same rows (None: may depend on anything)
+        """
+        self.name = name
+        self.predicate = predicate
+        self.fallback = fallback
+        self.fallback_limit = fallback_limit
+        self.key = key
+
+    @property
+    def user_dependent(self) -> bool:
+        return self.predicate is not None
+
+    def evaluate(self, user, pipeline: 'RulePipeline') -> Optional[np.ndarray]:
+        return self.predicate(user, pipeline) if self.predicate is not None else None
+
+    def invalidate(self):
+        """Drop anything cached about the catalogue (called when it changes)."""
+
+
+class ValueRule(Rule):
+    """Accepts the rows whose value of a BitmapIndex field passes accepts(user, value)."""
+
+    def __init__(self, name: str, field: str, accepts: Callable, **kwargs):
+        """
+        Args:
+            field: BitmapIndex field
+            accepts: (user, lowercased value) -> bool, decided once per distinct value
+            key: user -> hashable; users with the same key share the decisions (e.g. their preferred domain)
+        """
+        super().__init__(name, **kwargs)
+        self.field = field
+        self.accepts = accepts
+        self._cache: Dict[Hashable, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def evaluate(self, user, pipeline: 'RulePipeline') -> np.ndarray:
+        cache_key = self.key(user) if self.key is not None else None
+        if cache_key is not None:
+            rows = self._cache.get(cache_key)
+            if rows is not None:
+                return rows
+        bitmaps = pipeline.bitmaps
+        rows = bitmaps.any_of(self.field, [value for value in bitmaps.values(self.field) if self.accepts(user, value)])
+        if cache_key is not None:
+            with self._lock:
+                if len(self._cache) >= MAX_CACHED_KEYS:
+                    self._cache.clear()
+                self._cache[cache_key] = rows
+        return rows
+
+    @property
+    def user_dependent(self) -> bool:
+        return True
+
+    def invalidate(self):
+        with self._lock:
+            self._cache.clear()
+
+
+class ColumnRule(Rule):
+    """Accepts the rows where predicate(user, column array) is True."""
+
+    def __init__(self, name: str, column: str, predicate: Callable, **kwargs):
+        super().__init__(name, lambda user, pipeline: predicate(user, pipeline.columns[column]), **kwargs)
+        self.column = column
+
+
+class PipelineResult:
+    """Rows surviving a pipeline run, with the surviving count and bitmap of every stage."""
+
+    def __init__(self, rows: np.ndarray, counts: List[StageCount], stages: Dict[str, np.ndarray]):
+        self.rows = rows
+        self.counts = counts
+        self.stages = stages
+
+
+class RulePipeline:
+    """Ordered rules evaluated as bitmap operations over a catalogue."""
+
+    def __init__(self, bitmaps: BitmapIndex, columns: Dict[str, np.ndarray], rules: Sequence[Rule] = ()):
+        """
+        Args:
+            bitmaps: Attribute bitmaps of the catalogue rows
+            columns: Column name -> array over the catalogue rows, for ColumnRules
+            rules: Stages in evaluation order
+        """
+        self.bitmaps = bitmaps
+        self.columns = columns
+        self.rules: List[Rule] = []
+        # Bumped whenever rules are added or removed, so results cached per bucket_key() can be dropped
+        self.version = 0
+        self._all_rows = None
+        for rule in rules:
+            self.add(rule)
+
+    def add(self, rule: Rule, before: Optional[str] = None):
+        """Add a rule at the end, or before the named stage."""
+        position = len(self.rules) if before is None else self._position(before)
+        earlier = {ALL_ROWS} | {existing.name for existing in self.rules[:position]}
+        if rule.name == ALL_ROWS or any(existing.name == rule.name for existing in self.rules):
+            raise ValueError(f"Duplicate rule name: {rule.name}")
+        if rule.fallback is not None and rule.fallback not in earlier:
+            raise ValueError(f"Fallback of {rule.name} must be {ALL_ROWS!r} or an earlier stage: {rule.fallback}")
+        self.rules.insert(position, rule)
+        self.version += 1
+        return rule
+
+    def remove(self, name: str) -> Rule:
+        position = self._position(name)
+        if any(rule.fallback == name for rule in self.rules[position + 1:]):
+            raise ValueError(f"Rule {name} is the fallback of a later stage")
+        self.version += 1
+        return self.rules.pop(position)
+
+    def rule(self, name: str) -> Rule:
+        return self.rules[self._position(name)]
+
+    def _position(self, name: str) -> int:
+        for position, rule in enumerate(self.rules):
+            if rule.name == name:
+                return position
+        raise KeyError(f"No rule named {name}")
+
+    def invalidate(self):
+        """Forget cached rule results after the catalogue has been rebuilt or extended."""
+        self._all_rows = None
+        for rule in self.rules:
+            rule.invalidate()
+
+    def bucket_key(self, user) -> Optional[tuple]:
+        """What the pipeline's result depends on for this user, or None when a rule has no key."""
+        parts = []
+        for rule in self.rules:
+            if rule.key is not None:
+                parts.append(rule.key(user))
+            elif rule.user_dependent:
+                return None
+        return tuple(parts)
+
+    def all_rows(self) -> np.ndarray:
+        cached = self._all_rows
+        if cached is None or cached[0] != len(self.bitmaps):
+            cached = self._all_rows = (len(self.bitmaps), self.bitmaps.full())
+        return cached[1]
+
+    def stage_rows(self, name: str, user) -> np.ndarray:
+        """Rows accepted by one rule on its own (every row when it does not restrict)."""
+        accepted = self._evaluate(self.rule(name), user)
+        return self.all_rows() if accepted is None else accepted
+
+    def _evaluate(self, rule: Rule, user) -> Optional[np.ndarray]:
+        accepted = rule.evaluate(user, self)
+        if accepted is not None and accepted.dtype == bool:
+            accepted = self.bitmaps.from_mask(accepted)
+        return accepted
+
+    def run(self, user, clock=None) -> PipelineResult:
+        """
+        Evaluate every stage for a user.
+
+        Args:
+            user: Passed to the rule predicates
+            clock: Optional stage_timing clock; a lap is recorded per stage
+        """
+        bitmaps = self.bitmaps
+        rows = self.all_rows()
+        count = bitmaps.count(rows)
+        stages = {ALL_ROWS: rows}
+        counts: List[StageCount] = []
+        for rule in self.rules:
+            accepted = self._evaluate(rule, user)
+            if accepted is not None:
+                rows = rows & accepted
+                count = bitmaps.count(rows)
+            fell_back = not count and rule.fallback is not None
+            counts.append((rule.name, count, fell_back))
+            if fell_back:
+                # Reuse the fallback stage's result instead of re-running anything
+                rows = stages[rule.fallback]
+                if rule.fallback_limit is not None:
+                    rows = bitmaps.from_positions(bitmaps.positions(rows)[:rule.fallback_limit])
+                count = bitmaps.count(rows)
+            stages[rule.name] = rows
+            if clock is not None:
+                clock.lap(rule.name)
+        return PipelineResult(rows, counts, stages)
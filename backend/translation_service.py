@@ -1,25 +1,26 @@
 """
 Translation Service for AI-Based Recommendations Engine
 Provides automatic translation capabilities for multiple languages
+
+The translation engine can run as its own Flask app (port 5001) or be mounted
+inside api_server.py through ``translation_bp`` so translations skip the proxy hop.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Blueprint, request, jsonify
 from flask_cors import CORS
-import googletrans
-from googletrans import Translator
+from collections import OrderedDict
+import threading
 import traceback
+import time
 
-app = Flask(__name__)
-CORS(app, resources={
-    r"/*": {
-        "origins": ["http://localhost:5000", "http://127.0.0.1:5000", "http://localhost", "http://127.0.0.1", "http://localhost:8000", "http://127.0.0.1:8000", "http://localhost:*", "http://127.0.0.1:*"],
-        "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"]
-    }
-})
-
-# Initialize translator
-translator = Translator()
+# googletrans is only needed when translations are actually performed
+try:
+    from googletrans import Translator
+    TRANSLATOR_AVAILABLE = True
+except ImportError as e:
+    Translator = None
+    TRANSLATOR_AVAILABLE = False
+    print(f"⚠️ googletrans not available. Translation is disabled: {e}")
 
 # Supported languages
 SUPPORTED_LANGUAGES = {
@@ -28,53 +29,104 @@ SUPPORTED_LANGUAGES = {
     'bn': 'Bengali'
 }
 
-@app.route('/translate', methods=['POST'])
-def translate_text():
-    """Translate text to specified language"""
-    try:
-        data = request.get_json()
-        
-        if not data or 'text' not in data or 'target_lang' not in data:
-            return jsonify({'error': 'Missing text or target_lang in request'}), 400
-        
-        text = data['text']
-        target_lang = data['target_lang']
-        
-        # Validate target language
+
+class TranslationCache:
+    """Thread-safe LRU cache of successful translations keyed by (text, target_lang)."""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, target_lang: str):
+        """Return the cached translation or None."""
+        key = (text, target_lang)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, text: str, target_lang: str, entry: dict):
+        """Store a translation, evicting the least recently used one when full."""
+        key = (text, target_lang)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class TranslationEngine:
+    """Translates texts with retries and caches successful results."""
+
+    def __init__(self, translator=None, cache_size: int = 4096, max_retries: int = 3):
+        """
+        Initialize the translation engine.
+
+        Args:
+            translator: Object exposing ``translate(text, dest=...)`` (defaults to googletrans,
+                created on first use so servers that never translate in-process do not build one)
+            cache_size: Maximum number of cached translations
+            max_retries: Attempts per text before keeping the original text
+        """
+        self._translator = translator
+        self._translator_lock = threading.Lock()
+        self.cache = TranslationCache(cache_size)
+        self.max_retries = max_retries
+
+    @property
+    def translator(self):
+        """The translator, creating the default googletrans one on first access (None if unavailable)."""
+        if self._translator is None and TRANSLATOR_AVAILABLE:
+            with self._translator_lock:
+                if self._translator is None:
+                    self._translator = Translator()
+        return self._translator
+
+    @staticmethod
+    def validate_language(target_lang: str):
+        """Raise ValueError for languages the service does not support."""
         if target_lang not in SUPPORTED_LANGUAGES:
-            return jsonify({'error': f'Unsupported language. Supported languages: {list(SUPPORTED_LANGUAGES.keys())}'}), 400
-        
-        # Translate text
+            raise ValueError(f'Unsupported language. Supported languages: {list(SUPPORTED_LANGUAGES.keys())}')
+
+    def translate(self, text: str, target_lang: str) -> dict:
+        """Translate a single text, raising on failure."""
+        self.validate_language(target_lang)
+        cached = self.cache.get(text, target_lang)
+        if cached is not None:
+            return cached
+        return self._translate_uncached(text, target_lang)
+
+    def _translate_uncached(self, text: str, target_lang: str) -> dict:
+        """Call the translator without a cache lookup and cache the result, raising on failure."""
+        translator = self.translator
+        if translator is None:
+            raise RuntimeError('Translator not available. Please install googletrans.')
+
         result = translator.translate(text, dest=target_lang)
-        
-        return jsonify({
-            'translated_text': result.text,
-            'source_lang': result.src,
-            'target_lang': target_lang
-        })
-        
-    except Exception as e:
-        print(f"Translation error: {e}")
-        traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        entry = {
+            'original': text,
+            'translated': result.text,
+            'source_lang': result.src
+        }
+        self.cache.put(text, target_lang, entry)
+        return entry
+
+    def translate_batch(self, texts: list, target_lang: str) -> list:
+        """Translate multiple texts, keeping the original text for any that fail."""
+        self.validate_language(target_lang)
 
-@app.route('/translate_batch', methods=['POST'])
-def translate_batch():
-    """Translate multiple texts to specified language"""
-    try:
-        data = request.get_json()
-        
-        if not data or 'texts' not in data or 'target_lang' not in data:
-            return jsonify({'error': 'Missing texts or target_lang in request'}), 400
-        
-        texts = data['texts']
-        target_lang = data['target_lang']
-        
-        # Validate target language
-        if target_lang not in SUPPORTED_LANGUAGES:
-            return jsonify({'error': f'Unsupported language. Supported languages: {list(SUPPORTED_LANGUAGES.keys())}'}), 400
-        
-        # Translate all texts with retry mechanism
         translated_texts = []
         for text in texts:
             try:
@@ -86,32 +138,27 @@ def translate_batch():
                         'source_lang': 'unknown'
                     })
                     continue
-                
-                # Try to translate with retry mechanism
-                max_retries = 3
-                translation_success = False
+
+                # Look the text up once; retries call the translator directly so they
+                # are not counted as cache misses
+                translation = self.cache.get(text, target_lang)
                 last_error = None
-                
-                for attempt in range(max_retries):
+
+                for attempt in range(self.max_retries if translation is None else 0):
                     try:
-                        result = translator.translate(text, dest=target_lang)
-                        translated_texts.append({
-                            'original': text,
-                            'translated': result.text,
-                            'source_lang': result.src
-                        })
-                        translation_success = True
+                        translation = self._translate_uncached(text, target_lang)
                         break  # Success, exit retry loop
                     except Exception as e:
                         last_error = e
-                        if attempt < max_retries - 1:  # Not the last attempt
+                        if attempt < self.max_retries - 1:  # Not the last attempt
                             # Wait a bit before retrying
-                            import time
                             time.sleep(0.1)
-                        
-                if not translation_success:
+
+                if translation is not None:
+                    translated_texts.append(translation)
+                else:
                     # If all retries failed, keep original text
-                    print(f"Translation failed after {max_retries} attempts for text '{text}': {last_error}")
+                    print(f"Translation failed after {self.max_retries} attempts for text '{text}': {last_error}")
                     translated_texts.append({
                         'original': text,
                         'translated': text,  # Keep original if translation fails
@@ -126,23 +173,96 @@ def translate_batch():
                     'source_lang': 'unknown',
                     'error': str(e)
                 })
-        
+
+        return translated_texts
+
+
+# Shared engine used by the blueprint, the standalone app and api_server (its translator is built on first use)
+engine = TranslationEngine()
+
+translation_bp = Blueprint('translation', __name__)
+
+
+@translation_bp.route('/translate', methods=['POST'])
+def translate_text():
+    """Translate text to specified language"""
+    try:
+        data = request.get_json()
+
+        if not data or 'text' not in data or 'target_lang' not in data:
+            return jsonify({'error': 'Missing text or target_lang in request'}), 400
+
+        text = data['text']
+        target_lang = data['target_lang']
+
+        # Validate target language
+        try:
+            engine.validate_language(target_lang)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        # Translate text
+        result = engine.translate(text, target_lang)
+
         return jsonify({
-            'translations': translated_texts,
+            'translated_text': result['translated'],
+            'source_lang': result['source_lang'],
             'target_lang': target_lang
         })
-        
+
+    except Exception as e:
+        print(f"Translation error: {e}")
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+
+@translation_bp.route('/translate_batch', methods=['POST'])
+def translate_batch():
+    """Translate multiple texts to specified language"""
+    try:
+        data = request.get_json()
+
+        if not data or 'texts' not in data or 'target_lang' not in data:
+            return jsonify({'error': 'Missing texts or target_lang in request'}), 400
+
+        texts = data['texts']
+        target_lang = data['target_lang']
+
+        # Validate target language
+        try:
+            engine.validate_language(target_lang)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        return jsonify({
+            'translations': engine.translate_batch(texts, target_lang),
+            'target_lang': target_lang
+        })
+
     except Exception as e:
         print(f"Batch translation error: {e}")
         traceback.print_exc()
         return jsonify({'error': f'Translation service error: {str(e)}'}), 500
 
-@app.route('/languages', methods=['GET'])
+
+@translation_bp.route('/languages', methods=['GET'])
 def get_supported_languages():
     """Get list of supported languages"""
     return jsonify(SUPPORTED_LANGUAGES)
 
+
+# Standalone app for split deployments
+app = Flask(__name__)
+CORS(app, resources={
+    r"/*": {
+        "origins": ["http://localhost:5000", "http://127.0.0.1:5000", "http://localhost", "http://127.0.0.1", "http://localhost:8000", "http://127.0.0.1:8000", "http://localhost:*", "http://127.0.0.1:*"],
+        "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        "allow_headers": ["Content-Type", "Authorization"]
+    }
+})
+app.register_blueprint(translation_bp)
+
 if __name__ == '__main__':
     print("Starting Translation Service...")
     print(f"Supported languages: {SUPPORTED_LANGUAGES}")
-    app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=5001)
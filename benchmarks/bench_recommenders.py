@@ -0,0 +1,363 @@
+"""
+Benchmark harness for the recommendation entry points
+
+Times InternshipMatcher.get_top_recommendations, MLInternshipMatcher.get_recommendations /
+get_recommendations_for_profile, JobsMatcher.get_recommendations and
+JobRecommender.get_recommendations over the real job catalogue and synthetic
+catalogues up to 1M rows (see synthetic_data.py), and reports p50/p95/p99
+latency, throughput and peak RSS.
+
+Every (scale, matcher) pair runs in its own subprocess so peak RSS is attributable
+to that matcher alone. Results are written as JSON and can be compared against a
+stored baseline to catch regressions.
+
+Usage:
+    python benchmarks/bench_recommenders.py --scales 5806,100000,1000000
+    python benchmarks/bench_recommenders.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_recommenders.py --runs 5 --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from synthetic_data import write_jobs
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASET_DIR = os.path.join(ROOT_DIR, 'dataset')
+JOBS_DATASET_PATH = os.path.join(DATASET_DIR, 'Jobs_cleaned.csv')
+CANDIDATES_DATASET_PATH = os.path.join(DATASET_DIR, 'Candidates_cleaned.csv')
+JOB_MODEL_PATH = os.path.join(ROOT_DIR, 'ml_models', 'jobs_matcher_model.joblib')
+
+# Candidates dataset columns -> the user schema MLInternshipMatcher.get_recommendations reads
+ML_USER_COLUMNS = {
+    'candidate_id': 'UserID',
+    'skills': 'Skills',
+    'job_role': 'PreferredDomain',
+    'location': 'PreferredLocation',
+    'qualification': 'Education',
+    'experience_level': 'experience_level'
+}
+
+DEFAULT_SCALES = [5806, 100000, 1000000]
+TARGETS = ['internship_matcher', 'ml_internship_matcher', 'jobs_matcher', 'job_recommender']
+
+# Metrics where larger values are worse, checked against the baseline
+REGRESSION_METRICS = ['p50_ms', 'p95_ms', 'p99_ms', 'peak_rss_mb']
+
+
+def build_catalogue(scale: int, path: str, seed: int = 42):
+    """Use the real jobs dataset at its own size, otherwise generate a synthetic one with `scale` rows."""
+    jobs_df = pd.read_csv(JOBS_DATASET_PATH)
+    if scale == len(jobs_df):
+        jobs_df.to_csv(path, index=False)
+    else:
+        write_jobs(path, scale, seed)
+
+
+def write_ml_users(path: str):
+    """Write the candidates dataset in the user schema (UserID, PreferredLocation, ...) the ML matcher looks users up in."""
+    candidates = pd.read_csv(CANDIDATES_DATASET_PATH)
+    candidates[list(ML_USER_COLUMNS)].rename(columns=ML_USER_COLUMNS).to_csv(path, index=False)
+
+
+def load_profiles():
+    """Query profiles taken from the candidates dataset."""
+    candidates = pd.read_csv(CANDIDATES_DATASET_PATH).fillna('')
+    profiles = []
+    for row in candidates.to_dict('records'):
+        profiles.append({
+            'user_id': int(row['candidate_id']),
+            'skills': row['skills'],
+            'preferred_domain': row['job_role'],
+            'preferred_location': row['location'],
+            'education': row['qualification'],
+            'experience_level': row['experience_level']
+        })
+    return profiles
+
+
+def setup_target(target: str, catalogue_path: str):
+    """Build the matcher and return a list of (entry_point, call(profile)) pairs."""
+    sys.path.append(os.path.join(ROOT_DIR, 'backend'))
+    sys.path.append(os.path.join(ROOT_DIR, 'ml_models'))
+
+    if target == 'internship_matcher':
+        from internship_matcher import InternshipMatcher
+        matcher = InternshipMatcher(CANDIDATES_DATASET_PATH, catalogue_path)
+        return [('get_top_recommendations', lambda p: matcher.get_top_recommendations(p['user_id'], 3))]
+
+    if target == 'ml_internship_matcher':
+        from ml_internship_matcher import MLInternshipMatcher
+        # get_recommendations looks users up by UserID, so the users are written in that schema
+        users_path = os.path.join(os.path.dirname(catalogue_path), 'ml_users.csv')
+        write_ml_users(users_path)
+        matcher = MLInternshipMatcher(users_path, catalogue_path)
+        matcher.train_model()
+        return [
+            ('get_recommendations', lambda p: matcher.get_recommendations(p['user_id'], 5)),
+            ('get_recommendations_for_profile', lambda p: matcher.get_recommendations_for_profile(p, 5))
+        ]
+
+    if target == 'jobs_matcher':
+        from jobs_matcher import JobsMatcher
+        matcher = JobsMatcher(catalogue_path)
+        matcher.train_model()
+        return [('get_recommendations', lambda p: matcher.get_recommendations(p, 5))]
+
+    if target == 'job_recommender':
+        from job_recommender import JobRecommender
+        recommender = JobRecommender(catalogue_path, JOB_MODEL_PATH)
+        return [('get_recommendations', lambda p: recommender.get_recommendations(
+            p['skills'], p['preferred_location'], p['experience_level'], 5))]
+
+    raise ValueError(f"Unknown target: {target}")
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def summarize(latencies_s):
+    """Latency percentiles (ms) and sequential throughput for a list of call durations."""
+    if not latencies_s:
+        return {'calls': 0}
+    latencies_ms = np.asarray(latencies_s) * 1000.0
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    return {
+        'calls': len(latencies_ms),
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'mean_ms': round(float(latencies_ms.mean()), 3),
+        'throughput_per_s': round(len(latencies_ms) / float(np.sum(latencies_s)), 2)
+    }
+
+
+def run_worker(target: str, scale: int, catalogue_path: str, iterations: int, warmup: int):
+    """Benchmark one matcher at one scale (runs inside its own subprocess)."""
+    profiles = load_profiles()
+
+    start = time.perf_counter()
+    entry_points = setup_target(target, catalogue_path)
+    setup_seconds = time.perf_counter() - start
+
+    results = []
+    for entry_point, call in entry_points:
+        latencies = []
+        error = None
+        try:
+            for i in range(warmup):
+                call(profiles[i % len(profiles)])
+            for i in range(iterations):
+                profile = profiles[i % len(profiles)]
+                call_start = time.perf_counter()
+                call(profile)
+                latencies.append(time.perf_counter() - call_start)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        result = {
+            'scale': scale,
+            'target': target,
+            'entry_point': entry_point,
+            'setup_seconds': round(setup_seconds, 3)
+        }
+        result.update(summarize(latencies))
+        if error:
+            result['error'] = error
+        results.append(result)
+
+    rss = peak_rss_mb()
+    for result in results:
+        result['peak_rss_mb'] = rss
+    return results
+
+
+def run_scale(target: str, scale: int, catalogue_path: str, args):
+    """Run a worker subprocess and collect its results."""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        result_path = f.name
+    command = [
+        sys.executable, os.path.abspath(__file__), '--worker',
+        '--target', target, '--scale', str(scale), '--catalogue', catalogue_path,
+        '--iterations', str(args.iterations), '--warmup', str(args.warmup), '--result', result_path
+    ]
+    try:
+        output = None if args.verbose else subprocess.DEVNULL
+        completed = subprocess.run(command, stdout=output, stderr=output, timeout=args.timeout)
+        if completed.returncode != 0:
+            return [{'scale': scale, 'target': target, 'error': f'worker exited with {completed.returncode}'}]
+        with open(result_path) as f:
+            return json.load(f)
+    except subprocess.TimeoutExpired:
+        return [{'scale': scale, 'target': target, 'error': f'timed out after {args.timeout}s'}]
+    finally:
+        os.remove(result_path)
+
+
+def slowest_run(runs):
+    """
+    Merge repeated runs of the same entry points, keeping each metric's worst value.
+
+    A baseline saved from the slowest of several runs leaves room for run-to-run noise,
+    so a single later run only fails the comparison on a real regression.
+    """
+    merged = {}
+    for results in runs:
+        for result in results:
+            key = result_key(result)
+            if key not in merged or 'error' in result:
+                merged[key] = dict(result)
+                continue
+            current = merged[key]
+            for metric in REGRESSION_METRICS + ['mean_ms']:
+                if result.get(metric) is not None and current.get(metric) is not None:
+                    current[metric] = max(current[metric], result[metric])
+            if result.get('throughput_per_s') is not None and current.get('throughput_per_s') is not None:
+                current['throughput_per_s'] = min(current['throughput_per_s'], result['throughput_per_s'])
+    return list(merged.values())
+
+
+def result_key(result):
+    return (result['scale'], result['target'], result.get('entry_point'))
+
+
+def compare_results(results, baseline, tolerance: float = 0.2):
+    """
+    Compare results against a baseline.
+
+    Returns a list of regression descriptions: a metric regresses when it is more than
+    `tolerance` (fractionally) worse than the baseline, and throughput regresses when it
+    falls below baseline / (1 + tolerance).
+    """
+    baseline_by_key = {result_key(r): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        base = baseline_by_key.get(result_key(result))
+        if not base:
+            continue
+        name = '{} {}.{}'.format(result['scale'], result['target'], result.get('entry_point'))
+        if 'error' in result and 'error' not in base:
+            regressions.append(f"{name}: now fails ({result['error']})")
+            continue
+        for metric in REGRESSION_METRICS:
+            current, previous = result.get(metric), base.get(metric)
+            if current is not None and previous and current > previous * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {previous} -> {current}")
+        current, previous = result.get('throughput_per_s'), base.get('throughput_per_s')
+        if current is not None and previous and current < previous / (1 + tolerance):
+            regressions.append(f"{name}: throughput_per_s {previous} -> {current}")
+    return regressions
+
+
+def print_report(results):
+    print(f"{'scale':>9} {'target':<22} {'entry point':<33} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'req/s':>9} {'RSS MB':>8}")
+    for r in results:
+        if 'error' in r and not r.get('calls'):
+            print(f"{r['scale']:>9} {r['target']:<22} {str(r.get('entry_point', '')):<33} ❌ {r['error']}")
+            continue
+        print(f"{r['scale']:>9} {r['target']:<22} {r['entry_point']:<33} {r['p50_ms']:>9} {r['p95_ms']:>9} "
+              f"{r['p99_ms']:>9} {r['throughput_per_s']:>9} {str(r.get('peak_rss_mb')):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the recommendation entry points')
+    parser.add_argument('--scales', default=','.join(str(s) for s in DEFAULT_SCALES),
+                        help='Comma-separated catalogue sizes (rows)')
+    parser.add_argument('--targets', default=','.join(TARGETS), help='Comma-separated matchers to benchmark')
+    parser.add_argument('--iterations', type=int, default=50, help='Timed calls per entry point')
+    parser.add_argument('--warmup', type=int, default=3, help='Untimed calls before timing')
+    parser.add_argument('--runs', type=int, default=1,
+                        help='Repeat each worker and keep the slowest value of every metric')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the synthetic catalogues')
+    parser.add_argument('--timeout', type=int, default=3600, help='Seconds allowed per worker')
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write the results')
+    parser.add_argument('--baseline', help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', help='Also write the results to this baseline path')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed fractional slowdown')
+    parser.add_argument('--verbose', action='store_true', help='Show matcher output from the workers')
+    # Internal arguments used by the worker subprocesses
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--target', help=argparse.SUPPRESS)
+    parser.add_argument('--scale', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--catalogue', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        results = run_worker(args.target, args.scale, args.catalogue, args.iterations, args.warmup)
+        with open(args.result, 'w') as f:
+            json.dump(results, f)
+        return 0
+
+    scales = [int(s) for s in args.scales.split(',')]
+    targets = args.targets.split(',')
+    results = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for scale in scales:
+            catalogue_path = os.path.join(data_dir, f'jobs_{scale}.csv')
+            print(f"📦 Building catalogue with {scale} rows...")
+            build_catalogue(scale, catalogue_path, args.seed)
+            for target in targets:
+                print(f"⏱️  {target} @ {scale} rows")
+                results.extend(slowest_run([run_scale(target, scale, catalogue_path, args)
+                                            for _ in range(args.runs)]))
+            os.remove(catalogue_path)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'iterations': args.iterations,
+            'runs': args.runs,
+            'seed': args.seed,
+            'scales': scales
+        },
+        'results': results
+    }
+    print_report(results)
+
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print(f"✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
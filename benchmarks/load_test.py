@@ -0,0 +1,273 @@
+"""
+Open-loop HTTP load driver for api_server.py
+
+Replays a weighted mix of /ai_recommend, /ml_recommend, /job_recommend,
+/batch_recommend and /translate_batch requests against a running server, with
+payloads built from synthetic candidate profiles (see synthetic_data.py).
+
+Arrivals follow a Poisson process at the requested rate and are sent on schedule
+whether or not earlier requests have finished (open loop). Latency is measured
+from each request's scheduled arrival time, so time spent waiting for a free
+connection counts against the server instead of silently lowering the load.
+
+Usage:
+    python backend/api_server.py &
+    python benchmarks/load_test.py --rate 20 --duration 60 --output load_report.json
+    python benchmarks/load_test.py --mix ai_recommend=80,job_recommend=20 --rate 50
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+import requests
+
+from synthetic_data import iter_candidate_profiles
+
+DEFAULT_MIX = 'ai_recommend=50,job_recommend=20,ml_recommend=15,batch_recommend=10,translate_batch=5'
+
+ENROLLMENT_CHOICES = ['Not in full-time', 'Enrolled full-time', 'Distance/Online OK']
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse 'endpoint=weight,...' into normalized weights."""
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip().lstrip('/')
+        if name not in PAYLOAD_BUILDERS:
+            raise ValueError(f"Unknown endpoint in mix: {name}")
+        weights[name] = float(weight or 1)
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("Mix weights must add up to more than zero")
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def ai_recommend_payload(profile: Dict, rng: np.random.Generator, args) -> Dict:
+    return {
+        'name': f"Load Test {profile['user_id']}",
+        'citizenship': 'Indian',
+        'age': int(rng.integers(18, 30)),
+        'eduMin': profile['education'],
+        'skills': profile['skills'],
+        'domain': profile['preferred_domain'],
+        'location': profile['preferred_location'],
+        'duration': '12 Months',
+        'edu': ENROLLMENT_CHOICES[int(rng.integers(len(ENROLLMENT_CHOICES)))]
+    }
+
+
+def ml_recommend_payload(profile: Dict, rng: np.random.Generator, args) -> Dict:
+    return {'user_id': int(rng.integers(1, args.max_user_id + 1)), 'top_k': 3}
+
+
+def job_recommend_payload(profile: Dict, rng: np.random.Generator, args) -> Dict:
+    return {
+        'skills': profile['skills'],
+        'location': profile['preferred_location'].lower(),
+        'experience': profile['experience_level'],
+        'top_k': 5
+    }
+
+
+def batch_recommend_payload(profile: Dict, rng: np.random.Generator, args) -> Dict:
+    user_ids = rng.integers(1, args.max_user_id + 1, size=args.batch_size)
+    return {'user_ids': [int(user_id) for user_id in user_ids], 'top_k': 3}
+
+
+def translate_batch_payload(profile: Dict, rng: np.random.Generator, args) -> Dict:
+    return {
+        'texts': [
+            f"This internship matches your skills ({profile['skills']})",
+            f"available in your preferred location ({profile['preferred_location']})",
+            profile['preferred_domain']
+        ],
+        'target_lang': args.target_lang
+    }
+
+
+PAYLOAD_BUILDERS = {
+    'ai_recommend': ai_recommend_payload,
+    'ml_recommend': ml_recommend_payload,
+    'job_recommend': job_recommend_payload,
+    'batch_recommend': batch_recommend_payload,
+    'translate_batch': translate_batch_payload
+}
+
+
+def build_schedule(mix: Dict[str, float], rate: float, duration: float, seed: int, args) -> List[Dict]:
+    """Poisson arrival times over the duration, each with an endpoint and a prebuilt payload."""
+    rng = np.random.default_rng(seed)
+    expected = int(rate * duration * 1.2) + 10
+    arrivals = np.cumsum(rng.exponential(1.0 / rate, size=expected))
+    while arrivals[-1] < duration:
+        more = arrivals[-1] + np.cumsum(rng.exponential(1.0 / rate, size=expected))
+        arrivals = np.concatenate([arrivals, more])
+    arrivals = arrivals[arrivals < duration]
+
+    names = list(mix)
+    endpoints = rng.choice(len(names), size=len(arrivals), p=[mix[name] for name in names])
+    profiles = iter_candidate_profiles(max(args.profiles, 1), seed)
+    profile_pool = list(profiles)
+
+    schedule = []
+    for i, (arrival, endpoint_index) in enumerate(zip(arrivals, endpoints)):
+        endpoint = names[endpoint_index]
+        profile = profile_pool[i % len(profile_pool)]
+        schedule.append({
+            'at': float(arrival),
+            'endpoint': endpoint,
+            'payload': PAYLOAD_BUILDERS[endpoint](profile, rng, args)
+        })
+    return schedule
+
+
+class LoadDriver:
+    """Sends a precomputed schedule of requests open-loop and records every outcome."""
+
+    def __init__(self, base_url: str, max_in_flight: int = 64, timeout: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self._local = threading.local()
+        self.records = []
+        self._lock = threading.Lock()
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _send(self, request: Dict, scheduled: float):
+        sent = time.perf_counter()
+        status, error = None, None
+        try:
+            response = self._session().post(f"{self.base_url}/{request['endpoint']}", json=request['payload'],
+                                            timeout=self.timeout)
+            status = response.status_code
+            if status >= 400:
+                error = f"HTTP {status}"
+        except requests.RequestException as e:
+            error = type(e).__name__
+        finished = time.perf_counter()
+
+        with self._lock:
+            self.records.append({
+                'endpoint': request['endpoint'],
+                'status': status,
+                'error': error,
+                'latency_s': finished - scheduled,
+                'service_s': finished - sent,
+                'dispatch_lag_s': sent - scheduled
+            })
+
+    def run(self, schedule: List[Dict]) -> float:
+        """Send every request at its scheduled time; returns the wall-clock duration."""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            for request in schedule:
+                scheduled = start + request['at']
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._send, request, scheduled)
+        return time.perf_counter() - start
+
+
+def _percentiles_ms(values) -> Dict:
+    if not values:
+        return {}
+    p50, p95, p99 = np.percentile(np.asarray(values) * 1000.0, [50, 95, 99])
+    return {'p50_ms': round(float(p50), 2), 'p95_ms': round(float(p95), 2), 'p99_ms': round(float(p99), 2)}
+
+
+def build_report(records: List[Dict], elapsed: float, config: Dict) -> Dict:
+    """Per-endpoint and overall latency percentiles, throughput and error rates."""
+    endpoints = {}
+    for name in sorted({r['endpoint'] for r in records}):
+        endpoint_records = [r for r in records if r['endpoint'] == name]
+        errors = [r for r in endpoint_records if r['error']]
+        error_counts = {}
+        for r in errors:
+            error_counts[r['error']] = error_counts.get(r['error'], 0) + 1
+        summary = {
+            'requests': len(endpoint_records),
+            'errors': len(errors),
+            'error_rate': round(len(errors) / len(endpoint_records), 4),
+            'error_breakdown': error_counts,
+            'throughput_per_s': round(len(endpoint_records) / elapsed, 2) if elapsed else None
+        }
+        summary.update(_percentiles_ms([r['latency_s'] for r in endpoint_records]))
+        summary['service_p95_ms'] = _percentiles_ms([r['service_s'] for r in endpoint_records]).get('p95_ms')
+        endpoints[name] = summary
+
+    total_errors = sum(1 for r in records if r['error'])
+    overall = {
+        'requests': len(records),
+        'errors': total_errors,
+        'error_rate': round(total_errors / len(records), 4) if records else 0.0,
+        'throughput_per_s': round(len(records) / elapsed, 2) if elapsed else None,
+        'max_dispatch_lag_ms': round(max((r['dispatch_lag_s'] for r in records), default=0.0) * 1000.0, 2)
+    }
+    overall.update(_percentiles_ms([r['latency_s'] for r in records]))
+
+    return {
+        'meta': dict(config, timestamp=datetime.now().isoformat(timespec='seconds'), elapsed_s=round(elapsed, 2)),
+        'overall': overall,
+        'endpoints': endpoints
+    }
+
+
+def print_report(report: Dict):
+    print(f"{'endpoint':<18} {'requests':>9} {'errors':>7} {'err %':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    rows = list(report['endpoints'].items()) + [('overall', report['overall'])]
+    for name, summary in rows:
+        print(f"{name:<18} {summary['requests']:>9} {summary['errors']:>7} {summary['error_rate'] * 100:>6.1f}% "
+              f"{summary.get('p50_ms', '-'):>9} {summary.get('p95_ms', '-'):>9} {summary.get('p99_ms', '-'):>9}")
+    print(f"Achieved throughput: {report['overall']['throughput_per_s']} req/s "
+          f"(target {report['meta']['rate']} req/s), max dispatch lag {report['overall']['max_dispatch_lag_ms']} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Open-loop load test for api_server.py')
+    parser.add_argument('--url', default='http://localhost:5000', help='Base URL of the API server')
+    parser.add_argument('--rate', type=float, default=10.0, help='Mean arrival rate (requests/second)')
+    parser.add_argument('--duration', type=float, default=30.0, help='Test duration in seconds')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='Weighted endpoint mix, e.g. ai_recommend=80,job_recommend=20')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for arrivals, endpoint choice and profiles')
+    parser.add_argument('--profiles', type=int, default=1000, help='Number of synthetic profiles to draw from')
+    parser.add_argument('--max-user-id', type=int, default=8, help='Largest user_id used for /ml_recommend and /batch_recommend')
+    parser.add_argument('--batch-size', type=int, default=5, help='Users per /batch_recommend request')
+    parser.add_argument('--target-lang', default='hi', help='Target language for /translate_batch')
+    parser.add_argument('--max-in-flight', type=int, default=64, help='Maximum concurrent requests')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds')
+    parser.add_argument('--output', help='Write the JSON report to this path')
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    schedule = build_schedule(mix, args.rate, args.duration, args.seed, args)
+    print(f"🚦 Sending {len(schedule)} requests over {args.duration}s (~{args.rate} req/s) to {args.url}")
+
+    driver = LoadDriver(args.url, args.max_in_flight, args.timeout)
+    elapsed = driver.run(schedule)
+
+    config = {'url': args.url, 'rate': args.rate, 'duration': args.duration, 'mix': mix, 'seed': args.seed,
+              'max_in_flight': args.max_in_flight}
+    report = build_report(driver.records, elapsed, config)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
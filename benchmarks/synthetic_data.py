@@ -0,0 +1,295 @@
+"""
+Seeded synthetic jobs and candidates generator for scale testing
+
+Column distributions are learned from dataset/Jobs_cleaned.csv and
+dataset/Candidates_cleaned.csv and sampled to produce arbitrarily large datasets
+in the same schema:
+
+- Type_of_job, location and actively_hiring follow their empirical frequencies
+- experience and experience_enc are sampled jointly, so the encoding stays consistent
+- salary keeps the source formats ("₹  2 - 2.5 lpa", "₹  3 lpa", "competitive salary");
+  numeric bounds and range widths are drawn per experience level
+- company_name mixes real names with recombined ones so cardinality grows with size
+- candidate skills are drawn from the skill pool of the sampled job_role
+
+Rows are generated and appended to disk in chunks, so memory stays flat however many
+rows are requested. The same seed and chunk size always produce identical files.
+
+Usage:
+    python benchmarks/synthetic_data.py --jobs 1000000 --candidates 10000 --output-dir /tmp/synthetic
+"""
+
+import argparse
+import os
+import re
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOBS_DATASET_PATH = os.path.join(ROOT_DIR, 'dataset', 'Jobs_cleaned.csv')
+CANDIDATES_DATASET_PATH = os.path.join(ROOT_DIR, 'dataset', 'Candidates_cleaned.csv')
+
+SALARY_RANGE_PATTERN = re.compile(r'^₹\s*(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*lpa$')
+SALARY_SINGLE_PATTERN = re.compile(r'^₹\s*(\d+(?:\.\d+)?)\s*lpa$')
+
+# Experience groups with fewer salary samples than this fall back to the global pool
+MIN_GROUP_SAMPLES = 20
+
+
+class Categorical:
+    """Empirical distribution of a column (missing values included)."""
+
+    def __init__(self, values):
+        counts = pd.Series(values, copy=False).value_counts(dropna=False)
+        self.values = np.array(counts.index.tolist(), dtype=object)
+        self.probabilities = (counts / counts.sum()).to_numpy(dtype=float)
+
+    def sample(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.values[rng.choice(len(self.values), size=n, p=self.probabilities)]
+
+
+def _format_amount(amount: float) -> str:
+    return f'{round(float(amount), 2):g}'
+
+
+class SalaryModel:
+    """Salary strings sampled per experience level in the dataset's formats."""
+
+    def __init__(self, salaries, experiences):
+        frame = pd.DataFrame({'salary': pd.Series(salaries, dtype=object),
+                              'experience': pd.Series(experiences, dtype=object)})
+        frame['kind'] = 'other'
+        self.groups = {}
+        self.global_group = None
+
+        parsed = []
+        for salary in frame['salary']:
+            if isinstance(salary, str) and SALARY_RANGE_PATTERN.match(salary):
+                low, high = SALARY_RANGE_PATTERN.match(salary).groups()
+                parsed.append(('range', float(low), float(high)))
+            elif isinstance(salary, str) and SALARY_SINGLE_PATTERN.match(salary):
+                parsed.append(('single', float(SALARY_SINGLE_PATTERN.match(salary).group(1)), None))
+            else:
+                parsed.append(('other', None, None))
+        frame['kind'] = [p[0] for p in parsed]
+        frame['low'] = [p[1] for p in parsed]
+        frame['high'] = [p[2] for p in parsed]
+
+        self.global_group = self._fit_group(frame)
+        for experience, group in frame.groupby('experience', dropna=False):
+            if len(group) >= MIN_GROUP_SAMPLES:
+                self.groups[experience] = self._fit_group(group)
+
+    @staticmethod
+    def _fit_group(group: pd.DataFrame) -> Dict:
+        ranges = group[group['kind'] == 'range']
+        singles = group[group['kind'] == 'single']
+        others = group.loc[group['kind'] == 'other', 'salary']
+        return {
+            'kind': Categorical(group['kind']),
+            'low': ranges['low'].to_numpy(),
+            'width': (ranges['high'] - ranges['low']).to_numpy(),
+            'single': singles['low'].to_numpy(),
+            'other': Categorical(others) if len(others) else None
+        }
+
+    def sample(self, experiences: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        salaries = np.empty(len(experiences), dtype=object)
+        for experience in pd.unique(pd.Series(experiences, dtype=object)):
+            if pd.isna(experience):
+                rows = np.flatnonzero(pd.isna(pd.Series(experiences, dtype=object)).to_numpy())
+            else:
+                rows = np.flatnonzero(experiences == experience)
+            group = self.groups.get(experience, self.global_group)
+            salaries[rows] = self._sample_group(group, len(rows), rng)
+        return salaries
+
+    def _sample_group(self, group: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        kinds = group['kind'].sample(n, rng)
+        salaries = np.empty(n, dtype=object)
+
+        ranges = np.flatnonzero(kinds == 'range')
+        if len(ranges):
+            lows = rng.choice(group['low'], size=len(ranges))
+            highs = lows + rng.choice(group['width'], size=len(ranges))
+            salaries[ranges] = [f'₹  {_format_amount(low)} - {_format_amount(high)} lpa'
+                                for low, high in zip(lows, highs)]
+
+        singles = np.flatnonzero(kinds == 'single')
+        if len(singles):
+            salaries[singles] = [f'₹  {_format_amount(amount)} lpa'
+                                 for amount in rng.choice(group['single'], size=len(singles))]
+
+        others = np.flatnonzero(kinds == 'other')
+        if len(others):
+            salaries[others] = group['other'].sample(len(others), rng)
+        return salaries
+
+
+class JobsGenerator:
+    """Generates job rows in the Jobs_cleaned.csv schema."""
+
+    def __init__(self, jobs_df: pd.DataFrame, novel_company_rate: float = 0.1):
+        """
+        Learn the column distributions.
+
+        Args:
+            jobs_df: Source jobs dataset
+            novel_company_rate: Fraction of rows given a recombined (unseen) company name
+        """
+        self.columns = jobs_df.columns.tolist()
+        self.actively_hiring = Categorical(jobs_df['actively_hiring'])
+        self.type_of_job = Categorical(jobs_df['Type_of_job'])
+        self.location = Categorical(jobs_df['location'])
+        self.company = Categorical(jobs_df['company_name'])
+        self.experience = Categorical(list(zip(jobs_df['experience'], jobs_df['experience_enc'])))
+        self.salary = SalaryModel(jobs_df['salary'], jobs_df['experience'])
+        self.novel_company_rate = novel_company_rate
+
+        names = jobs_df['company_name'].dropna().astype(str).str.split()
+        self.company_heads = np.array(sorted({words[0] for words in names if words}), dtype=object)
+        self.company_tails = np.array(sorted({' '.join(words[1:]) for words in names if len(words) > 1}),
+                                      dtype=object)
+
+    def sample(self, n: int, rng: np.random.Generator) -> pd.DataFrame:
+        experience_pairs = self.experience.sample(n, rng)
+        experiences = np.array([pair[0] for pair in experience_pairs], dtype=object)
+
+        companies = self.company.sample(n, rng)
+        novel = np.flatnonzero(rng.random(n) < self.novel_company_rate)
+        if len(novel) and len(self.company_tails):
+            heads = rng.choice(self.company_heads, size=len(novel))
+            tails = rng.choice(self.company_tails, size=len(novel))
+            companies[novel] = [f'{head} {tail}' for head, tail in zip(heads, tails)]
+
+        jobs = pd.DataFrame({
+            'actively_hiring': self.actively_hiring.sample(n, rng).astype(float),
+            'Type_of_job': self.type_of_job.sample(n, rng),
+            'company_name': companies,
+            'location': self.location.sample(n, rng),
+            'salary': self.salary.sample(experiences, rng),
+            'experience': experiences,
+            'experience_enc': np.array([pair[1] for pair in experience_pairs], dtype=np.int64)
+        })
+        return jobs[self.columns]
+
+
+class CandidatesGenerator:
+    """Generates candidate rows in the Candidates_cleaned.csv schema."""
+
+    def __init__(self, candidates_df: pd.DataFrame, jobs_df: pd.DataFrame):
+        """
+        Learn the column distributions.
+
+        The candidates dataset has only a handful of rows, all with the same experience
+        level, so experience levels and locations are drawn from the jobs dataset
+        (locations title-cased as in the candidates file) to match the catalogue.
+        """
+        self.columns = candidates_df.columns.tolist()
+        self.job_role = Categorical(candidates_df['job_role'])
+        self.qualification = Categorical(candidates_df['qualification'])
+        self.experience_level = Categorical(jobs_df['experience'].dropna())
+        self.location = Categorical(jobs_df['location'].dropna().str.title())
+
+        skills = candidates_df['skills'].fillna('').str.split(',')
+        self.skill_counts = Categorical([len(s) for s in skills])
+        self.role_skills: Dict[str, List[str]] = {}
+        for role, role_skills in zip(candidates_df['job_role'], skills):
+            pool = self.role_skills.setdefault(role, [])
+            pool.extend(skill.strip() for skill in role_skills if skill.strip() and skill.strip() not in pool)
+        self.all_skills = sorted({skill for pool in self.role_skills.values() for skill in pool})
+
+    def sample(self, n: int, rng: np.random.Generator, first_id: int = 1) -> pd.DataFrame:
+        roles = self.job_role.sample(n, rng)
+        counts = self.skill_counts.sample(n, rng)
+        skills = []
+        for role, count in zip(roles, counts):
+            pool = self.role_skills.get(role) or self.all_skills
+            # Mostly role skills, occasionally one from another role
+            chosen = list(rng.choice(pool, size=min(count, len(pool)), replace=False))
+            if rng.random() < 0.2:
+                extra = self.all_skills[rng.integers(len(self.all_skills))]
+                if extra not in chosen:
+                    chosen.append(extra)
+            skills.append(', '.join(chosen))
+
+        candidates = pd.DataFrame({
+            'candidate_id': np.arange(first_id, first_id + n, dtype=np.int64),
+            'job_role': roles,
+            'skills': skills,
+            'qualification': self.qualification.sample(n, rng),
+            'experience_level': self.experience_level.sample(n, rng),
+            'location': self.location.sample(n, rng)
+        })
+        return candidates[self.columns]
+
+
+def _write_chunks(path: str, rows: int, seed: int, chunk_size: int, sample_chunk):
+    """Write rows to a CSV file chunk by chunk, seeding each chunk from (seed, chunk index)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    for chunk_index, start in enumerate(range(0, rows, chunk_size)):
+        rng = np.random.default_rng([seed, chunk_index])
+        chunk = sample_chunk(min(chunk_size, rows - start), rng, start)
+        chunk.to_csv(path, mode='w' if chunk_index == 0 else 'a', header=chunk_index == 0, index=False)
+    return path
+
+
+def write_jobs(path: str, rows: int, seed: int = 42, chunk_size: int = 100000,
+               source_path: str = JOBS_DATASET_PATH, novel_company_rate: float = 0.1) -> str:
+    """Generate a synthetic jobs CSV with the given number of rows."""
+    generator = JobsGenerator(pd.read_csv(source_path), novel_company_rate)
+    return _write_chunks(path, rows, seed, chunk_size, lambda n, rng, start: generator.sample(n, rng))
+
+
+def write_candidates(path: str, rows: int, seed: int = 42, chunk_size: int = 100000,
+                     source_path: str = CANDIDATES_DATASET_PATH, jobs_source_path: str = JOBS_DATASET_PATH) -> str:
+    """Generate a synthetic candidates CSV with the given number of rows."""
+    generator = CandidatesGenerator(pd.read_csv(source_path), pd.read_csv(jobs_source_path))
+    return _write_chunks(path, rows, seed, chunk_size,
+                         lambda n, rng, start: generator.sample(n, rng, first_id=start + 1))
+
+
+def iter_candidate_profiles(rows: int, seed: int = 42, chunk_size: int = 10000):
+    """Yield synthetic candidates as user profile dicts without touching disk."""
+    generator = CandidatesGenerator(pd.read_csv(CANDIDATES_DATASET_PATH), pd.read_csv(JOBS_DATASET_PATH))
+    for chunk_index, start in enumerate(range(0, rows, chunk_size)):
+        rng = np.random.default_rng([seed, chunk_index])
+        chunk = generator.sample(min(chunk_size, rows - start), rng, first_id=start + 1)
+        for row in chunk.to_dict('records'):
+            yield {
+                'user_id': row['candidate_id'],
+                'skills': row['skills'],
+                'preferred_domain': row['job_role'],
+                'preferred_location': row['location'],
+                'education': row['qualification'],
+                'experience_level': row['experience_level']
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic jobs and candidates datasets')
+    parser.add_argument('--jobs', type=int, default=100000, help='Number of job rows')
+    parser.add_argument('--candidates', type=int, default=1000, help='Number of candidate rows')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--chunk-size', type=int, default=100000, help='Rows generated per chunk')
+    parser.add_argument('--novel-company-rate', type=float, default=0.1,
+                        help='Fraction of jobs with a recombined company name')
+    parser.add_argument('--output-dir', default=os.path.join(ROOT_DIR, 'dataset', 'synthetic'),
+                        help='Directory for Jobs_synthetic.csv and Candidates_synthetic.csv')
+    args = parser.parse_args()
+
+    jobs_path = os.path.join(args.output_dir, 'Jobs_synthetic.csv')
+    candidates_path = os.path.join(args.output_dir, 'Candidates_synthetic.csv')
+
+    print(f"📦 Generating {args.jobs} jobs -> {jobs_path}")
+    write_jobs(jobs_path, args.jobs, args.seed, args.chunk_size, novel_company_rate=args.novel_company_rate)
+    print(f"📦 Generating {args.candidates} candidates -> {candidates_path}")
+    write_candidates(candidates_path, args.candidates, args.seed, args.chunk_size)
+    print("✅ Done")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Bitmap index over low-cardinality catalogue attributes
+Every (field, value) pair - a location, a domain, an experience code, the
+actively_hiring flag, a salary band - gets a bitset over the catalogue rows,
+stored as a NumPy packed bool array (one bit per row, 8 rows per byte). Any
+combination of filters is then a few byte-wise AND / OR operations on those
+bitsets, and the resulting candidate row set is handed to the matchers' scoring
+code as row positions (or a boolean mask) instead of building per-request
+DataFrame masks.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from dataset_cache import lowercase_codes
+
+# Attributes the matchers index: experience holds ExperienceFilter codes, salary_band SALARY_BANDS numbers
+ATTRIBUTE_FIELDS = ('location', 'domain', 'experience', 'actively_hiring', 'salary_band')
+
+# Salary band lower edges in INR/year; band i holds salaries in [edge i, edge i + 1)
+SALARY_BANDS = (0, 100000, 250000, 500000, 1000000)
+
+# Set bits per byte value, for counting the rows in a bitmap
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def _normalize(value) -> str:
+    return str(value).lower()
+
+
+def salary_bands(salaries) -> np.ndarray:
+    """SALARY_BANDS band number per salary (NaN counts as 0)."""
+    salaries = np.nan_to_num(np.asarray(salaries, dtype=np.float64), nan=0.0)
+    return np.maximum(np.searchsorted(SALARY_BANDS, salaries, side='right') - 1, 0)
+
+
+def hiring_flags(df: pd.DataFrame) -> np.ndarray:
+    """actively_hiring as booleans (blank cells count as not hiring; every row when the column is absent)."""
+    if 'actively_hiring' not in df.columns:
+        return np.ones(len(df), dtype=bool)
+    return (pd.to_numeric(df['actively_hiring'].astype(object), errors='coerce') == 1).to_numpy()
+
+
+class BitmapIndex:
+    """Packed bitsets of the rows holding each value of the indexed fields."""
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self._lock = threading.Lock()
+        self.rebuild({field: [] for field in self.fields})
+
+    def rebuild(self, keys: Dict[str, Iterable]):
+        """
+        Index a whole catalogue.
+
+        Args:
+            keys: Field -> value per row for each indexed field (matched case-insensitively)
+        """
+        with self._lock:
+            self._rows = 0
+            self._bitmaps: Dict[str, Dict[str, np.ndarray]] = {field: {} for field in self.fields}
+            self._append(keys)
+
+    def add(self, keys: Dict[str, Iterable]):
+        """Append newly ingested rows."""
+        with self._lock:
+            self._append(keys)
+
+    def _append(self, keys: Dict[str, Iterable]):
+        codes = {field: lowercase_codes(keys[field]) for field in self.fields}
+        start = self._rows
+        rows = len(codes[self.fields[0]][0]) if self.fields else 0
+        self._rows = start + rows
+        size = (self._rows + 7) // 8
+
+        for field, (field_codes, uniques) in codes.items():
+            bitmaps = self._bitmaps[field]
+            # Existing bitsets gain zero bytes for the new rows (copies, so readers keep a consistent view)
+            for value, bitmap in bitmaps.items():
+                bitmaps[value] = np.concatenate([bitmap, np.zeros(size - len(bitmap), dtype=np.uint8)])
+            order = np.argsort(field_codes, kind='stable')
+            bounds = np.searchsorted(field_codes[order], np.arange(len(uniques) + 1))
+            for i, value in enumerate(uniques):
+                positions = start + order[bounds[i]:bounds[i + 1]]
+                bitmap = bitmaps.get(value)
+                if bitmap is None:
+                    bitmap = bitmaps[value] = np.zeros(size, dtype=np.uint8)
+                np.bitwise_or.at(bitmap, positions >> 3, (0x80 >> (positions & 7)).astype(np.uint8))
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def values(self, field: str) -> List[str]:
+        """The (lowercased) values of field that occur in the catalogue."""
+        with self._lock:
+            return list(self._bitmaps[field])
+
+    def empty(self) -> np.ndarray:
+        return np.zeros((self._rows + 7) // 8, dtype=np.uint8)
+
+    def full(self) -> np.ndarray:
+        return np.packbits(np.ones(self._rows, dtype=bool))
+
+    def get(self, field: str, value) -> np.ndarray:
+        """Bitset of the rows where field == value (read-only; combine with & and | into new bitsets)."""
+        with self._lock:
+            bitmap = self._bitmaps[field].get(_normalize(value))
+        return bitmap if bitmap is not None else self.empty()
+
+    def any_of(self, field: str, values: Iterable) -> np.ndarray:
+        """Bitset of the rows where field is any of values."""
+        with self._lock:
+            bitmaps = self._bitmaps[field]
+            selected = [bitmaps[value] for value in dict.fromkeys(map(_normalize, values)) if value in bitmaps]
+        if not selected:
+            return self.empty()
+        return np.bitwise_or.reduce(selected) if len(selected) > 1 else selected[0].copy()
+
+    @staticmethod
+    def count(bitmap: np.ndarray) -> int:
+        """Number of rows in a bitset."""
+        return int(_POPCOUNT[bitmap].sum())
+
+    def mask(self, bitmap: np.ndarray) -> np.ndarray:
+        """A bitset as a boolean mask over all rows."""
+        return np.unpackbits(bitmap, count=self._rows).astype(bool)
+
+    def positions(self, bitmap: np.ndarray) -> np.ndarray:
+        """Row positions in a bitset, ascending."""
+        return np.flatnonzero(np.unpackbits(bitmap, count=self._rows))
+
+    def from_mask(self, mask: np.ndarray) -> np.ndarray:
+        return np.packbits(np.asarray(mask, dtype=bool))
+
+    def from_positions(self, positions) -> np.ndarray:
+        mask = np.zeros(self._rows, dtype=bool)
+        mask[np.asarray(positions, dtype=np.int64)] = True
+        return np.packbits(mask)
+
+
+def candidate_rows(bitmaps: BitmapIndex, salary_index, experience_filter, preferred_location: str,
+                   min_salary: Optional[float] = None, experience_level: str = ''):
+    """
+    Rows eligible for ranking as (bitmap or None for every row, location bucket values or None).
+
+    Rows in the preferred location or remote are kept when there are any; min_salary then keeps
+    the prefix of those buckets in the salary index paying at least that much, and experience_level
+    drops rows whose experience range does not fit (unless none would be left).
+
+    Args:
+        bitmaps: BitmapIndex with 'location' and 'experience' fields
+        salary_index: SalaryIndex over the same rows, bucketed by 'location'
+        experience_filter: ExperienceFilter whose codes the 'experience' bitmaps hold
+        preferred_location: Lowercased location ('' or 'any' for no preference)
+        min_salary: Salary floor (INR/year)
+        experience_level: Candidate experience level, e.g. "0-2 years"
+    """
+    location_values = None
+    rows = None
+    if preferred_location and preferred_location != 'any':
+        location_rows = bitmaps.any_of('location', [preferred_location, 'remote'])
+        if bitmaps.count(location_rows):
+            rows = location_rows
+            location_values = [preferred_location, 'remote']
+    if min_salary is not None:
+        rows = bitmaps.from_positions(salary_index.at_least(
+            min_salary, 'location' if location_values else None, location_values or ()))
+    compatible = experience_filter.compatible_codes(experience_level) if experience_level else None
+    if compatible is not None:
+        experience_rows = bitmaps.any_of('experience', np.flatnonzero(compatible))
+        eligible = experience_rows if rows is None else rows & experience_rows
+        if bitmaps.count(eligible):
+            rows = eligible
+    return rows, location_values
+
+
+def top_by_salary(bitmaps: BitmapIndex, salary_index, rows, location_values, top_k: int,
+                  min_salary: Optional[float] = None, domains: Iterable = ()) -> List[int]:
+    """
+    Row positions of the top_k best paid candidate rows, from the given domains when they have any.
+
+    Args:
+        rows, location_values: As returned by candidate_rows()
+        domains: Preferred domain labels of the salary index's 'domain' buckets (tried first)
+    """
+    keep = bitmaps.mask(rows) if rows is not None else None
+    domains = list(domains)
+    positions = salary_index.top(top_k, 'domain', domains, min_salary, allowed=keep) if domains else []
+    if not positions:
+        positions = salary_index.top(top_k, 'location' if location_values else None,
+                                     location_values or (), min_salary, allowed=keep)
+    return positions
@@ -0,0 +1,222 @@
+"""
+Shared CSV dataset loader with a binary on-disk cache
+The first load of a CSV parses it and writes a binary copy (Feather when pyarrow
+is installed, otherwise a pandas pickle) under a .cache directory next to it.
+Later loads, including fresh processes, read the binary copy as long as the
+source file is unchanged. Within a process every caller gets the same DataFrame,
+so the matchers share one in-memory copy of each dataset: treat the returned
+frames as read-only and build derived columns into separate arrays (attach them
+with DataFrame.assign, which shares the existing columns) instead of copying.
+A filled variant (fill_value) shares every column of that frame except the ones
+that had missing cells.
+
+The cache is keyed by the source's size and mtime, with a content hash as a
+fallback so a file that was only touched does not trigger a re-parse.
+
+Highly repetitive text columns (location, company, role, experience, salary) are
+stored as pandas categoricals: integer codes into one shared dictionary of
+distinct strings, so every row holding the same value points at the same
+string object. as_text() and lower_categorical() work on the codes and categories
+instead of materializing per-row strings.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Feather needs pyarrow; without it the cache falls back to pickle
+try:
+    import pyarrow  # noqa: F401
+    FEATHER_AVAILABLE = True
+except ImportError:
+    FEATHER_AVAILABLE = False
+
+CACHE_FORMAT = 'feather' if FEATHER_AVAILABLE else 'pickle'
+
+# Directory for the binary copies (defaults to <dataset dir>/.cache); DATASET_CACHE=0 disables the disk cache
+CACHE_DIR = os.environ.get('DATASET_CACHE_DIR')
+DISK_CACHE_ENABLED = os.environ.get('DATASET_CACHE', '1') != '0'
+
+# Repetitive text columns stored as categoricals in the cached frames
+CATEGORICAL_COLUMNS = ('location', 'company_name', 'Type_of_job', 'experience', 'salary')
+
+_frames: Dict[Tuple[str, Optional[str]], Tuple[Tuple[int, int], pd.DataFrame]] = {}
+_lock = threading.Lock()
+
+
+def encode_categoricals(df: pd.DataFrame, columns=CATEGORICAL_COLUMNS) -> pd.DataFrame:
+    """Convert the given text columns (those present) to categoricals, in place."""
+    for column in columns:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return df
+
+
+def as_text(values: pd.Series) -> pd.Series:
+    """Plain string values with '' for missing cells (expands categoricals through their categories)."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Code -1 (missing) picks the trailing ''
+        categories = np.append(values.cat.categories.astype(str).to_numpy(dtype=object), '')
+        return pd.Series(categories[values.cat.codes.to_numpy()], index=values.index, dtype=object)
+    return values.fillna('').astype(str)
+
+
+def lower_categorical(values: pd.Series) -> pd.Series:
+    """Lowercased values as a categorical ('' for missing), computed once per distinct value."""
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype('category')
+    lowered = np.append(values.cat.categories.astype(str).str.lower().to_numpy(dtype=object), '')
+    categories, remap = np.unique(lowered, return_inverse=True)
+    codes = remap[values.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=values.index)
+
+
+def lowercase_codes(values) -> Tuple[np.ndarray, list]:
+    """Code per row and the distinct lowercased values; categoricals are mapped through their categories."""
+    if isinstance(values, np.ndarray):
+        values = pd.Series(values)
+    elif not isinstance(values, pd.Series):
+        values = pd.Series(list(values), dtype=object)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Code -1 (missing) picks the trailing ''
+        categories = np.append(values.cat.categories.astype(str).to_numpy(dtype=object), '')
+        remap, uniques = pd.factorize(pd.Series(categories, dtype=object).map(lambda value: value.lower()))
+        return remap[values.cat.codes.to_numpy()], list(uniques)
+    codes, uniques = pd.factorize(values.map(lambda value: str(value).lower()))
+    return codes, list(uniques)
+
+
+def _signature(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def dataset_key(path: str) -> str:
+    """The cache key of a dataset file (path, size and mtime); it changes whenever the file does."""
+    path = os.path.abspath(path)
+    size, mtime_ns = _signature(path)
+    return f'{path}:{size}:{mtime_ns}'
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_paths(path: str) -> Tuple[str, str]:
+    cache_dir = CACHE_DIR or os.path.join(os.path.dirname(path), '.cache')
+    name = os.path.basename(path)
+    return os.path.join(cache_dir, f'{name}.{CACHE_FORMAT}'), os.path.join(cache_dir, f'{name}.meta.json')
+
+
+def _read_binary(cache_path: str) -> pd.DataFrame:
+    if CACHE_FORMAT == 'feather':
+        return pd.read_feather(cache_path)
+    return pd.read_pickle(cache_path)
+
+
+def _write_binary(df: pd.DataFrame, cache_path: str):
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    if CACHE_FORMAT == 'feather':
+        df.to_feather(tmp_path)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+
+def _load_from_disk(path: str) -> pd.DataFrame:
+    """Read the binary copy if it matches the source, otherwise parse the CSV and refresh the copy."""
+    size, mtime_ns = _signature(path)
+    cache_path, meta_path = _cache_paths(path)
+    source_hash = None
+
+    if DISK_CACHE_ENABLED and os.path.exists(cache_path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('format') == CACHE_FORMAT and meta.get('size') == size:
+                if meta.get('mtime_ns') == mtime_ns:
+                    return _read_binary(cache_path)
+                source_hash = _file_hash(path)
+                if meta.get('sha1') == source_hash:
+                    df = _read_binary(cache_path)
+                    meta['mtime_ns'] = mtime_ns
+                    with open(meta_path, 'w') as f:
+                        json.dump(meta, f)
+                    return df
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable dataset cache for {path}: {e}")
+
+    df = pd.read_csv(path)
+    if DISK_CACHE_ENABLED:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            _write_binary(df, cache_path)
+            meta = {'format': CACHE_FORMAT, 'size': size, 'mtime_ns': mtime_ns,
+                    'sha1': source_hash or _file_hash(path), 'rows': len(df)}
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+        except Exception as e:
+            print(f"⚠️ Could not write dataset cache for {path}: {e}")
+    return df
+
+
+def load_dataset(path: str, fill_value: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load a CSV dataset through the shared in-memory and on-disk caches.
+
+    Args:
+        path: Path to the CSV file
+        fill_value: If given, NaN cells are replaced with it (only the columns with missing
+            cells get new arrays; the rest are shared with the unfilled frame)
+
+    Returns:
+        Shared DataFrame - do not modify it in place
+    """
+    path = os.path.abspath(path)
+    signature = _signature(path)
+    key = (path, fill_value)
+
+    with _lock:
+        cached = _frames.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        raw = _frames.get((path, None))
+        if raw is not None and raw[0] == signature:
+            df = raw[1]
+        else:
+            df = encode_categoricals(_load_from_disk(path))
+            _frames[(path, None)] = (signature, df)
+        if fill_value is not None:
+            df = _fill(df, fill_value)
+            _frames[key] = (signature, df)
+        return df
+
+
+def _fill(df: pd.DataFrame, fill_value) -> pd.DataFrame:
+    """df with NaN replaced by fill_value, sharing the columns that have no missing cells."""
+    filled = {}
+    for column in df.columns:
+        values = df[column]
+        if not values.isna().any():
+            continue
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Only the codes change: the fill value joins the (sorted) categories
+            values = values.cat.set_categories(values.cat.categories.union([fill_value]))
+        filled[column] = values.fillna(fill_value)
+    return df.assign(**filled) if filled else df
+
+
+def clear_memory_cache():
+    """Drop the shared in-memory frames (the on-disk copies are kept)."""
+    with _lock:
+        _frames.clear()
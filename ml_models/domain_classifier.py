@@ -0,0 +1,127 @@
+"""
+Keyword-based domain classification shared by all matchers
+Each rule set is compiled into a single regular expression, results are memoized
+per distinct string, and whole columns are labelled in one pass over their distinct values.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from typing import Iterable, List, Tuple
+
+# Job role -> domain rules used by MLInternshipMatcher and JobRecommender.
+# Rules are checked in order and the first rule with a keyword contained in the role wins.
+ROLE_DOMAIN_RULES = [
+    # Data Science first (more specific terms)
+    ('Data Science', ['data scientist', 'data analyst', 'data engineer', 'data science']),
+    # Quality Assurance before Web Development to avoid conflicts
+    ('Quality Assurance', ['testing', 'qa', 'quality', 'tester', 'assurance']),
+    ('Business Development', ['business development', 'sales', 'business', 'corporate sales']),
+    ('Finance', ['finance', 'financial', 'account', 'accounts']),
+    ('Web Development', ['web', 'developer', 'engineer', 'frontend', 'backend', 'full stack',
+                         'react', 'angular', 'javascript', 'python']),
+    ('Design', ['design', 'ui', 'ux', 'graphic', 'visual']),
+    ('Marketing', ['marketing', 'digital marketing', 'seo', 'social media']),
+    ('Human Resources', ['hr', 'human', 'recruitment']),
+    ('Content Writing', ['content', 'writer', 'editor']),
+    # Growth roles
+    ('Business Development', ['growth', 'growth catalyst']),
+    # Insurance roles
+    ('Finance', ['insurance', 'consultant'])
+]
+
+# Job role -> domain rules used by the rule-based Internship objects
+SIMPLE_ROLE_DOMAIN_RULES = [
+    ('Data Science', ['data', 'analyst']),
+    ('Web Development', ['developer', 'engineer']),
+    ('Design', ['design']),
+    ('Business Development', ['sales', 'business'])
+]
+
+# Skills -> preferred domain rules used when the user does not state a domain
+SKILL_DOMAIN_RULES = [
+    ('Web Development', ['python', 'javascript', 'html', 'css', 'angular', 'react']),
+    ('Data Science', ['data', 'machine learning', 'analysis']),
+    ('Quality Assurance', ['testing', 'qa']),
+    ('Business Development', ['sales', 'business'])
+]
+
+
+class DomainClassifier:
+    """Classifies text into the domain of the first rule whose keyword it contains."""
+
+    def __init__(self, rules: List[Tuple[str, Iterable[str]]], default: str = 'General',
+                 cache_size: int = 65536):
+        """
+        Compile the rules.
+
+        Args:
+            rules: Ordered (domain, keywords) pairs; earlier rules take precedence
+            default: Domain returned when no keyword matches
+            cache_size: Maximum number of memoized strings before the cache is reset
+        """
+        self.rules = [(domain, tuple(keywords)) for domain, keywords in rules]
+        self.default = default
+        self.cache_size = cache_size
+        self.domains = list(dict.fromkeys([domain for domain, _ in self.rules] + [default]))
+
+        # One zero-width match per position: the alternation tries rules in priority order,
+        # so each match names the highest-priority rule with a keyword starting there.
+        alternatives = '|'.join(
+            f'(?P<r{i}>{"|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))})'
+            for i, (_, keywords) in enumerate(self.rules)
+        )
+        self._pattern = re.compile(f'(?=(?:{alternatives}))')
+        self._cache = {}
+
+    def classify(self, text) -> str:
+        """Return the domain for a single string (memoized)."""
+        text = str(text)
+        domain = self._cache.get(text)
+        if domain is None:
+            domain = self._classify(text.lower())
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[text] = domain
+        return domain
+
+    def _classify(self, text_lower: str) -> str:
+        best = len(self.rules)
+        for match in self._pattern.finditer(text_lower):
+            rule_index = int(match.lastgroup[1:])
+            if rule_index < best:
+                best = rule_index
+                if best == 0:
+                    break
+        return self.rules[best][0] if best < len(self.rules) else self.default
+
+    def label(self, values) -> pd.Series:
+        """Label a whole column, classifying each distinct value once."""
+        values = pd.Series(values, copy=False)
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        labels = np.array([self.classify(value) for value in uniques], dtype=object)
+        return pd.Series(labels[codes], index=values.index, dtype=object)
+
+    def labels_matching(self, domain: str) -> List[str]:
+        """Return the domain labels equal to the given domain, ignoring case."""
+        domain = str(domain).lower()
+        return [label for label in self.domains if label.lower() == domain]
+
+    def boost_factors(self, labels: pd.Series, preferred_domain: str, match_boost: float = 2.0,
+                      mismatch_penalty: float = 0.3) -> np.ndarray:
+        """
+        Score multipliers for labelled rows.
+
+        Rows in the preferred domain get match_boost, rows in a different specific
+        (non-default) domain get mismatch_penalty and everything else keeps its score.
+        """
+        in_preferred = labels.isin(self.labels_matching(preferred_domain)).values
+        if str(preferred_domain).lower() == self.default.lower():
+            return np.where(in_preferred, match_boost, 1.0)
+        other_domain = ~in_preferred & (labels != self.default).values
+        return np.where(in_preferred, match_boost, np.where(other_domain, mismatch_penalty, 1.0))
+
+
+ROLE_DOMAINS = DomainClassifier(ROLE_DOMAIN_RULES)
+SIMPLE_ROLE_DOMAINS = DomainClassifier(SIMPLE_ROLE_DOMAIN_RULES)
+SKILL_DOMAINS = DomainClassifier(SKILL_DOMAIN_RULES, default='')
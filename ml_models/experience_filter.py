@@ -0,0 +1,105 @@
+"""
+Experience-level compatibility over the precomputed experience_enc column
+experience_enc is a label code per distinct experience string ("0-2 years" ->
+2), not an ordinal, so each code is mapped once to the (min, max) years it
+stands for. A candidate's experience_level is mapped to the same encoding (or
+parsed when the catalogue has no such string) and the compatible codes are
+looked up for every row with one gather over the compact code array.
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Upper bound for open-ended ranges ("5+ years") and rows without an experience requirement
+MAX_YEARS = np.iinfo(np.int8).max
+
+# Level words used by the forms and resumes
+EXPERIENCE_WORDS = {
+    'fresher': (0, 1),
+    'entry': (0, 2),
+    'junior': (0, 2),
+    'mid': (2, 5),
+    'senior': (5, MAX_YEARS)
+}
+
+_RANGE_PATTERN = re.compile(r'(\d+)\s*(?:-|to)\s*(\d+)')
+_OPEN_PATTERN = re.compile(r'(\d+)\s*\+')
+_SINGLE_PATTERN = re.compile(r'(\d+)')
+
+
+def parse_experience(text) -> Optional[Tuple[int, int]]:
+    """(min_years, max_years) for '0-2 years', '5+ years', '3 years' or a level word; None if there is none."""
+    if text is None or (isinstance(text, float) and np.isnan(text)):
+        return None
+    text = str(text).strip().lower()
+    match = _RANGE_PATTERN.search(text)
+    if match:
+        low, high = sorted((int(match.group(1)), int(match.group(2))))
+        return min(low, MAX_YEARS), min(high, MAX_YEARS)
+    match = _OPEN_PATTERN.search(text)
+    if match:
+        return min(int(match.group(1)), MAX_YEARS), MAX_YEARS
+    match = _SINGLE_PATTERN.search(text)
+    if match:
+        years = min(int(match.group(1)), MAX_YEARS)
+        return years, years
+    for word, years in EXPERIENCE_WORDS.items():
+        if word in text:
+            return years
+    return None
+
+
+class ExperienceFilter:
+    """Experience range per encoded value and a compact per-row code array."""
+
+    def __init__(self, experience: pd.Series, codes: Optional[pd.Series] = None):
+        """
+        Args:
+            experience: Experience requirement text per row
+            codes: experience_enc per row (derived from the text when the catalogue has none)
+        """
+        if codes is None:
+            # Same convention as experience_enc: 0 for a missing requirement
+            codes = pd.Series(pd.factorize(experience.astype(object))[0] + 1, index=experience.index)
+        codes = np.asarray(codes, dtype=np.int64)
+        size = int(codes.max()) + 1 if len(codes) else 0
+        self.codes = codes.astype(np.int8 if size <= MAX_YEARS else np.int32)
+
+        # One parse per distinct code; rows without a parseable requirement accept everyone
+        self.code_min = np.zeros(size, dtype=np.int8)
+        self.code_max = np.full(size, MAX_YEARS, dtype=np.int8)
+        self.vocabulary: Dict[str, int] = {}
+        texts = pd.Series(np.asarray(experience, dtype=object)).groupby(codes).first()
+        for code, text in texts.items():
+            years = parse_experience(text)
+            if years is not None:
+                self.code_min[code], self.code_max[code] = years
+                self.vocabulary[str(text).strip().lower()] = int(code)
+
+    def encode(self, experience_level) -> Optional[int]:
+        """The catalogue's code for an experience string, or None if it does not occur."""
+        return self.vocabulary.get(str(experience_level).strip().lower())
+
+    def candidate_range(self, experience_level) -> Optional[Tuple[int, int]]:
+        code = self.encode(experience_level)
+        if code is not None:
+            return int(self.code_min[code]), int(self.code_max[code])
+        return parse_experience(experience_level)
+
+    def compatible_codes(self, experience_level) -> Optional[np.ndarray]:
+        """Boolean per code: does its range overlap the candidate's (None when the level is unknown)."""
+        years = self.candidate_range(experience_level)
+        if years is None:
+            return None
+        low, high = years
+        return (self.code_min <= high) & (self.code_max >= low)
+
+    def mask(self, experience_level) -> Optional[np.ndarray]:
+        """Boolean per row for rows whose requirement fits the candidate (None when the level is unknown)."""
+        compatible = self.compatible_codes(experience_level)
+        if compatible is None:
+            return None
+        return compatible[self.codes]
@@ -2,9 +2,20 @@
 Simple interface for job recommendations using the trained model
 """
 
-import pandas as pd
 import joblib
 import os
+import sys
+
+# Shared helpers live next to this module
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from domain_classifier import ROLE_DOMAINS, SKILL_DOMAINS
+from reason_engine import job_reasons, validate_explain_level
+from stage_timing import TIMINGS
+from dataset_cache import load_dataset, as_text, lower_categorical
+from salary_parser import salary_columns
+from salary_index import SalaryIndex
+from experience_filter import ExperienceFilter
+from bitmap_index import BitmapIndex, ATTRIBUTE_FIELDS, salary_bands, hiring_flags, candidate_rows, top_by_salary
 
 class JobRecommender:
     """Simple interface for job recommendations."""
@@ -20,6 +31,9 @@ class JobRecommender:
         self.jobs_dataset_path = jobs_dataset_path
         self.model_path = model_path
         self.matcher = None
+        self.salary_index = SalaryIndex()
+        self.experience_filter = None
+        self.bitmaps = BitmapIndex(ATTRIBUTE_FIELDS)
         self._load_model()
     
     def _load_model(self):
@@ -35,7 +49,7 @@ class JobRecommender:
             if not os.path.exists(self.jobs_dataset_path):
                 raise FileNotFoundError(f"Jobs dataset not found: {self.jobs_dataset_path}")
             
-            self.jobs_df = pd.read_csv(self.jobs_dataset_path)
+            self.jobs_df = load_dataset(self.jobs_dataset_path)
             
             # Extract necessary components from the loaded model
             self.model = self.model_data['model']
@@ -57,13 +71,27 @@ class JobRecommender:
                 self.ngram_range = config.get('ngram_range', (1, 2))
             
             # Update the job features in the model with the current dataset
-            self.model['job_features'] = self.jobs_df.copy()
+            # The loaded frame is shared read-only; derived columns are added as new arrays
+            self.model['job_features'] = self.jobs_df.assign(**self._derived_columns(self.jobs_df))
+            self.salary_index.rebuild(self.model['job_features']['salary_mid'].to_numpy(), {
+                'location': self.model['job_features']['location_lower'],
+                'domain': self.model['job_features']['domain']
+            })
+            self.experience_filter = ExperienceFilter(self.model['job_features']['experience'],
+                                                      self.model['job_features'].get('experience_enc'))
+            self.bitmaps.rebuild({
+                'location': self.model['job_features']['location_lower'],
+                'domain': self.model['job_features']['domain'],
+                'experience': self.experience_filter.codes,
+                'actively_hiring': hiring_flags(self.model['job_features']),
+                'salary_band': salary_bands(self.model['job_features']['salary_mid'])
+            })
             
             # Re-vectorize job texts
             job_texts = (
-                self.jobs_df['Type_of_job'].fillna('') + ' ' +
-                self.jobs_df['company_name'].fillna('') + ' ' +
-                self.jobs_df['location'].fillna('')
+                as_text(self.jobs_df['Type_of_job']) + ' ' +
+                as_text(self.jobs_df['company_name']) + ' ' +
+                as_text(self.jobs_df['location'])
             )
             self.model['job_vectors'] = self.vectorizers['tfidf'].transform(job_texts)
             
@@ -73,7 +101,16 @@ class JobRecommender:
             print("Please train the model first using jobs_matcher.py")
             raise
     
-    def get_recommendations(self, skills: str, location: str, experience: str, top_k: int = 5):
+    def _derived_columns(self, jobs):
+        """The domain label, lowercased lookup columns and salary ranges used at query time."""
+        columns = {'domain': ROLE_DOMAINS.label(jobs['Type_of_job']).astype('category')}
+        for column in ('Type_of_job', 'location', 'experience'):
+            columns[f'{column}_lower'] = lower_categorical(jobs[column])
+        columns.update(salary_columns(jobs['salary']))
+        return columns
+    
+    def get_recommendations(self, skills: str, location: str, experience: str, top_k: int = 5,
+                            explain: str = 'full', min_salary: float = None, sort: str = 'relevance'):
         """
         Get job recommendations.
         
@@ -82,11 +119,16 @@ class JobRecommender:
             location: Preferred job location
             experience: Experience level (e.g., "0-2 years")
             top_k: Number of recommendations to return
+            explain: Reason detail ('none', 'short' or 'full')
+            min_salary: Drop jobs paying less than this (INR/year)
+            sort: 'relevance' (similarity) or 'salary' (best paid first)
         """
         if not hasattr(self, 'model') or not hasattr(self, 'vectorizers'):
             raise ValueError("Model not loaded. Please check the model file.")
+        explain = validate_explain_level(explain)
         
         from sklearn.metrics.pairwise import cosine_similarity
+        clock = TIMINGS.clock('job_recommender')
         
         # Create user text for vectorization
         user_text = (
@@ -97,184 +139,137 @@ class JobRecommender:
         
         # Transform user text using the existing vectorizer
         user_vector = self.vectorizers['tfidf'].transform([user_text])
+        clock.lap('vectorize')
         
         # Get all jobs for matching
-        all_jobs = self.model['job_features'].copy()
+        job_features = self.model['job_features']
+        all_jobs = job_features
+        bitmaps = self.bitmaps
         
-        # Filter by location if specified
-        preferred_location = location.lower()
-        if preferred_location and preferred_location != 'any':
-            # Check if there are jobs in the preferred location
-            location_filtered = all_jobs[
-                (all_jobs['location'].str.lower() == preferred_location) |
-                (all_jobs['location'].str.lower() == 'remote')
-            ]
-            
-            # If jobs available in preferred location or remote, use them
-            if len(location_filtered) > 0:
-                all_jobs = location_filtered
+        # Location (or remote), salary floor and experience range, shared with the ML matcher
+        rows, location_values = candidate_rows(bitmaps, self.salary_index, self.experience_filter,
+                                               location.lower(), min_salary, experience)
+        
+        # Infer the preferred domain from the user's skills
+        preferred_domain = SKILL_DOMAINS.classify(skills).lower() or None
         
+        if sort == 'salary':
+            # Best paid candidates straight from the salary index (preferred domain first); only they are scored
+            domains = ROLE_DOMAINS.labels_matching(preferred_domain) if preferred_domain else ()
+            positions = top_by_salary(bitmaps, self.salary_index, rows, location_values, top_k, min_salary, domains)
+            all_jobs = job_features.iloc[positions]
+        elif rows is not None:
+            all_jobs = job_features.iloc[bitmaps.positions(rows)]
+        clock.lap('filter')
+
+        # Nothing passes the salary floor
+        if len(all_jobs) == 0:
+            return []
+
         # Re-vectorize filtered jobs
         job_texts = (
-            all_jobs['Type_of_job'].fillna('') + ' ' +
-            all_jobs['company_name'].fillna('') + ' ' +
-            all_jobs['location'].fillna('')
+            as_text(all_jobs['Type_of_job']) + ' ' +
+            as_text(all_jobs['company_name']) + ' ' +
+            as_text(all_jobs['location'])
         )
         filtered_job_vectors = self.vectorizers['tfidf'].transform(job_texts)
+        clock.lap('revectorize')
         
         # Calculate similarities
         similarities = cosine_similarity(user_vector, filtered_job_vectors).flatten()
         
         # Apply regularization
         similarities = similarities * (1 - self.regularization_strength)
+        clock.lap('score')
         
         # Create a dataframe with similarities for sorting
         similarity_df = all_jobs.copy()
         similarity_df['similarity_score'] = similarities
         
-        # Extract domain keywords from user skills to infer preferred domain
-        preferred_domain = None
-        skills_lower = skills.lower()
-        
-        # Try to infer domain from skills
-        if 'python' in skills_lower or 'javascript' in skills_lower or 'html' in skills_lower or 'css' in skills_lower or 'angular' in skills_lower or 'react' in skills_lower:
-            preferred_domain = 'web development'
-        elif 'data' in skills_lower or 'machine learning' in skills_lower or 'analysis' in skills_lower:
-            preferred_domain = 'data science'
-        elif 'testing' in skills_lower or 'qa' in skills_lower:
-            preferred_domain = 'quality assurance'
-        elif 'sales' in skills_lower or 'business' in skills_lower:
-            preferred_domain = 'business development'
-        
         # Boost scores for jobs in the inferred preferred domain
         if preferred_domain:
-            for idx, row in similarity_df.iterrows():
-                job_domain = self._extract_domain_from_role(row['Type_of_job']).lower()
-                # If job is in the preferred domain, strongly boost its score
-                if preferred_domain == job_domain:
-                    similarity_df.at[idx, 'similarity_score'] = similarity_df.at[idx, 'similarity_score'] * 2.0
-                # Penalize jobs in completely different domains
-                elif preferred_domain != 'general' and job_domain != 'general' and preferred_domain != job_domain:
-                    similarity_df.at[idx, 'similarity_score'] = similarity_df.at[idx, 'similarity_score'] * 0.3
+            similarity_df['similarity_score'] *= ROLE_DOMAINS.boost_factors(similarity_df['domain'], preferred_domain)
+        clock.lap('boost')
         
-        # Sort by similarity score (descending)
-        similarity_df = similarity_df.sort_values('similarity_score', ascending=False)
+        # Sort by similarity score (descending); salary-sorted rows are already in order
+        if sort != 'salary':
+            similarity_df = similarity_df.sort_values('similarity_score', ascending=False)
         
         # Get top recommendations
-        recommendations = []
         top_jobs = similarity_df.head(top_k)
+        clock.lap('sort')
         
-        for _, job_row in top_jobs.iterrows():
-            # Extract domain from job title
-            domain = self._extract_domain_from_role(job_row['Type_of_job'])
-            
+        # Build all reasons in one pass (skipped entirely when explain='none')
+        if explain == 'none':
+            reasons = [None] * len(top_jobs)
+        else:
+            reasons = job_reasons(
+                top_jobs['Type_of_job_lower'].tolist(),
+                top_jobs['domain'].tolist(),
+                top_jobs['location_lower'].tolist(),
+                top_jobs['experience_lower'].tolist(),
+                skills, location, experience,
+                explain
+            )
+        
+        recommendations = []
+        for job_id, company_name, job_title, domain, job_location, salary, experience_required, actively_hiring, score, reason in zip(
+                top_jobs.index.tolist(),  # Use row index as job ID
+                top_jobs['company_name'].tolist(),
+                top_jobs['Type_of_job'].tolist(),
+                top_jobs['domain'].tolist(),
+                top_jobs['location'].tolist(),
+                top_jobs['salary'].tolist(),
+                top_jobs['experience'].tolist(),
+                top_jobs['actively_hiring'].tolist(),
+                top_jobs['similarity_score'].tolist(),
+                reasons):
             recommendation = {
-                'job_id': job_row.name,  # Use row index as job ID
-                'company_name': job_row['company_name'],
-                'job_title': job_row['Type_of_job'],
+                'job_id': job_id,
+                'company_name': company_name,
+                'job_title': job_title,
                 'domain': domain,
-                'location': job_row['location'],
-                'salary': job_row['salary'],
-                'experience_required': job_row['experience'],
-                'actively_hiring': job_row['actively_hiring'],
-                'similarity_score': float(job_row['similarity_score']),
-                'reason': self._generate_recommendation_reason(job_row, skills, location, experience, domain)
+                'location': job_location,
+                'salary': salary,
+                'experience_required': experience_required,
+                'actively_hiring': actively_hiring,
+                'similarity_score': float(score)
             }
+            if reason is not None:
+                recommendation['reason'] = reason
             recommendations.append(recommendation)
+        clock.lap('format')
         
         return recommendations
     
+    def explain(self, skills: str, location: str, experience: str, job_id: int, explain: str = 'full') -> str:
+        """Generate the recommendation reason for a single job on demand."""
+        explain = validate_explain_level(explain)
+        if explain == 'none':
+            raise ValueError("explain must be 'short' or 'full' for a single reason")
+        job_features = self.model['job_features']
+        if job_id not in job_features.index:
+            raise KeyError(f"Job with ID {job_id} not found")
+        row = job_features.loc[job_id]
+        
+        return job_reasons(
+            [row['Type_of_job_lower']], [row['domain']], [row['location_lower']], [row['experience_lower']],
+            skills, location, experience, explain
+        )[0]
+    
     def _extract_domain_from_role(self, role):
         """Extract domain from job role."""
-        role_lower = str(role).lower()
-        # Check for Data Science first (more specific terms)
-        if 'data scientist' in role_lower or 'data analyst' in role_lower or 'data engineer' in role_lower or 'data science' in role_lower:
-            return 'Data Science'
-        # Check for Quality Assurance (before Web Development to avoid conflicts)
-        elif 'testing' in role_lower or 'qa' in role_lower or 'quality' in role_lower or 'tester' in role_lower or 'assurance' in role_lower:
-            return 'Quality Assurance'
-        # Check for Business Development
-        elif 'business development' in role_lower or 'sales' in role_lower or 'business' in role_lower or 'corporate sales' in role_lower:
-            return 'Business Development'
-        # Check for Finance
-        elif 'finance' in role_lower or 'financial' in role_lower or 'account' in role_lower or 'accounts' in role_lower:
-            return 'Finance'
-        # Check for Web Development
-        elif 'web' in role_lower or 'developer' in role_lower or 'engineer' in role_lower or 'frontend' in role_lower or 'backend' in role_lower or 'full stack' in role_lower or 'react' in role_lower or 'angular' in role_lower or 'javascript' in role_lower or 'python' in role_lower:
-            return 'Web Development'
-        # Check for Design
-        elif 'design' in role_lower or 'ui' in role_lower or 'ux' in role_lower or 'graphic' in role_lower or 'visual' in role_lower:
-            return 'Design'
-        # Check for Marketing
-        elif 'marketing' in role_lower or 'digital marketing' in role_lower or 'seo' in role_lower or 'social media' in role_lower:
-            return 'Marketing'
-        # Check for Human Resources
-        elif 'hr' in role_lower or 'human' in role_lower or 'recruitment' in role_lower:
-            return 'Human Resources'
-        # Check for Content Writing
-        elif 'content' in role_lower or 'writer' in role_lower or 'editor' in role_lower:
-            return 'Content Writing'
-        # Check for Growth roles
-        elif 'growth' in role_lower or 'growth catalyst' in role_lower:
-            return 'Business Development'
-        # Check for Insurance roles
-        elif 'insurance' in role_lower or 'consultant' in role_lower:
-            return 'Finance'
-        else:
-            return 'General'
+        return ROLE_DOMAINS.classify(role)
     
     def _generate_recommendation_reason(self, job_row, skills, location, experience, domain):
         """Generate explanation for why this job is recommended."""
-        reasons = []
-        
-        # Skills match
-        if skills:
-            skills_lower = skills.lower()
-            role = job_row['Type_of_job'].lower()
-            # Check for skill matches
-            skill_list = [skill.strip().lower() for skill in skills.split(',')]
-            matched_skills = []
-            for skill in skill_list:
-                # Check if skill is in role description
-                if skill in role or role in skill:
-                    matched_skills.append(skill)
-            
-            # Also check for partial matches
-            if not matched_skills:
-                for skill in skill_list:
-                    # Split skill into words and check each word
-                    skill_words = skill.split()
-                    for word in skill_words:
-                        if len(word) > 2 and word in role:  # Only check words longer than 2 characters
-                            matched_skills.append(skill)
-                            break
-            
-            if matched_skills:
-                # Remove duplicates and format
-                unique_skills = list(set(matched_skills))
-                reasons.append(f"matches your skills ({', '.join(unique_skills)})")
-        
-        # Domain match
-        if domain and domain != 'General':
-            reasons.append(f"matches your domain expertise ({domain})")
-        
-        # Location match
-        job_location = job_row['location'].lower()
-        user_location = location.lower()
-        if user_location and (user_location == job_location or job_location == 'remote'):
-            reasons.append(f"available in your preferred location ({user_location.title()})")
-        
-        # Experience match
-        job_experience = job_row['experience'].lower()
-        user_experience = experience.lower()
-        if user_experience and user_experience in job_experience:
-            reasons.append(f"matches your experience level ({user_experience})")
-        
-        # If no specific reasons, provide a general reason
-        if not reasons:
-            reasons.append("matches your profile based on our AI analysis")
-        
-        return f"This job {' and '.join(reasons)}."
+        return job_reasons(
+            [str(job_row['Type_of_job']).lower()],
+            [domain],
+            [str(job_row['location']).lower()],
+            [str(job_row['experience']).lower()],
+            skills, location, experience
+        )[0]
     
     def print_recommendations(self, skills: str, location: str, experience: str, top_k: int = 5):
         """Print formatted job recommendations."""
@@ -2,15 +2,22 @@
 ML-based job matching system that works with your jobs dataset
 """
 
-import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import joblib
-import re
 import os
+import sys
 from typing import List, Dict
 
+# Shared helpers live next to this module
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from domain_classifier import ROLE_DOMAINS
+from stage_timing import TIMINGS
+from dataset_cache import load_dataset, encode_categoricals, as_text, lower_categorical, CATEGORICAL_COLUMNS
+from salary_parser import add_salary_columns, salary_columns
+from experience_filter import ExperienceFilter
+
 class JobsMatcher:
     """ML-based job matching engine for your jobs dataset."""
     
@@ -26,6 +33,7 @@ class JobsMatcher:
         self.jobs_df = None
         self.model = None
         self.vectorizers = {}
+        self.experience_filter = None
         
         # Regularization parameters
         self.max_features = 100
@@ -45,7 +53,7 @@ class JobsMatcher:
         """Load the jobs dataset from CSV file."""
         try:
             print(f"Loading jobs dataset from: {self.jobs_dataset_path}")
-            self.jobs_df = pd.read_csv(self.jobs_dataset_path)
+            self.jobs_df = load_dataset(self.jobs_dataset_path)
             print(f"Loaded {len(self.jobs_df)} jobs")
             
             # Display column information
@@ -56,36 +64,24 @@ class JobsMatcher:
     
     def _preprocess_data(self):
         """Preprocess jobs data for ML training."""
-        # Create features for jobs
-        job_features = self.jobs_df.copy()
-        
-        # Add numerical salary values
-        job_features['salary_value'] = job_features['salary'].apply(self._parse_salary)
-        
-        return job_features
-    
-    def _parse_salary(self, salary: str) -> float:
-        """Parse salary string to numerical value."""
-        if pd.isna(salary):
-            return 0.0
-        try:
-            # Extract numbers from salary string (e.g., "₹ 2 - 2.5 lpa" -> average of 2 and 2.5)
-            numbers = re.findall(r'\d+\.?\d*', str(salary))
-            if numbers:
-                # Return average if range, otherwise the single value
-                nums = [float(n) for n in numbers]
-                return sum(nums) / len(nums)
-        except:
-            pass
-        return 0.0
+        # The loaded frame is shared read-only; derived columns are added as new arrays
+        jobs = self.jobs_df
+        return jobs.assign(
+            # salary_min/max/mid (float32 INR/year)
+            **salary_columns(jobs['salary']),
+            # Label every job with its domain once, at build time
+            domain=ROLE_DOMAINS.label(jobs['Type_of_job']).astype('category'),
+            # Lowercased location for the query-time filter, computed per distinct value
+            location_lower=lower_categorical(jobs['location'])
+        )
     
     def _create_features(self, job_features):
         """Create feature vectors for jobs."""
         # Combine text features for vectorization
         job_texts = (
-            job_features['Type_of_job'].fillna('') + ' ' +
-            job_features['company_name'].fillna('') + ' ' +
-            job_features['location'].fillna('')
+            as_text(job_features['Type_of_job']) + ' ' +
+            as_text(job_features['company_name']) + ' ' +
+            as_text(job_features['location'])
         )
         
         # Vectorize text features with regularization parameters
@@ -119,9 +115,15 @@ class JobsMatcher:
             'job_vectors': job_vectors,
             'job_features': job_features
         }
+        self._build_experience_filter()
         
         print("Model training completed.")
     
+    def _build_experience_filter(self):
+        """Map the jobs' experience_enc codes to year ranges for eligibility filtering."""
+        job_features = self.model['job_features']
+        self.experience_filter = ExperienceFilter(job_features['experience'], job_features.get('experience_enc'))
+    
     def get_recommendations(self, user_profile: dict, top_k: int = 5) -> List[Dict]:
         """
         Get job recommendations based on user profile.
@@ -137,6 +139,7 @@ class JobsMatcher:
         """
         if not self.model:
             raise ValueError("Model not trained yet. Call train_model() first.")
+        clock = TIMINGS.clock('jobs_matcher')
         
         # Create user text for vectorization
         user_text = (
@@ -147,36 +150,47 @@ class JobsMatcher:
         
         # Transform user text using the existing vectorizer
         user_vector = self.vectorizers['tfidf'].transform([user_text])
+        clock.lap('vectorize')
         
         # Get all jobs for matching
-        all_jobs = self.model['job_features'].copy()
+        all_jobs = self.model['job_features']
+        keep = None
         
         # Filter by location if specified
         preferred_location = user_profile.get('preferred_location', '').lower()
         if preferred_location and preferred_location != 'any':
             # Check if there are jobs in the preferred location
-            location_filtered = all_jobs[
-                (all_jobs['location'].str.lower() == preferred_location) |
-                (all_jobs['location'].str.lower() == 'remote')
-            ]
+            location_mask = all_jobs['location_lower'].isin([preferred_location, 'remote']).to_numpy()
             
             # If jobs available in preferred location or remote, use them
-            if len(location_filtered) > 0:
-                all_jobs = location_filtered
+            if location_mask.any():
+                keep = location_mask
+        
+        # Exclude jobs whose experience range does not fit the candidate's (unless none would be left)
+        experience_mask = self.experience_filter.mask(user_profile.get('experience_level', ''))
+        if experience_mask is not None:
+            eligible = experience_mask if keep is None else keep & experience_mask
+            if eligible.any():
+                keep = eligible
+        if keep is not None:
+            all_jobs = all_jobs[keep]
+        clock.lap('filter')
         
         # Re-vectorize filtered jobs
         job_texts = (
-            all_jobs['Type_of_job'].fillna('') + ' ' +
-            all_jobs['company_name'].fillna('') + ' ' +
-            all_jobs['location'].fillna('')
+            as_text(all_jobs['Type_of_job']) + ' ' +
+            as_text(all_jobs['company_name']) + ' ' +
+            as_text(all_jobs['location'])
         )
         filtered_job_vectors = self.vectorizers['tfidf'].transform(job_texts)
+        clock.lap('revectorize')
         
         # Calculate similarities
         similarities = cosine_similarity(user_vector, filtered_job_vectors).flatten()
         
         # Apply regularization
         similarities = similarities * (1 - self.regularization_strength)
+        clock.lap('score')
         
         # Create a dataframe with similarities for sorting
         similarity_df = all_jobs.copy()
@@ -188,6 +202,7 @@ class JobsMatcher:
         # Get top recommendations
         recommendations = []
         top_jobs = similarity_df.head(top_k)
+        clock.lap('sort')
         
         for _, job_row in top_jobs.iterrows():
             recommendation = {
@@ -201,6 +216,7 @@ class JobsMatcher:
                 'similarity_score': float(job_row['similarity_score'])
             }
             recommendations.append(recommendation)
+        clock.lap('format')
         
         return recommendations
     
@@ -230,6 +246,14 @@ class JobsMatcher:
         self.model = model_data['model']
         self.vectorizers = model_data['vectorizers']
         
+        # Models saved with plain string columns are re-encoded as categoricals
+        job_features = encode_categoricals(self.model['job_features'], CATEGORICAL_COLUMNS + ('domain',))
+        if 'location_lower' not in job_features.columns:
+            job_features['location_lower'] = lower_categorical(job_features['location'])
+        if 'salary_mid' not in job_features.columns:
+            add_salary_columns(job_features, 'salary')
+        self._build_experience_filter()
+        
         # Load configuration if available
         if 'config' in model_data:
             config = model_data['config']
@@ -2,15 +2,32 @@
 ML-based internship matching system that integrates with the existing system
 """
 
-import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import joblib
-import re
 import os
+import sys
 from typing import List, Dict
 
+# Shared helpers live next to this module
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from domain_classifier import ROLE_DOMAINS
+from reason_engine import internship_reasons, validate_explain_level
+from stage_timing import TIMINGS
+from dataset_cache import load_dataset, encode_categoricals, as_text, lower_categorical, CATEGORICAL_COLUMNS
+from salary_parser import salary_columns
+from salary_index import SalaryIndex
+from experience_filter import ExperienceFilter
+from bitmap_index import BitmapIndex, ATTRIBUTE_FIELDS, salary_bands, hiring_flags, candidate_rows, top_by_salary
+
+# Catalogue columns kept as categoricals, including the derived lookup columns
+CATALOGUE_CATEGORICALS = CATEGORICAL_COLUMNS + ('domain', 'role_lower', 'location_lower')
+
+# Catalogue columns read by ranking, formatting and the indexes (all a catalogue store needs to load)
+RANKING_COLUMNS = CATALOGUE_CATEGORICALS + ('stipend_value', 'experience_enc', 'actively_hiring')
+
+
 class MLInternshipMatcher:
     """ML-based internship matching engine that works with the existing system."""
     
@@ -29,6 +46,9 @@ class MLInternshipMatcher:
         self.internships_df = None
         self.model = None
         self.vectorizers = {}
+        self.salary_index = SalaryIndex()
+        self.experience_filter = None
+        self.bitmaps = BitmapIndex(ATTRIBUTE_FIELDS)
         
         # Regularization parameters
         self.max_features = 100
@@ -48,47 +68,47 @@ class MLInternshipMatcher:
         """Load both user and internship datasets from CSV files."""
         try:
             print(f"Loading user dataset from: {self.user_dataset_path}")
-            self.users_df = pd.read_csv(self.user_dataset_path)
+            # Shared, cached frames with NaN values replaced by ''
+            self.users_df = load_dataset(self.user_dataset_path, fill_value='')
             print(f"Loaded {len(self.users_df)} users")
             
             print(f"Loading internship dataset from: {self.internship_dataset_path}")
-            self.internships_df = pd.read_csv(self.internship_dataset_path)
+            self.internships_df = load_dataset(self.internship_dataset_path, fill_value='')
             print(f"Loaded {len(self.internships_df)} internships")
             
-            # Handle NaN values
-            self.users_df = self.users_df.fillna('')
-            self.internships_df = self.internships_df.fillna('')
-            
         except Exception as e:
             print(f"Error loading datasets: {e}")
             raise
     
     def _preprocess_data(self):
         """Preprocess data for ML training."""
-        # Create features for users and internships
-        user_features = self.users_df.copy()
-        internship_features = self.internships_df.copy()
-        
-        # Handle different column naming conventions for stipend/salary
-        salary_col = 'salary' if 'salary' in internship_features.columns else 'stipend'
-        internship_features['stipend_value'] = internship_features[salary_col].apply(self._parse_salary)
+        # The loaded frames are shared read-only; derived columns are added as new arrays
+        user_features = self.users_df
+        internship_features = self._prepare_internship_features(self.internships_df)
         
         return user_features, internship_features
     
-    def _parse_salary(self, salary: str) -> float:
-        """Parse salary string to numerical value."""
-        if pd.isna(salary):
-            return 0.0
-        try:
-            # Extract numbers from salary string (e.g., "₹ 2 - 2.5 lpa" -> average of 2 and 2.5)
-            numbers = re.findall(r'\d+\.?\d*', str(salary))
-            if numbers:
-                # Return average if range, otherwise the single value
-                nums = [float(n) for n in numbers]
-                return sum(nums) / len(nums)
-        except:
-            pass
-        return 0.0
+    def _prepare_internship_features(self, internships):
+        """Frame of internship rows with salary ranges and derived lookup columns added (internships is not modified)."""
+        # Derive domain labels and lowercased lookup columns once, at build time
+        return internships.assign(**self._salary_columns(internships), **self._derived_columns(internships))
+    
+    def _derived_columns(self, internships):
+        """The 'domain', 'role_lower' and 'location_lower' columns used at query time."""
+        role_col = 'Type_of_job' if 'Type_of_job' in internships.columns else 'role'
+        return {
+            'domain': ROLE_DOMAINS.label(internships[role_col]).astype('category'),
+            'role_lower': lower_categorical(internships[role_col]),
+            'location_lower': lower_categorical(internships['location'])
+        }
+    
+    def _salary_columns(self, internships):
+        """salary_min/max/mid (float32 INR/year) and the stipend_value used for ranking."""
+        # Handle different column naming conventions for stipend/salary
+        salary_col = 'salary' if 'salary' in internships.columns else 'stipend'
+        columns = salary_columns(internships[salary_col])
+        columns['stipend_value'] = columns['salary_mid'].fillna(0)
+        return columns
     
     def _create_features(self, user_features, internship_features):
         """Create feature vectors for users and internships."""
@@ -99,22 +119,14 @@ class MLInternshipMatcher:
         user_location_col = 'PreferredLocation' if 'PreferredLocation' in user_features.columns else 'location'
         user_education_col = 'Education' if 'Education' in user_features.columns else 'qualification'
         
-        internship_role_col = 'Type_of_job' if 'Type_of_job' in internship_features.columns else 'role'
-        internship_company_col = 'company_name' if 'company_name' in internship_features.columns else 'company'
-        internship_location_col = 'location'
-        
         user_texts = (
-            user_features[user_skills_col].fillna('') + ' ' +
-            user_features[user_domain_col].fillna('') + ' ' +
-            user_features[user_location_col].fillna('') + ' ' +
-            user_features[user_education_col].fillna('')
+            as_text(user_features[user_skills_col]) + ' ' +
+            as_text(user_features[user_domain_col]) + ' ' +
+            as_text(user_features[user_location_col]) + ' ' +
+            as_text(user_features[user_education_col])
         )
         
-        internship_texts = (
-            internship_features[internship_role_col].fillna('') + ' ' +
-            internship_features[internship_company_col].fillna('') + ' ' +
-            internship_features[internship_location_col].fillna('')
-        )
+        internship_texts = self._internship_texts(internship_features)
         
         # Vectorize text features with regularization parameters
         tfidf = TfidfVectorizer(
@@ -138,6 +150,18 @@ class MLInternshipMatcher:
         
         return user_vectors, internship_vectors
     
+    def _internship_texts(self, internship_features):
+        """Combine role, company and location into the text vectorized for each internship."""
+        internship_role_col = 'Type_of_job' if 'Type_of_job' in internship_features.columns else 'role'
+        internship_company_col = 'company_name' if 'company_name' in internship_features.columns else 'company'
+        internship_location_col = 'location'
+        
+        return (
+            as_text(internship_features[internship_role_col]) + ' ' +
+            as_text(internship_features[internship_company_col]) + ' ' +
+            as_text(internship_features[internship_location_col])
+        )
+    
     def train_model(self):
         """Train the ML model for internship recommendations."""
         print("Preprocessing data...")
@@ -153,22 +177,28 @@ class MLInternshipMatcher:
             'user_features': user_features,
             'internship_features': internship_features
         }
+        self._build_indexes()
         
         print("Model training completed.")
     
-    def get_recommendations(self, user_id: int, top_k: int = 5) -> List[Dict]:
+    def get_recommendations(self, user_id: int, top_k: int = 5, explain: str = 'full',
+                            min_salary: float = None, sort: str = 'relevance') -> List[Dict]:
         """
         Get internship recommendations for a specific user ID.
         
         Args:
             user_id: User ID to get recommendations for
             top_k: Number of recommendations to return
+            explain: Reason detail ('none', 'short' or 'full')
+            min_salary: Drop internships paying less than this (INR/year)
+            sort: 'relevance' (similarity) or 'salary' (best paid first)
         
         Returns:
             List of recommended internships
         """
         if not self.model:
             raise ValueError("Model not trained yet. Call train_model() first.")
+        explain = validate_explain_level(explain)
         
         # Find user index
         user_indices = self.users_df[self.users_df['UserID'] == user_id].index
@@ -176,46 +206,53 @@ class MLInternshipMatcher:
             raise ValueError(f"User with ID {user_id} not found")
         
         user_index = user_indices[0]
+        clock = TIMINGS.clock('ml_internship_user')
         
         # Get user vector
         user_vector = self.model['user_vectors'][user_index]
         
         # Get all internships for matching
-        all_internships = self.model['internship_features'].copy()
+        all_internships = self.model['internship_features']
         internship_vectors = self.model['internship_vectors']
         
-        # Filter by location if user has a preferred location
+        # Filter by location if user has a preferred location, and by salary floor
         user_location = self.users_df.iloc[user_index]['PreferredLocation'].lower()
-        if user_location and user_location != 'any':
-            # Check if there are internships in the preferred location
-            location_filtered = all_internships[
-                (all_internships['location'].str.lower() == user_location) |
-                (all_internships['location'].str.lower() == 'remote')
-            ]
+        rows, location_values = self._candidate_rows(user_location, min_salary,
+                                                     self.users_df.iloc[user_index].get('experience_level', ''))
+        clock.lap('filter')
+        
+        if sort == 'salary':
+            # Best paid candidates straight from the salary index (preferred domain first, as for
+            # profiles); only they are scored
+            preferred_domain = str(self.users_df.iloc[user_index].get('PreferredDomain', '')).lower()
+            positions = self._top_by_salary(rows, location_values, top_k, min_salary, preferred_domain)
+            top_internships = all_internships.iloc[positions].copy()
+            similarities = cosine_similarity(user_vector, internship_vectors[positions]).flatten()
+            top_internships['similarity_score'] = similarities * (1 - self.regularization_strength)
+            clock.lap('sort')
+        else:
+            if rows is not None:
+                positions = self.bitmaps.positions(rows)
+                all_internships = all_internships.iloc[positions]
+                internship_vectors = internship_vectors[positions]
             
-            # If internships available in preferred location or remote, use them
-            if len(location_filtered) > 0:
-                # Get indices of filtered internships
-                filtered_indices = location_filtered.index
-                all_internships = location_filtered
-                internship_vectors = self.model['internship_vectors'][filtered_indices]
-        
-        # Calculate similarities
-        similarities = cosine_similarity(user_vector, internship_vectors).flatten()
-        
-        # Apply regularization
-        similarities = similarities * (1 - self.regularization_strength)
-        
-        # Create a dataframe with similarities for sorting
-        similarity_df = all_internships.copy()
-        similarity_df['similarity_score'] = similarities
-        
-        # Sort by similarity score (descending)
-        similarity_df = similarity_df.sort_values('similarity_score', ascending=False)
-        
-        # Get top recommendations
-        recommendations = []
-        top_internships = similarity_df.head(top_k)
+            # Calculate similarities
+            similarities = cosine_similarity(user_vector, internship_vectors).flatten()
+            
+            # Apply regularization
+            similarities = similarities * (1 - self.regularization_strength)
+            clock.lap('score')
+            
+            # Create a dataframe with similarities for sorting
+            similarity_df = all_internships.copy()
+            similarity_df['similarity_score'] = similarities
+            
+            # Sort by similarity score (descending)
+            similarity_df = similarity_df.sort_values('similarity_score', ascending=False)
+            
+            # Get top recommendations
+            top_internships = similarity_df.head(top_k)
+            clock.lap('sort')
         
         # Get user profile for reason generation
         user_row = self.users_df.iloc[user_index]
@@ -226,129 +263,237 @@ class MLInternshipMatcher:
             'education': user_row['Education']
         }
         
-        for _, internship_row in top_internships.iterrows():
-            # Extract domain properly from the job role
-            job_role = internship_row['Type_of_job']
-            domain = self._extract_domain_from_role(job_role)
-            
-            recommendation = {
-                'internship_id': internship_row.name,  # Use row index as internship ID
-                'company': internship_row['company_name'],
-                'role': job_role,
-                'domain': domain,
-                'location': internship_row['location'],
-                'type': 'Full-time',  # Default value
-                'duration': internship_row.get('experience', 'Not specified'),
-                'stipend': internship_row['salary'],
-                'similarity_score': float(internship_row['similarity_score']),
-                'reason': self._generate_recommendation_reason(internship_row, user_profile)
-            }
-            recommendations.append(recommendation)
-        
+        recommendations = self._format_recommendations(top_internships, user_profile, explain)
+        clock.lap('format')
         return recommendations
     
-    def get_recommendations_for_profile(self, user_profile: dict, top_k: int = 5) -> List[Dict]:
+    def get_recommendations_for_profile(self, user_profile: dict, top_k: int = 5,
+                                        explain: str = 'full', min_salary: float = None,
+                                        sort: str = 'relevance') -> List[Dict]:
         """
         Get internship recommendations for a user profile (used for frontend form data).
         
         Args:
             user_profile: Dictionary with user information
             top_k: Number of recommendations to return
+            explain: Reason detail ('none', 'short' or 'full')
+            min_salary: Drop internships paying less than this (INR/year)
+            sort: 'relevance' (similarity) or 'salary' (best paid first)
         
         Returns:
             List of recommended internships
         """
         if not self.model or not self.vectorizers:
             raise ValueError("Model not trained yet. Call train_model() first.")
+        explain = validate_explain_level(explain)
+        clock = TIMINGS.clock('ml_internship')
         
-        # Get user's preferred domain
-        preferred_domain = str(user_profile.get('preferred_domain', '')).lower()
+        # Transform user text using the existing vectorizer
+        user_vector = self.vectorizers['tfidf'].transform([self._profile_text(user_profile)])
+        clock.lap('vectorize')
+        
+        # Calculate similarities against the whole catalogue
+        similarities = cosine_similarity(user_vector, self.model['internship_vectors']).flatten()
+        clock.lap('score')
+        
+        return self._rank_profile(user_profile, similarities, top_k, explain, min_salary, sort)
+    
+    def get_recommendations_for_profiles(self, user_profiles: List[dict], top_k: int = 5,
+                                         batch_size: int = 64, explain: str = 'full', min_salary: float = None,
+                                         sort: str = 'relevance') -> List[List[Dict]]:
+        """
+        Get internship recommendations for many user profiles at once.
+        
+        Profiles are vectorized and scored against the catalogue in batches, so bulk
+        callers (e.g. resume ingestion) avoid a transform and similarity call per profile.
+        
+        Args:
+            user_profiles: List of user profile dictionaries
+            top_k: Number of recommendations to return per profile
+            batch_size: Number of profiles scored per similarity call
+            explain: Reason detail ('none', 'short' or 'full')
+            min_salary: Drop internships paying less than this (INR/year)
+            sort: 'relevance' (similarity) or 'salary' (best paid first)
         
+        Returns:
+            List of recommendation lists, in the same order as user_profiles
+        """
+        if not self.model or not self.vectorizers:
+            raise ValueError("Model not trained yet. Call train_model() first.")
+        explain = validate_explain_level(explain)
+        
+        results = []
+        for start in range(0, len(user_profiles), batch_size):
+            batch = user_profiles[start:start + batch_size]
+            clock = TIMINGS.clock('ml_internship_batch')
+            user_vectors = self.vectorizers['tfidf'].transform([self._profile_text(p) for p in batch])
+            clock.lap('vectorize')
+            similarities = cosine_similarity(user_vectors, self.model['internship_vectors'])
+            clock.lap('score')
+            for user_profile, profile_similarities in zip(batch, similarities):
+                results.append(self._rank_profile(user_profile, profile_similarities, top_k, explain,
+                                                  min_salary, sort))
+        
+        return results
+    
+    def _profile_text(self, user_profile: dict) -> str:
+        """Build the text used to vectorize a user profile."""
         # Create user text for vectorization with stronger domain preference
         # Repeat the domain preference to give it more weight
         domain_preference = str(user_profile.get('preferred_domain', ''))
-        user_text = (
+        return (
             str(user_profile.get('skills', '')) + ' ' +
             domain_preference + ' ' + domain_preference + ' ' + domain_preference + ' ' +  # Weight domain preference more heavily
             str(user_profile.get('preferred_location', '')) + ' ' +
             str(user_profile.get('education', ''))
         )
+    
+    def _candidate_rows(self, preferred_location: str, min_salary: float = None, experience_level: str = ''):
+        """Rows eligible for ranking as (bitmap or None for every row, location bucket values or None)."""
+        return candidate_rows(self.bitmaps, self.salary_index, self.experience_filter, preferred_location,
+                              min_salary, experience_level)
+    
+    def _top_by_salary(self, rows, location_values, top_k: int, min_salary: float = None,
+                       preferred_domain: str = '') -> List[int]:
+        """Row positions of the best paid candidates, from the preferred domain when it has any."""
+        domains = ROLE_DOMAINS.labels_matching(preferred_domain) if preferred_domain else ()
+        return top_by_salary(self.bitmaps, self.salary_index, rows, location_values, top_k, min_salary, domains)
+    
+    def _rank_profile(self, user_profile: dict, similarities, top_k: int, explain: str = 'full',
+                      min_salary: float = None, sort: str = 'relevance') -> List[Dict]:
+        """Filter, boost and rank the catalogue for a profile given its raw similarities."""
+        clock = TIMINGS.clock('ml_internship')
         
-        # Transform user text using the existing vectorizer
-        user_vector = self.vectorizers['tfidf'].transform([user_text])
+        # Get user's preferred domain
+        preferred_domain = str(user_profile.get('preferred_domain', '')).lower()
         
         # Get all internships for matching
-        all_internships = self.model['internship_features'].copy()
-        internship_vectors = self.model['internship_vectors']
+        all_internships = self.model['internship_features']
         
-        # Filter by location if specified
+        # Filter by location if specified, and by salary floor
         preferred_location = user_profile.get('preferred_location', '').lower()
-        if preferred_location and preferred_location != 'any':
-            # Check if there are internships in the preferred location
-            location_filtered = all_internships[
-                (all_internships['location'].str.lower() == preferred_location) |
-                (all_internships['location'].str.lower() == 'remote')
-            ]
-            
-            # If internships available in preferred location or remote, use them
-            if len(location_filtered) > 0:
-                # Get indices of filtered internships
-                filtered_indices = location_filtered.index
-                all_internships = location_filtered
-                internship_vectors = self.model['internship_vectors'][filtered_indices]
-        
-        # Calculate similarities
-        similarities = cosine_similarity(user_vector, internship_vectors).flatten()
-        
-        # Apply regularization
-        similarities = similarities * (1 - self.regularization_strength)
+        rows, location_values = self._candidate_rows(preferred_location, min_salary,
+                                                     user_profile.get('experience_level', ''))
+        clock.lap('filter')
+        
+        if sort == 'salary':
+            # Best paid candidates straight from the salary index, no sort over the catalogue
+            positions = self._top_by_salary(rows, location_values, top_k, min_salary, preferred_domain)
+            top_internships = all_internships.iloc[positions].copy()
+            top_internships['similarity_score'] = similarities[positions] * (1 - self.regularization_strength)
+            if preferred_domain:
+                top_internships['similarity_score'] *= ROLE_DOMAINS.boost_factors(top_internships['domain'],
+                                                                                  preferred_domain)
+            clock.lap('sort')
+            recommendations = self._format_recommendations(top_internships, user_profile, explain)
+            clock.lap('format')
+            return recommendations
+        
+        if rows is not None:
+            positions = self.bitmaps.positions(rows)
+            all_internships = all_internships.iloc[positions]
+            similarities = similarities[positions]
         
         # Create a dataframe with similarities for sorting
         similarity_df = all_internships.copy()
-        similarity_df['similarity_score'] = similarities
+        
+        # Apply regularization
+        similarity_df['similarity_score'] = similarities * (1 - self.regularization_strength)
         
         # Strongly boost scores for jobs in the preferred domain
         if preferred_domain:
-            for idx, row in similarity_df.iterrows():
-                job_domain = self._extract_domain_from_role(row['Type_of_job']).lower()
-                # If job is in the preferred domain, strongly boost its score
-                if preferred_domain == job_domain:
-                    similarity_df.at[idx, 'similarity_score'] = similarity_df.at[idx, 'similarity_score'] * 2.0
-                # For Web Development specifically, also boost related tech roles
-                elif preferred_domain == 'web development' and job_domain == 'web development':
-                    similarity_df.at[idx, 'similarity_score'] = similarity_df.at[idx, 'similarity_score'] * 2.0
-                # Penalize jobs in completely different domains
-                elif preferred_domain != 'general' and job_domain != 'general' and preferred_domain != job_domain:
-                    similarity_df.at[idx, 'similarity_score'] = similarity_df.at[idx, 'similarity_score'] * 0.3
+            similarity_df['similarity_score'] *= ROLE_DOMAINS.boost_factors(similarity_df['domain'], preferred_domain)
+        clock.lap('boost')
         
         # Sort by similarity score (descending)
         similarity_df = similarity_df.sort_values('similarity_score', ascending=False)
         
         # Get top recommendations
-        recommendations = []
         top_internships = similarity_df.head(top_k)
+        clock.lap('sort')
         
-        for _, internship_row in top_internships.iterrows():
-            # Extract domain properly from the job role
-            job_role = internship_row['Type_of_job']
-            domain = self._extract_domain_from_role(job_role)
-            
+        recommendations = self._format_recommendations(top_internships, user_profile, explain)
+        clock.lap('format')
+        return recommendations
+    
+    def _format_recommendations(self, top_internships, user_profile: dict, explain: str = 'full') -> List[Dict]:
+        """
+        Turn the ranked top rows into recommendation dicts, building all reasons in one pass.
+        
+        With explain='none' no reasons are generated and the 'reason' key is omitted;
+        they can be fetched later per internship with explain().
+        """
+        if explain == 'none':
+            reasons = [None] * len(top_internships)
+        else:
+            reasons = internship_reasons(
+                top_internships['role_lower'].tolist(),
+                top_internships['domain'].tolist(),
+                top_internships['location_lower'].tolist(),
+                user_profile,
+                explain
+            )
+        if 'experience' in top_internships.columns:
+            durations = top_internships['experience'].tolist()
+        else:
+            durations = ['Not specified'] * len(top_internships)
+        
+        recommendations = []
+        for internship_id, company, job_role, domain, location, duration, stipend, score, reason in zip(
+                top_internships.index.tolist(),  # Use row index as internship ID
+                top_internships['company_name'].tolist(),
+                top_internships['Type_of_job'].tolist(),
+                top_internships['domain'].tolist(),
+                top_internships['location'].tolist(),
+                durations,
+                top_internships['salary'].tolist(),
+                top_internships['similarity_score'].tolist(),
+                reasons):
             recommendation = {
-                'internship_id': internship_row.name,  # Use row index as internship ID
-                'company': internship_row['company_name'],
+                'internship_id': internship_id,
+                'company': company,
                 'role': job_role,
                 'domain': domain,
-                'location': internship_row['location'],
+                'location': location,
                 'type': 'Full-time',  # Default value
-                'duration': internship_row.get('experience', 'Not specified'),
-                'stipend': internship_row['salary'],
-                'similarity_score': float(internship_row['similarity_score']),
-                'reason': self._generate_recommendation_reason(internship_row, user_profile)
+                'duration': duration,
+                'stipend': stipend,
+                'similarity_score': float(score)
             }
+            if reason is not None:
+                recommendation['reason'] = reason
             recommendations.append(recommendation)
         
         return recommendations
     
+    def explain(self, user_profile: dict, internship_id: int, explain: str = 'full') -> str:
+        """
+        Generate the recommendation reason for a single internship on demand.
+        
+        Args:
+            user_profile: Dictionary with user information
+            internship_id: Internship ID as returned in recommendations
+            explain: Reason detail ('short' or 'full')
+        
+        Returns:
+            The recommendation reason
+        """
+        if not self.model:
+            raise ValueError("Model not trained yet. Call train_model() first.")
+        explain = validate_explain_level(explain)
+        if explain == 'none':
+            raise ValueError("explain must be 'short' or 'full' for a single reason")
+        
+        internship_features = self.model['internship_features']
+        if internship_id not in internship_features.index:
+            raise KeyError(f"Internship with ID {internship_id} not found")
+        row = internship_features.loc[internship_id]
+        
+        return internship_reasons(
+            [row['role_lower']], [row['domain']], [row['location_lower']],
+            user_profile, explain
+        )[0]
+    
     def save_model(self, filepath: str):
         """Save the trained model using joblib."""
         if not self.model:
@@ -375,6 +520,20 @@ class MLInternshipMatcher:
         self.model = model_data['model']
         self.vectorizers = model_data['vectorizers']
         
+        # Models saved before the derived columns were added lack them
+        internship_features = self.model['internship_features']
+        derived = {}
+        if 'location_lower' not in internship_features.columns:
+            derived.update(self._derived_columns(internship_features))
+        if 'salary_mid' not in internship_features.columns:
+            derived.update(self._salary_columns(internship_features))
+        if derived:
+            internship_features = self.model['internship_features'] = internship_features.assign(**derived)
+        self._build_indexes()
+        
+        # Models saved with plain string columns are re-encoded as categoricals
+        encode_categoricals(internship_features, CATALOGUE_CATEGORICALS)
+        
         # Load configuration if available
         if 'config' in model_data:
             config = model_data['config']
@@ -386,98 +545,49 @@ class MLInternshipMatcher:
         
         print(f"Model loaded from {filepath}")
     
+    def use_catalogue_store(self, store):
+        """
+        Serve recommendations from a catalogue built by streaming_ingest.
+        
+        The store must have been vectorized with this model's vectorizer; its vectors
+        stay memory-mapped and only the RANKING_COLUMNS are loaded.
+        """
+        if not self.model or not self.vectorizers:
+            raise ValueError("Model not trained yet. Call train_model() first.")
+        if store.meta['n_features'] != len(self.vectorizers['tfidf'].vocabulary_):
+            raise ValueError("Catalogue store was built with a different vectorizer")
+        self.model['internship_vectors'] = store.vectors()
+        self.model['internship_features'] = encode_categoricals(store.features(list(RANKING_COLUMNS)),
+                                                                CATALOGUE_CATEGORICALS)
+        self._build_indexes()
+    
+    def _build_indexes(self):
+        """Index the catalogue's stipend values by location and domain, and its attributes as bitmaps."""
+        internship_features = self.model['internship_features']
+        self.salary_index.rebuild(internship_features['stipend_value'].to_numpy(), {
+            'location': internship_features['location_lower'],
+            'domain': internship_features['domain']
+        })
+        self.experience_filter = ExperienceFilter(internship_features['experience'],
+                                                  internship_features.get('experience_enc'))
+        self.bitmaps.rebuild({
+            'location': internship_features['location_lower'],
+            'domain': internship_features['domain'],
+            'experience': self.experience_filter.codes,
+            'actively_hiring': hiring_flags(internship_features),
+            'salary_band': salary_bands(internship_features['stipend_value'])
+        })
+    
     def _extract_domain_from_role(self, role):
         """Extract domain from job role."""
-        role_lower = str(role).lower()
-        # Check for Data Science first (more specific terms)
-        if 'data scientist' in role_lower or 'data analyst' in role_lower or 'data engineer' in role_lower or 'data science' in role_lower:
-            return 'Data Science'
-        # Check for Quality Assurance (before Web Development to avoid conflicts)
-        elif 'testing' in role_lower or 'qa' in role_lower or 'quality' in role_lower or 'tester' in role_lower or 'assurance' in role_lower:
-            return 'Quality Assurance'
-        # Check for Business Development
-        elif 'business development' in role_lower or 'sales' in role_lower or 'business' in role_lower or 'corporate sales' in role_lower:
-            return 'Business Development'
-        # Check for Finance
-        elif 'finance' in role_lower or 'financial' in role_lower or 'account' in role_lower or 'accounts' in role_lower:
-            return 'Finance'
-        # Check for Web Development
-        elif 'web' in role_lower or 'developer' in role_lower or 'engineer' in role_lower or 'frontend' in role_lower or 'backend' in role_lower or 'full stack' in role_lower or 'react' in role_lower or 'angular' in role_lower or 'javascript' in role_lower or 'python' in role_lower:
-            return 'Web Development'
-        # Check for Design
-        elif 'design' in role_lower or 'ui' in role_lower or 'ux' in role_lower or 'graphic' in role_lower or 'visual' in role_lower:
-            return 'Design'
-        # Check for Marketing
-        elif 'marketing' in role_lower or 'digital marketing' in role_lower or 'seo' in role_lower or 'social media' in role_lower:
-            return 'Marketing'
-        # Check for Human Resources
-        elif 'hr' in role_lower or 'human' in role_lower or 'recruitment' in role_lower:
-            return 'Human Resources'
-        # Check for Content Writing
-        elif 'content' in role_lower or 'writer' in role_lower or 'editor' in role_lower:
-            return 'Content Writing'
-        # Check for Growth roles
-        elif 'growth' in role_lower or 'growth catalyst' in role_lower:
-            return 'Business Development'
-        # Check for Insurance roles
-        elif 'insurance' in role_lower or 'consultant' in role_lower:
-            return 'Finance'
-        else:
-            return 'General'
+        return ROLE_DOMAINS.classify(role)
     
     def _generate_recommendation_reason(self, internship_row, user_profile):
         """Generate explanation for why this internship is recommended."""
-        reasons = []
-        
-        # Skills match
-        if user_profile.get('skills'):
-            skills = user_profile['skills'].lower()
-            role = internship_row['Type_of_job'].lower()
-            # Check for skill matches
-            skill_list = [skill.strip().lower() for skill in skills.split(',')]
-            matched_skills = []
-            for skill in skill_list:
-                # Check if skill is in role description
-                if skill in role or role in skill:
-                    matched_skills.append(skill)
-            
-            # Also check for partial matches
-            if not matched_skills:
-                for skill in skill_list:
-                    # Split skill into words and check each word
-                    skill_words = skill.split()
-                    for word in skill_words:
-                        if len(word) > 2 and word in role:  # Only check words longer than 2 characters
-                            matched_skills.append(skill)
-                            break
-            
-            if matched_skills:
-                # Remove duplicates and format
-                unique_skills = list(set(matched_skills))
-                reasons.append(f"matches your skills ({', '.join(unique_skills)})")
-        
-        # Domain match - more explicit checking
-        user_domain = user_profile.get('preferred_domain', '').lower()
-        internship_domain = self._extract_domain_from_role(internship_row['Type_of_job']).lower()
-        
-        # If user specified a domain preference, check for match
-        if user_domain and user_domain != 'general':
-            if user_domain == internship_domain:
-                reasons.append(f"matches your preferred domain ({user_domain.title()})")
-            elif user_domain in internship_domain or internship_domain in user_domain:
-                reasons.append(f"related to your preferred domain ({user_domain.title()})")
-            # Additional check for Web Development
-            elif user_domain == 'web development' and internship_domain == 'web development':
-                reasons.append(f"matches your preferred domain ({user_domain.title()})")
-        
-        # Location match
-        user_location = user_profile.get('preferred_location', '').lower()
-        internship_location = internship_row['location'].lower()
-        if user_location and (user_location == internship_location or internship_location == 'remote'):
-            reasons.append(f"available in your preferred location ({user_location.title()})")
-        
-        # If no specific reasons, provide a general reason
-        if not reasons:
-            reasons.append("matches your profile based on our AI analysis")
-        
-        return f"This internship {' and '.join(reasons)}."
+        role = internship_row['Type_of_job']
+        return internship_reasons(
+            [str(role).lower()],
+            [self._extract_domain_from_role(role)],
+            [str(internship_row['location']).lower()],
+            user_profile
+        )[0]
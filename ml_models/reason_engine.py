@@ -0,0 +1,142 @@
+"""
+Recommendation reason generation shared by the ML matchers
+The query skills are tokenized once per request and reasons for all top-k rows are
+built in one pass over pre-lowercased role, location and experience columns.
+
+Callers choose the explanation detail: 'full' joins every matching clause, 'short'
+keeps only the first one and 'none' skips reason generation entirely.
+"""
+
+from typing import Dict, List, Sequence
+
+EXPLAIN_LEVELS = ('none', 'short', 'full')
+
+
+def validate_explain_level(level) -> str:
+    """Normalize an explanation detail level, raising ValueError for unknown values."""
+    level = str(level).lower()
+    if level not in EXPLAIN_LEVELS:
+        raise ValueError(f"explain must be one of {list(EXPLAIN_LEVELS)}")
+    return level
+
+
+class SkillQuery:
+    """A user's comma-separated skills, tokenized once and matched against many roles."""
+
+    def __init__(self, skills: str):
+        self.skill_list = [skill.strip() for skill in str(skills).lower().split(',')]
+        # Words longer than 2 characters are used for partial matches
+        self.skill_words = [[word for word in skill.split() if len(word) > 2] for skill in self.skill_list]
+        self._matches = {}
+
+    def matched_skills(self, role_lower: str) -> List[str]:
+        """Skills contained in the role (or containing it), falling back to word-level matches."""
+        matched = self._matches.get(role_lower)
+        if matched is not None:
+            return matched
+
+        # Check if skill is in role description
+        matched = [skill for skill in self.skill_list if skill in role_lower or role_lower in skill]
+
+        # Also check for partial matches
+        if not matched:
+            for skill, words in zip(self.skill_list, self.skill_words):
+                for word in words:
+                    if word in role_lower:
+                        matched.append(skill)
+                        break
+
+        self._matches[role_lower] = matched
+        return matched
+
+    def skills_reason(self, role_lower: str):
+        """Return the 'matches your skills' clause for a role, or None."""
+        matched = self.matched_skills(role_lower)
+        if not matched:
+            return None
+        # Remove duplicates and format
+        unique_skills = list(set(matched))
+        return f"matches your skills ({', '.join(unique_skills)})"
+
+
+def internship_reasons(roles_lower: Sequence[str], domains: Sequence[str], locations_lower: Sequence[str],
+                       user_profile: Dict, detail: str = 'full') -> List[str]:
+    """Build the reason for every recommended internship row."""
+    skills = user_profile.get('skills')
+    skill_query = SkillQuery(skills) if skills else None
+    user_domain = user_profile.get('preferred_domain', '').lower()
+    user_location = user_profile.get('preferred_location', '').lower()
+
+    reasons_list = []
+    for role_lower, domain, internship_location in zip(roles_lower, domains, locations_lower):
+        reasons = []
+
+        # Skills match
+        if skill_query:
+            skills_reason = skill_query.skills_reason(role_lower)
+            if skills_reason:
+                reasons.append(skills_reason)
+
+        # If user specified a domain preference, check for match
+        internship_domain = domain.lower()
+        if user_domain and user_domain != 'general':
+            if user_domain == internship_domain:
+                reasons.append(f"matches your preferred domain ({user_domain.title()})")
+            elif user_domain in internship_domain or internship_domain in user_domain:
+                reasons.append(f"related to your preferred domain ({user_domain.title()})")
+
+        # Location match
+        if user_location and (user_location == internship_location or internship_location == 'remote'):
+            reasons.append(f"available in your preferred location ({user_location.title()})")
+
+        # If no specific reasons, provide a general reason
+        if not reasons:
+            reasons.append("matches your profile based on our AI analysis")
+        elif detail == 'short':
+            reasons = reasons[:1]
+
+        reasons_list.append(f"This internship {' and '.join(reasons)}.")
+
+    return reasons_list
+
+
+def job_reasons(roles_lower: Sequence[str], domains: Sequence[str], locations_lower: Sequence[str],
+                experiences_lower: Sequence[str], skills: str, location: str, experience: str,
+                detail: str = 'full') -> List[str]:
+    """Build the reason for every recommended job row."""
+    skill_query = SkillQuery(skills) if skills else None
+    user_location = location.lower()
+    user_experience = experience.lower()
+
+    reasons_list = []
+    for role_lower, domain, job_location, job_experience in zip(roles_lower, domains, locations_lower,
+                                                                experiences_lower):
+        reasons = []
+
+        # Skills match
+        if skill_query:
+            skills_reason = skill_query.skills_reason(role_lower)
+            if skills_reason:
+                reasons.append(skills_reason)
+
+        # Domain match
+        if domain and domain != 'General':
+            reasons.append(f"matches your domain expertise ({domain})")
+
+        # Location match
+        if user_location and (user_location == job_location or job_location == 'remote'):
+            reasons.append(f"available in your preferred location ({user_location.title()})")
+
+        # Experience match
+        if user_experience and user_experience in job_experience:
+            reasons.append(f"matches your experience level ({user_experience})")
+
+        # If no specific reasons, provide a general reason
+        if not reasons:
+            reasons.append("matches your profile based on our AI analysis")
+        elif detail == 'short':
+            reasons = reasons[:1]
+
+        reasons_list.append(f"This job {' and '.join(reasons)}.")
+
+    return reasons_list
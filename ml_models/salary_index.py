@@ -0,0 +1,130 @@
+"""
+Sorted salary index for salary floors and salary-ordered top-k
+Row positions are kept sorted by salary (highest first, ties in catalogue
+order) for the whole catalogue and for every bucket of the indexed fields
+(e.g. each location and each domain). A "salary >= X" filter is a binary search
+giving a prefix of each bucket, and the salary-ordered top-k over several
+buckets is a lazy merge of those prefixes, so neither needs a per-request sort.
+"""
+
+import heapq
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from dataset_cache import lowercase_codes
+
+
+# (positions sorted by salary descending, their negated salaries - ascending, for searchsorted)
+SortedRows = Tuple[np.ndarray, np.ndarray]
+
+
+def _normalize(value) -> str:
+    return str(value).lower()
+
+
+class SalaryIndex:
+    """Salary-sorted row positions overall and per (field, value) bucket."""
+
+    def __init__(self, fields: Sequence[str] = ('location', 'domain')):
+        self.fields = tuple(fields)
+        self._lock = threading.Lock()
+        self.rebuild(np.empty(0), {field: [] for field in self.fields})
+
+    def rebuild(self, salaries, keys: Dict[str, Iterable]):
+        """
+        Index a whole catalogue.
+
+        Args:
+            salaries: Salary per row (NaN counts as 0)
+            keys: Field -> value per row for each indexed field (matched case-insensitively)
+        """
+        salaries = np.nan_to_num(np.asarray(salaries, dtype=np.float64), nan=0.0)
+        codes = {field: lowercase_codes(keys[field]) for field in self.fields}
+        positions = np.arange(len(salaries))
+        with self._lock:
+            self._salaries = salaries
+            order = np.lexsort((positions, -salaries))
+            self._all = (order, -salaries[order])
+            self._buckets: Dict[str, Dict[str, SortedRows]] = {}
+            for field, (field_codes, uniques) in codes.items():
+                # One sort per field: by bucket, then salary (descending), then position
+                order = np.lexsort((positions, -salaries, field_codes))
+                bounds = np.searchsorted(field_codes[order], np.arange(len(uniques) + 1))
+                self._buckets[field] = {}
+                for i, value in enumerate(uniques):
+                    bucket = order[bounds[i]:bounds[i + 1]]
+                    self._buckets[field][value] = (bucket, -salaries[bucket])
+
+    def add(self, salaries, keys: Dict[str, Iterable]):
+        """Append newly ingested rows, re-sorting only the buckets they land in."""
+        salaries = np.nan_to_num(np.asarray(salaries, dtype=np.float64), nan=0.0)
+        if not len(salaries):
+            return
+        with self._lock:
+            start = len(self._salaries)
+            self._salaries = np.concatenate([self._salaries, salaries])
+            positions = np.arange(start, len(self._salaries))
+            self._all = self._merge(self._all[0], positions)
+            for field in self.fields:
+                new_positions: Dict[str, List[int]] = {}
+                for position, value in zip(positions.tolist(), keys[field]):
+                    new_positions.setdefault(_normalize(value), []).append(position)
+                buckets = self._buckets[field]
+                for value, bucket_positions in new_positions.items():
+                    existing = buckets[value][0] if value in buckets else np.empty(0, dtype=np.int64)
+                    buckets[value] = self._merge(existing, np.asarray(bucket_positions, dtype=np.int64))
+
+    def _merge(self, order: np.ndarray, positions: np.ndarray) -> SortedRows:
+        combined = np.concatenate([order, positions])
+        combined = combined[np.lexsort((combined, -self._salaries[combined]))]
+        return combined, -self._salaries[combined]
+
+    def __len__(self) -> int:
+        return len(self._salaries)
+
+    def _prefixes(self, field: Optional[str], values: Iterable, min_salary: Optional[float]) -> List[np.ndarray]:
+        """Each selected bucket's rows with salary >= min_salary (a prefix, found by binary search)."""
+        if field is None:
+            rows = [self._all]
+        else:
+            buckets = self._buckets[field]
+            rows = [buckets[value] for value in dict.fromkeys(_normalize(value) for value in values) if value in buckets]
+        if min_salary is None:
+            return [order for order, _ in rows]
+        return [order[:np.searchsorted(keys, -min_salary, side='right')] for order, keys in rows]
+
+    def at_least(self, min_salary: float, field: Optional[str] = None, values: Iterable = ()) -> np.ndarray:
+        """Sorted positions with salary >= min_salary (within the given buckets of field, if any)."""
+        with self._lock:
+            prefixes = self._prefixes(field, values, min_salary)
+        return np.sort(np.concatenate(prefixes)) if prefixes else np.empty(0, dtype=np.int64)
+
+    def mask_at_least(self, min_salary: float, field: Optional[str] = None, values: Iterable = ()) -> np.ndarray:
+        """at_least() as a boolean mask over all rows."""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.at_least(min_salary, field, values)] = True
+        return mask
+
+    def top(self, k: int, field: Optional[str] = None, values: Iterable = (), min_salary: Optional[float] = None,
+            allowed: Optional[np.ndarray] = None) -> List[int]:
+        """
+        Positions of the k highest salaries, highest first (ties in catalogue order).
+
+        Args:
+            k: Number of positions to return
+            field, values: Restrict to these buckets of field (the whole catalogue when field is None)
+            min_salary: Skip rows below this salary
+            allowed: Boolean mask over all rows; rows where it is False are skipped
+        """
+        with self._lock:
+            salaries = self._salaries
+            prefixes = self._prefixes(field, values, min_salary)
+        # The overall top k lies within the first k allowed rows of each bucket
+        heads = [(prefix[allowed[prefix]] if allowed is not None else prefix)[:k].tolist() for prefix in prefixes]
+        if len(heads) == 1:
+            return heads[0]
+        # Buckets of one field are disjoint, so merging them never yields a row twice
+        merged = heapq.merge(*heads, key=lambda position: (-salaries[position], position))
+        return [position for _, position in zip(range(k), merged)]
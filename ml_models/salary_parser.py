@@ -0,0 +1,104 @@
+"""
+Vectorized salary/stipend parsing
+Turns salary strings such as "₹  2 - 2.5 lpa", "₹ 15,000 /month" or "Unpaid" into
+salary_min, salary_max and salary_mid in one unit, INR per year, as float32.
+Each distinct string is parsed once with pandas string operations and the
+results are spread back to the rows by their codes, so a catalogue with a few
+hundred distinct salary strings costs a few hundred parses, not one per row.
+
+Amounts are scaled by their unit (k / thousand, lakh / lpa, crore) and by their
+period (per month, per week); amounts without a period are taken as yearly.
+Durations ("3 months", "4 weeks") are not amounts or periods and are ignored.
+Unpaid stipends are 0 and strings without an amount ("competitive salary") are NaN.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+SALARY_COLUMNS = ['salary_min', 'salary_max', 'salary_mid']
+
+# Unit multipliers, checked in order (the first unit found applies to every amount in the string)
+UNIT_PATTERNS = [
+    (r'crores?|\d\s*cr\b', 1e7),
+    (r'lpa|lakhs?|lacs?|\d\s*l\b', 1e5),
+    (r'thousand|\d\s*k\b', 1e3),
+]
+
+# Period multipliers to a yearly amount
+PERIOD_PATTERNS = [
+    (r'month|/\s*mo\b|\bp\.?m\b', 12),
+    (r'week|/\s*wk\b', 52),
+]
+
+# A number directly followed by a period unit is a duration ("4 weeks stipend 5000"), not a rate
+DURATION_PATTERN = r'\d+(?:\.\d+)?(?:\s*(?:-|to)\s*\d+(?:\.\d+)?)?\s*(?:months?|weeks?)\b'
+
+UNPAID_PATTERN = r'unpaid|\bnil\b|no stipend'
+
+
+def _parse_unique(text: pd.Series) -> np.ndarray:
+    """(len(text), 3) float32 array of min/max/mid for distinct lowercased salary strings."""
+    text = text.str.lower().str.replace(r'(?<=\d),(?=\d)', '', regex=True)
+    text = text.str.replace(DURATION_PATTERN, ' ', regex=True)
+
+    numbers = text.str.extractall(r'(\d+(?:\.\d+)?)')[0].astype(np.float64)
+    bounds = numbers.groupby(level=0).agg(['min', 'max']).reindex(range(len(text)))
+    low = bounds['min'].to_numpy()
+    high = bounds['max'].to_numpy()
+
+    scale = np.ones(len(text))
+    for patterns in (UNIT_PATTERNS, PERIOD_PATTERNS):
+        # Only the first unit and the first period found in a string apply
+        found = np.zeros(len(text), dtype=bool)
+        for pattern, multiplier in patterns:
+            matched = text.str.contains(pattern, regex=True).to_numpy() & ~found
+            scale[matched] *= multiplier
+            found |= matched
+
+    low = low * scale
+    high = high * scale
+    unpaid = text.str.contains(UNPAID_PATTERN, regex=True).to_numpy()
+    low[unpaid] = high[unpaid] = 0.0
+    return np.column_stack([low, high, (low + high) / 2]).astype(np.float32)
+
+
+def parse_salaries(values: pd.Series) -> pd.DataFrame:
+    """
+    Parse a column of salary strings.
+
+    Args:
+        values: Salary strings (plain or categorical; missing cells give NaN)
+
+    Returns:
+        DataFrame with float32 salary_min, salary_max and salary_mid (INR/year), aligned with values
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values)
+    parsed = _parse_unique(pd.Series(np.asarray(uniques, dtype=object), dtype=object).astype(str))
+
+    # Code -1 (missing) picks the trailing NaN row
+    table = np.vstack([parsed, np.full((1, 3), np.nan, dtype=np.float32)])
+    return pd.DataFrame(table[codes], index=values.index, columns=SALARY_COLUMNS)
+
+
+def salary_columns(values: pd.Series) -> Dict[str, pd.Series]:
+    """salary_min, salary_max and salary_mid parsed from values, as separate columns for DataFrame.assign."""
+    salaries = parse_salaries(values)
+    return {name: salaries[name] for name in SALARY_COLUMNS}
+
+
+def add_salary_columns(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Add salary_min, salary_max and salary_mid parsed from `column` to df (in place)."""
+    for name, values in salary_columns(df[column]).items():
+        df[name] = values
+    return df
+
+
+def parse_salary(value) -> Tuple[float, float, float]:
+    """(salary_min, salary_max, salary_mid) for a single salary string."""
+    low, high, mid = parse_salaries(pd.Series([value], dtype=object)).iloc[0].tolist()
+    return low, high, mid
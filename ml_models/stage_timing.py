@@ -0,0 +1,242 @@
+"""
+Low-overhead per-stage latency instrumentation for the recommendation pipelines
+
+Pipelines either wrap a stage in `TIMINGS.stage(pipeline, stage)` or start a
+`TIMINGS.clock(pipeline)` and call `lap(stage)` as each stage ends. Durations are
+aggregated into fixed-bucket histograms and, when a request trace is active, also
+collected per request (used for the X-Timing response header).
+
+Sampling is decided once per trace: unsampled requests get shared no-op stages and
+clocks, so the cost of an instrumented stage is a context-variable lookup.
+"""
+
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Sequence, Tuple
+
+# Histogram bucket upper bounds in seconds (the last bucket is +Inf)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (thread-safe)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """(upper bound, cumulative count) pairs ending with (+Inf, count)."""
+        with self._lock:
+            counts = list(self.counts)
+        cumulative, total = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket (capped at the observed max)."""
+        cumulative = self.cumulative_counts()
+        total = cumulative[-1][1]
+        if total == 0:
+            return 0.0
+        rank = q * total
+        lower_bound, lower_count = 0.0, 0
+        for bound, count in cumulative:
+            if count >= rank:
+                if bound == float('inf'):
+                    return self.max
+                fraction = (rank - lower_count) / (count - lower_count) if count > lower_count else 0.0
+                return min(lower_bound + (bound - lower_bound) * fraction, self.max)
+            lower_bound, lower_count = bound, count
+        return self.max
+
+    def snapshot(self) -> Dict:
+        return {
+            'count': self.count,
+            'mean_ms': round(self.sum / self.count * 1000.0, 3) if self.count else 0.0,
+            'p50_ms': round(self.quantile(0.5) * 1000.0, 3),
+            'p95_ms': round(self.quantile(0.95) * 1000.0, 3),
+            'p99_ms': round(self.quantile(0.99) * 1000.0, 3),
+            'max_ms': round(self.max * 1000.0, 3),
+            # A list rather than a dict so the bucket order survives key-sorted JSON
+            'buckets': [['+Inf' if bound == float('inf') else bound, count]
+                        for bound, count in self.cumulative_counts()]
+        }
+
+
+class _Trace:
+    """Stage durations recorded for one sampled request."""
+
+    __slots__ = ('sampled', 'stages')
+
+    def __init__(self, sampled: bool):
+        self.sampled = sampled
+        self.stages = []
+
+    def header_value(self) -> str:
+        """Format as 'pipeline.stage;dur=1.234, ...' (milliseconds)."""
+        return ', '.join(f'{name};dur={seconds * 1000.0:.3f}' for name, seconds in self.stages)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _NullClock:
+    __slots__ = ()
+
+    def lap(self, stage: str):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+_NULL_CLOCK = _NullClock()
+
+
+class _Stage:
+    __slots__ = ('timings', 'key', 'trace', 'start')
+
+    def __init__(self, timings, key, trace):
+        self.timings = timings
+        self.key = key
+        self.trace = trace
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        self.timings._histogram(self.key).observe(elapsed)
+        if self.trace is not None:
+            self.trace.stages.append(('.'.join(self.key), elapsed))
+        return False
+
+
+class _Clock:
+    """Times consecutive stages: each lap() records the time since the previous one."""
+
+    __slots__ = ('timings', 'pipeline', 'trace', 'last')
+
+    def __init__(self, timings, pipeline, trace):
+        self.timings = timings
+        self.pipeline = pipeline
+        self.trace = trace
+        self.last = time.perf_counter()
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        elapsed = now - self.last
+        self.last = now
+        self.timings._histogram((self.pipeline, stage)).observe(elapsed)
+        if self.trace is not None:
+            self.trace.stages.append((f'{self.pipeline}.{stage}', elapsed))
+
+
+class StageTimings:
+    """Registry of per-(pipeline, stage) histograms with per-trace sampling."""
+
+    def __init__(self, sample_rate: float = 1.0, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.sample_rate = sample_rate
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+        self._trace: ContextVar = ContextVar('stage_trace', default=None)
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or (self.sample_rate > 0.0 and random.random() < self.sample_rate)
+
+    def _histogram(self, key: Tuple[str, str]) -> Histogram:
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self.buckets))
+        return histogram
+
+    def start_trace(self):
+        """Begin a trace in the current context; returns (trace, token) for end_trace()."""
+        trace = _Trace(self._sampled())
+        return trace, self._trace.set(trace)
+
+    def end_trace(self, token):
+        self._trace.reset(token)
+
+    def current_trace(self):
+        return self._trace.get()
+
+    @contextmanager
+    def trace(self):
+        """Trace a request; nested calls join the active trace."""
+        trace = self._trace.get()
+        if trace is not None:
+            yield trace
+            return
+        trace, token = self.start_trace()
+        try:
+            yield trace
+        finally:
+            self.end_trace(token)
+
+    def _active(self):
+        """Return (record, trace) for the current context, deciding sampling when untraced."""
+        trace = self._trace.get()
+        if trace is None:
+            return self._sampled(), None
+        return trace.sampled, trace
+
+    def stage(self, pipeline: str, stage: str):
+        """Context manager timing one pipeline stage (a no-op when not sampled)."""
+        record, trace = self._active()
+        return _Stage(self, (pipeline, stage), trace) if record else _NULL_STAGE
+
+    def clock(self, pipeline: str):
+        """Start a lap clock for a sequential pipeline (a no-op when not sampled)."""
+        record, trace = self._active()
+        return _Clock(self, pipeline, trace) if record else _NULL_CLOCK
+
+    def snapshot(self) -> Dict:
+        """Histogram summaries grouped by pipeline, then stage."""
+        with self._lock:
+            items = sorted(self._histograms.items())
+        snapshot = {}
+        for (pipeline, stage), histogram in items:
+            snapshot.setdefault(pipeline, {})[stage] = histogram.snapshot()
+        return snapshot
+
+    def histograms(self) -> Dict[Tuple[str, str], Histogram]:
+        with self._lock:
+            return dict(self._histograms)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+# Shared registry used by all matchers; STAGE_TIMING_SAMPLE_RATE=0 turns timing off
+TIMINGS = StageTimings(sample_rate=float(os.environ.get('STAGE_TIMING_SAMPLE_RATE', 1.0)))
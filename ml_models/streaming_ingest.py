@@ -0,0 +1,240 @@
+"""
+Chunked streaming ingest of Jobs_cleaned.csv-schema catalogues
+Reads the CSV a chunk at a time, normalizes each chunk the same way
+MLInternshipMatcher prepares its catalogue, vectorizes it with the already
+fitted TF-IDF vectorizer and appends the results to an on-disk store, so peak
+memory depends on the chunk size rather than on the catalogue size.
+
+Store layout (all files are raw little-endian arrays that are memory-mapped on open):
+    meta.json                  row count, vocabulary size, column types
+    vectors.data/.indices/.indptr   CSR components of the TF-IDF vectors (float64, int32, int32)
+    columns/<name>.values      numeric columns (missing salaries stay NaN)
+    columns/<name>.offsets/.utf8    string columns as int64 offsets into UTF-8 bytes
+
+String columns are read back as pandas Categoricals built straight from the
+offsets and bytes (distinct byte strings -> codes), so serving a store never
+holds a Python str per row.
+
+Usage:
+    python ml_models/streaming_ingest.py --input dataset/synthetic/Jobs_synthetic.csv --output dataset/.store/jobs
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+# Shared helpers live next to this module
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from ml_internship_matcher import MLInternshipMatcher
+
+# Columns kept in the store: what recommendation ranking and formatting read
+STRING_COLUMNS = ['company_name', 'Type_of_job', 'location', 'salary', 'experience',
+                  'domain', 'role_lower', 'location_lower']
+NUMERIC_COLUMNS = {'stipend_value': 'float32', 'salary_min': 'float32', 'salary_max': 'float32',
+                   'salary_mid': 'float32', 'experience_enc': 'int64', 'actively_hiring': 'float32'}
+
+DEFAULT_CHUNK_SIZE = 50000
+
+# Rows of a string column decoded at a time (bounds the byte-index arrays built per block)
+STRING_BLOCK_ROWS = 16384
+
+# The CSR index arrays are int32 so scipy can use the memory maps without copying them
+MAX_NNZ = np.iinfo(np.int32).max
+
+
+class CatalogueStoreWriter:
+    """Appends normalized chunks and their vectors to an on-disk catalogue store."""
+
+    def __init__(self, directory: str, n_features: int):
+        self.directory = directory
+        self.n_features = n_features
+        self.rows = 0
+        self.nnz = 0
+        self.columns: Dict[str, str] = {}
+        os.makedirs(os.path.join(directory, 'columns'), exist_ok=True)
+        self._files = {}
+        self._string_offsets: Dict[str, int] = {}
+        self._write('vectors.indptr', np.zeros(1, dtype=np.int32))
+
+    def _write(self, name: str, array: np.ndarray):
+        f = self._files.get(name)
+        if f is None:
+            f = self._files[name] = open(os.path.join(self.directory, name), 'wb')
+        f.write(np.ascontiguousarray(array).tobytes())
+
+    def append(self, features: pd.DataFrame, vectors: csr_matrix):
+        """Append one chunk of prepared rows and their TF-IDF vectors."""
+        if self.nnz + vectors.nnz > MAX_NNZ:
+            raise ValueError("Catalogue too large for int32 CSR indices")
+        self._write('vectors.data', vectors.data.astype(np.float64))
+        self._write('vectors.indices', vectors.indices.astype(np.int32))
+        self._write('vectors.indptr', (vectors.indptr[1:] + self.nnz).astype(np.int32))
+        self.nnz += vectors.nnz
+
+        for name in STRING_COLUMNS:
+            if name not in features.columns:
+                continue
+            self.columns[name] = 'str'
+            encoded = [str(value).encode('utf-8') for value in features[name].tolist()]
+            lengths = np.fromiter((len(value) for value in encoded), dtype=np.int64, count=len(encoded))
+            if name not in self._string_offsets:
+                self._string_offsets[name] = 0
+                self._write(f'columns/{name}.offsets', np.zeros(1, dtype=np.int64))
+            offsets = np.cumsum(lengths) + self._string_offsets[name]
+            self._string_offsets[name] = int(offsets[-1]) if len(offsets) else self._string_offsets[name]
+            self._write(f'columns/{name}.offsets', offsets)
+            self._write(f'columns/{name}.utf8', np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+        for name, dtype in NUMERIC_COLUMNS.items():
+            if name not in features.columns:
+                continue
+            self.columns[name] = dtype
+            values = pd.to_numeric(features[name], errors='coerce')
+            if np.issubdtype(np.dtype(dtype), np.integer):
+                values = values.fillna(0)
+            values = values.to_numpy(dtype=dtype)
+            self._write(f'columns/{name}.values', values)
+
+        self.rows += len(features)
+
+    def close(self, source: Optional[str] = None):
+        for f in self._files.values():
+            f.close()
+        meta = {'rows': self.rows, 'n_features': self.n_features, 'nnz': self.nnz,
+                'columns': self.columns, 'source': source}
+        with open(os.path.join(self.directory, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+
+class CatalogueStore:
+    """Read side of a catalogue store: memory-mapped vectors and columns."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json')) as f:
+            self.meta = json.load(f)
+        self.rows = self.meta['rows']
+
+    def _map(self, name: str, dtype) -> np.ndarray:
+        path = os.path.join(self.directory, name)
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r')
+
+    def vectors(self) -> csr_matrix:
+        """TF-IDF vectors as a CSR matrix backed by the memory-mapped files."""
+        return csr_matrix(
+            (self._map('vectors.data', np.float64), self._map('vectors.indices', np.int32),
+             self._map('vectors.indptr', np.int32)),
+            shape=(self.rows, self.meta['n_features'])
+        )
+
+    def column(self, name: str):
+        """A numeric column as a memory-mapped array, or a string column as a pd.Categorical."""
+        dtype = self.meta['columns'][name]
+        if dtype != 'str':
+            return self._map(f'columns/{name}.values', np.dtype(dtype))
+        return self._categorical(name)
+
+    def _categorical(self, name: str) -> pd.Categorical:
+        """
+        Build a string column's Categorical from its offsets and UTF-8 bytes.
+
+        Within a block, rows of equal byte length are gathered as fixed-width byte strings
+        of exactly that width, so np.unique finds their distinct values and codes without
+        padding any value; only the distinct values are decoded to str.
+        """
+        offsets = self._map(f'columns/{name}.offsets', np.int64)
+        data = self._map(f'columns/{name}.utf8', np.uint8)
+        codes = np.empty(self.rows, dtype=np.int32)
+        categories: Dict[bytes, int] = {}
+        for start in range(0, self.rows, STRING_BLOCK_ROWS):
+            end = min(start + STRING_BLOCK_ROWS, self.rows)
+            starts = np.asarray(offsets[start:end])
+            lengths = np.asarray(offsets[start + 1:end + 1]) - starts
+            order = np.argsort(lengths, kind='stable')
+            bounds = np.flatnonzero(np.diff(lengths[order])) + 1
+            for rows in np.split(order, bounds):
+                width = int(lengths[rows[0]])
+                if width == 0:
+                    codes[start + rows] = categories.setdefault(b'', len(categories))
+                    continue
+                values = np.asarray(data[starts[rows, None] + np.arange(width)]).view(f'S{width}').ravel()
+                uniques, inverse = np.unique(values, return_inverse=True)
+                group_codes = np.array([categories.setdefault(value, len(categories)) for value in uniques.tolist()],
+                                       dtype=np.int32)
+                codes[start + rows] = group_codes[inverse.ravel()]
+
+        # Sorted categories, as astype('category') gives the in-memory catalogue
+        values = [value.decode('utf-8') for value in categories]
+        order = np.argsort(np.array(values, dtype=object), kind='stable') if values else np.empty(0, dtype=np.int64)
+        remap = np.empty(len(values), dtype=np.int32)
+        remap[order] = np.arange(len(values), dtype=np.int32)
+        return pd.Categorical.from_codes(remap[codes], categories=[values[i] for i in order])
+
+    def features(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load the given columns (all stored columns by default; absent ones are skipped) into a DataFrame."""
+        columns = [name for name in columns if name in self.meta['columns']] if columns else list(self.meta['columns'])
+        return pd.DataFrame({name: self.column(name) for name in columns})
+
+
+def ingest_csv(csv_path: str, directory: str, matcher: MLInternshipMatcher,
+               chunk_size: int = DEFAULT_CHUNK_SIZE, verbose: bool = True) -> CatalogueStore:
+    """
+    Stream a jobs CSV into a catalogue store using the matcher's fitted vectorizer.
+
+    Args:
+        csv_path: Jobs_cleaned.csv-schema file
+        directory: Output directory for the store (overwritten)
+        matcher: Matcher with a trained or loaded model (provides the TF-IDF vocabulary)
+        chunk_size: Rows read, normalized and vectorized at a time
+    """
+    tfidf = matcher.vectorizers.get('tfidf')
+    if tfidf is None:
+        raise ValueError("Model not trained yet. Call train_model() or load_model() first.")
+
+    writer = CatalogueStoreWriter(directory, len(tfidf.vocabulary_))
+    start = time.perf_counter()
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+        # Same normalization as the in-memory load: NaN cells become '' before deriving columns
+        features = matcher._prepare_internship_features(chunk.fillna(''))
+        vectors = tfidf.transform(matcher._internship_texts(features))
+        writer.append(features, vectors)
+        if verbose:
+            print(f"📦 Ingested {writer.rows} rows ({time.perf_counter() - start:.1f}s)")
+    writer.close(source=os.path.abspath(csv_path))
+    return CatalogueStore(directory)
+
+
+def main():
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description='Stream a jobs CSV into an on-disk catalogue store')
+    parser.add_argument('--input', required=True, help='Jobs_cleaned.csv-schema file')
+    parser.add_argument('--output', required=True, help='Directory for the catalogue store')
+    parser.add_argument('--model', default=os.path.join(root_dir, 'ml_models', 'internship_matcher_model.joblib'),
+                        help='Trained MLInternshipMatcher model providing the vectorizer')
+    parser.add_argument('--users', default=os.path.join(root_dir, 'dataset', 'Candidates_cleaned.csv'),
+                        help='User dataset the matcher is constructed with')
+    parser.add_argument('--jobs', default=os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'),
+                        help='Jobs dataset the matcher is constructed with')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows per chunk')
+    args = parser.parse_args()
+
+    matcher = MLInternshipMatcher(args.users, args.jobs, model_path=args.model)
+    if not matcher.model:
+        print(f"❌ Model not found: {args.model}")
+        sys.exit(1)
+
+    store = ingest_csv(args.input, args.output, matcher, args.chunk_size)
+    print(f"✅ Wrote {store.rows} rows ({store.meta['nnz']} non-zeros) to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
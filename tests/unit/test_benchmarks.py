@@ -0,0 +1,41 @@
+"""
+Test script to verify the benchmark harness summaries and baseline comparison
+"""
+
+import sys
+import os
+
+# Add the benchmarks directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'benchmarks'))
+
+from bench_recommenders import summarize, compare_results
+
+
+def test_summarize_latencies():
+    """Percentiles are reported in milliseconds, throughput in calls per second."""
+    summary = summarize([0.01] * 99 + [0.1])
+
+    assert summary['calls'] == 100
+    assert summary['p50_ms'] == 10.0
+    assert summary['p99_ms'] > summary['p95_ms'] >= 10.0
+    assert summary['throughput_per_s'] == round(100 / 1.09, 2)
+
+
+def test_compare_against_baseline():
+    """Only changes beyond the tolerance are reported as regressions."""
+    base = {'scale': 5806, 'target': 'jobs_matcher', 'entry_point': 'get_recommendations',
+            'p50_ms': 10.0, 'p95_ms': 20.0, 'p99_ms': 30.0, 'peak_rss_mb': 100.0, 'throughput_per_s': 50.0}
+    within = dict(base, p95_ms=23.0, throughput_per_s=45.0)
+    slower = dict(base, p95_ms=30.0, throughput_per_s=30.0)
+    failing = dict(base, error='KeyError: x')
+
+    assert compare_results([within], {'results': [base]}) == []
+    assert len(compare_results([slower], {'results': [base]})) == 2
+    assert 'now fails' in compare_results([failing], {'results': [base]})[0]
+    assert compare_results([dict(base, scale=1000000)], {'results': [base]}) == []
+
+
+if __name__ == "__main__":
+    test_summarize_latencies()
+    test_compare_against_baseline()
+    print("✅ Benchmark harness tests passed")
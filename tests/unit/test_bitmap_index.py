@@ -0,0 +1,104 @@
+"""
+Test script to verify the attribute bitmap index and the bitmap-based rule filters
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the ml_models and backend directories to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from bitmap_index import BitmapIndex, salary_bands, candidate_rows, top_by_salary
+from salary_index import SalaryIndex
+from experience_filter import ExperienceFilter
+
+
+def test_bitmaps_match_boolean_masks():
+    """AND/OR of value bitmaps agree with DataFrame-style boolean masks, including after add()."""
+    rng = np.random.default_rng(11)
+    locations = rng.choice(['Delhi', 'pune', 'Remote', 'delhi'], 1003)
+    hiring = rng.random(1003) < 0.3
+    bands = salary_bands(rng.choice([0, 1e5, 3e5, np.nan, 2e6], 1003))
+
+    index = BitmapIndex(('location', 'actively_hiring', 'salary_band'))
+    index.rebuild({'location': locations[:997], 'actively_hiring': hiring[:997], 'salary_band': bands[:997]})
+    index.add({'location': locations[997:], 'actively_hiring': hiring[997:], 'salary_band': bands[997:]})
+    assert len(index) == 1003
+
+    lowered = np.char.lower(locations.astype(str))
+    rows = index.any_of('location', ['DELHI', 'remote']) & index.get('actively_hiring', True)
+    expected = np.isin(lowered, ['delhi', 'remote']) & hiring
+    assert index.mask(rows).tolist() == expected.tolist()
+    assert index.count(rows) == expected.sum()
+    assert index.positions(rows).tolist() == np.flatnonzero(expected).tolist()
+
+    rows = index.any_of('salary_band', [3, 4]) | index.get('location', 'pune')
+    expected = (bands >= 3) | (lowered == 'pune')
+    assert index.mask(rows).tolist() == expected.tolist()
+
+    assert index.count(index.full()) == 1003
+    assert index.count(index.get('location', 'mumbai')) == 0
+    assert index.positions(index.from_positions([5, 1002])).tolist() == [5, 1002]
+
+
+def test_candidate_rows_combine_location_salary_and_experience():
+    """candidate_rows keeps preferred-location/remote rows above the floor that fit the experience level."""
+    locations = ['Delhi', 'Remote', 'Pune', 'Delhi', 'delhi']
+    domains = ['data science', 'web development', 'data science', 'marketing', 'data science']
+    salaries = [300000, 600000, 900000, 100000, 700000]
+    experience = ['0-2 years', '0-2 years', '0-2 years', '5-10 years', '5-10 years']
+
+    experience_filter = ExperienceFilter(pd.Series(experience))
+    salary_index = SalaryIndex()
+    salary_index.rebuild(salaries, {'location': [value.lower() for value in locations], 'domain': domains})
+    bitmaps = BitmapIndex(('location', 'experience'))
+    bitmaps.rebuild({'location': locations, 'experience': experience_filter.codes})
+
+    rows, location_values = candidate_rows(bitmaps, salary_index, experience_filter, 'delhi', 250000, '0-2 years')
+    assert location_values == ['delhi', 'remote']
+    assert bitmaps.positions(rows).tolist() == [0, 1]
+
+    # Remote rows count for any location; an experience level nobody fits is ignored
+    rows, location_values = candidate_rows(bitmaps, salary_index, experience_filter, 'mumbai', None, '20+ years')
+    assert bitmaps.positions(rows).tolist() == [1]
+    rows, location_values = candidate_rows(bitmaps, salary_index, experience_filter, 'any', None, '20+ years')
+    assert rows is None and location_values is None
+
+    rows, location_values = candidate_rows(bitmaps, salary_index, experience_filter, 'delhi')
+    assert top_by_salary(bitmaps, salary_index, rows, location_values, 2, domains=['data science']) == [4, 0]
+    assert top_by_salary(bitmaps, salary_index, rows, location_values, 2) == [4, 1]
+
+
+def test_rule_filters_match_per_item_checks():
+    """InternshipMatcher's bitmap filters keep the same internships as the per-item domain and location rules."""
+    from internship_matcher import InternshipMatcher, UserProfile
+
+    root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+    matcher = InternshipMatcher(os.path.join(root_dir, 'dataset', 'Candidates_cleaned.csv'),
+                                os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'))
+
+    for domain, location in [('Data Science', 'Bangalore'), ('marketing', 'Remote'), ('', 'Delhi')]:
+        user = UserProfile(0, '', '', domain, location, '3 months', '')
+        user_domain, user_location = domain.lower(), location.lower()
+        expected = [
+            internship for internship in matcher.internships
+            if user_domain in internship.domain.lower() or internship.domain.lower() in user_domain
+            or any(keyword in user_domain and keyword in internship.domain.lower() for keyword in ('data', 'machine', 'ai'))
+        ]
+        assert matcher.apply_domain_filter(user, matcher.internships) == expected
+        expected = [
+            internship for internship in expected
+            if user_location == 'remote' or internship.location.lower() in (user_location, 'remote')
+        ]
+        assert matcher.apply_location_filter(user, matcher.apply_domain_filter(user, matcher.internships)) == expected
+
+
+if __name__ == "__main__":
+    test_bitmaps_match_boolean_masks()
+    test_candidate_rows_combine_location_salary_and_experience()
+    test_rule_filters_match_per_item_checks()
+    print("✅ Bitmap index tests passed")
@@ -0,0 +1,68 @@
+"""
+Test script to verify the materialized top-K lists per (domain, location) bucket
+"""
+
+import sys
+import os
+
+# Add the ml_models and backend directories to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from internship_matcher import InternshipMatcher, MATERIALIZED_TOP_K
+from rule_pipeline import ColumnRule
+
+
+def load_matcher():
+    root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+    return InternshipMatcher(os.path.join(root_dir, 'dataset', 'Candidates_cleaned.csv'),
+                             os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'))
+
+
+def live_ids(matcher, user, top_k, min_salary=None):
+    positions, _ = matcher._rank_rows(user, top_k, min_salary)
+    return [matcher.internships[position].internship_id for position in positions]
+
+
+def lookup_ids(matcher, user_id, top_k, min_salary=None):
+    return [rec['internship_id'] for rec in matcher.get_top_recommendations(user_id, top_k, 'none', min_salary)]
+
+
+def test_lookups_match_live_ranking():
+    """Bucket lookups give the live pipeline's ranking, with and without salary floors, before and after ingest."""
+    matcher = load_matcher()
+    assert len(matcher._bucket_tops) == len({(u.preferred_domain.lower(), u.preferred_location.lower())
+                                             for u in matcher.users})
+    for user in matcher.users:
+        for top_k, min_salary in [(3, None), (10, 500000), (MATERIALIZED_TOP_K, 300000), (MATERIALIZED_TOP_K + 5, None)]:
+            assert lookup_ids(matcher, user.user_id, top_k, min_salary) == live_ids(matcher, user, top_k, min_salary)
+
+    # A well paid internship in the first user's bucket shows up after ingest
+    user = matcher.users[0]
+    matcher.add_internships([{'company_name': 'Ingested Co', 'Type_of_job': 'Data Scientist',
+                              'Domain': user.preferred_domain, 'location': user.preferred_location,
+                              'salary': '₹  90 - 95 lpa', 'experience': '0-2 years', 'actively_hiring': 1}])
+    recommendations = matcher.get_top_recommendations(user.user_id, 3, 'none')
+    assert recommendations[0]['company'] == 'Ingested Co'
+    assert lookup_ids(matcher, user.user_id, 10) == live_ids(matcher, user, 10)
+
+    # New users get their bucket materialized on ingest
+    new_user = matcher.add_users([{'candidate_id': 999, 'job_role': 'Sales', 'PreferredLocation': 'Pune'}])[0]
+    assert matcher.pipeline.bucket_key(new_user) in matcher._bucket_tops
+
+
+def test_custom_rules_without_key_rank_live():
+    """Adding a rule drops the stored buckets; a rule without a key disables them."""
+    matcher = load_matcher()
+    user = matcher.users[0]
+    matcher.pipeline.add(ColumnRule('paid_only', 'stipend_value', lambda user, stipends: stipends > 0),
+                         before='enrollment_rules')
+    assert matcher.pipeline.bucket_key(user) is None
+    assert lookup_ids(matcher, user.user_id, 5) == live_ids(matcher, user, 5)
+    assert all(matcher.internships[p].stipend_value > 0 for p in matcher._rank_rows(user, 5)[0])
+
+
+if __name__ == "__main__":
+    test_lookups_match_live_ranking()
+    test_custom_rules_without_key_rank_live()
+    print("✅ Bucket top-K tests passed")
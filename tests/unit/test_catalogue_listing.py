@@ -0,0 +1,121 @@
+"""
+Test script to verify paginated, filtered /users and /internships listings
+"""
+
+import sys
+import os
+import subprocess
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from catalogue_listing import internship_listing
+from internship_matcher import Internship
+
+
+def make_internship(company, domain, location, stipend, actively_hiring=True):
+    return Internship(1, company, 'Intern', domain, location, 'Full-time', '3 months', stipend, actively_hiring)
+
+
+def test_filters_and_cursor_pages():
+    """Filters intersect their indexes and cursor pages cover every match exactly once."""
+    internships = [make_internship(f'Company {i}', 'Data Science' if i % 2 else 'Marketing',
+                                   'Delhi' if i % 3 else 'Pune', f'{i * 1000} INR', i % 5 != 0)
+                   for i in range(30)]
+    listing = internship_listing(internships)
+
+    total, rows, cursor = listing.query({'domain': 'data science', 'location': 'DELHI'}, limit=4)
+    expected = [f'Company {i}' for i in range(30) if i % 2 and i % 3]
+    assert total == len(expected)
+    seen = [row['company'] for row in rows]
+    while cursor:
+        _, rows, cursor = listing.query({'domain': 'data science', 'location': 'DELHI'}, limit=4, cursor=cursor)
+        seen.extend(row['company'] for row in rows)
+    assert seen == expected
+
+    total, rows, _ = listing.query({'actively_hiring': 'false'}, low=5000, high=20000, fields=['company'])
+    assert rows == [{'company': 'Company 5'}, {'company': 'Company 10'}, {'company': 'Company 15'},
+                    {'company': 'Company 20'}]
+
+    # Ingested rows extend the indexes and change the version used for ETags
+    version = listing.version
+    listing.add([make_internship('Company 30', 'Data Science', 'Delhi', '500 INR')])
+    assert listing.query({'domain': 'Data Science', 'location': 'Delhi'})[0] == len(expected) + 1
+    assert listing.version != version
+
+
+def test_ingest_merges_range_index_and_versions():
+    """add() merges stipends into the sorted order like a full rebuild; versions follow the source and ingests."""
+    internships = [make_internship(f'Company {i}', 'Data Science', 'Delhi', f'{(i * 7) % 5 * 1000} INR')
+                   for i in range(40)]
+    grown = internship_listing(internships[:10], source='jobs.csv:1')
+    for start, end in [(10, 25), (25, 26), (26, 40)]:
+        grown.add(internships[start:end])
+    full = internship_listing(internships, source='jobs.csv:1')
+    assert grown._range_order.tolist() == full._range_order.tolist()
+    assert grown._range_values.tolist() == full._range_values.tolist()
+    assert grown.query({}, low=2000, high=3000)[1] == full.query({}, low=2000, high=3000)[1]
+
+    # Same source and rows: same version (ETags survive a reload); any ingest or other source changes it
+    assert internship_listing(internships, source='jobs.csv:1').version == full.version
+    assert internship_listing(internships, source='jobs.csv:2').version != full.version
+    assert grown.version != full.version
+    version = full.version
+    full.add(internships[:1])
+    assert full.version != version
+
+
+def test_fragments_cached_on_first_serialization():
+    """Building a listing serializes nothing; a row's JSON is cached when it is first served."""
+    listing = internship_listing([make_internship(f'Company {i}', 'Data Science', 'Delhi', '1000 INR')
+                                  for i in range(10)])
+    assert listing._fragments == {}
+
+    _, fragments, _ = listing.query({}, limit=3, as_fragments=True)
+    assert sorted(listing._fragments) == [0, 1, 2]
+    assert listing.query({}, limit=3, as_fragments=True)[1] == fragments
+
+
+def test_matcher_does_not_import_flask():
+    """The matcher's load path stays free of the API layer (listings, stats, the JSON provider)."""
+    backend_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'backend')
+    code = ("import sys, internship_matcher; "
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in "
+            "('flask', 'json_provider', 'catalogue_listing', 'catalogue_stats')))")
+    output = subprocess.run([sys.executable, '-c', code], cwd=backend_dir, capture_output=True, text=True,
+                            check=True).stdout
+    assert output.strip().splitlines()[-1] == '[]'
+
+
+def test_listing_endpoints():
+    """/internships pages with a cursor, projects fields and revalidates with ETags."""
+    import api_server
+
+    api_server.initialize_matchers()
+    client = api_server.app.test_client()
+
+    response = client.get('/internships?limit=5&fields=company,location&location=delhi')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['count'] == 5 and data['total_internships'] > 5
+    assert set(data['internships'][0]) == {'company', 'location'}
+    assert all(row['location'].lower() == 'delhi' for row in data['internships'])
+
+    next_page = client.get(f"/internships?limit=5&fields=company,location&location=delhi&cursor={data['next_cursor']}")
+    offset_page = client.get('/internships?limit=5&fields=company,location&location=delhi&offset=5')
+    assert next_page.get_json()['internships'] == offset_page.get_json()['internships']
+
+    etag = response.headers['ETag']
+    assert client.get('/internships?limit=5&fields=company,location&location=delhi',
+                      headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/users?fields=salary').status_code == 400
+    assert client.get('/users?limit=100000').status_code == 400
+
+
+if __name__ == "__main__":
+    test_filters_and_cursor_pages()
+    test_ingest_merges_range_index_and_versions()
+    test_fragments_cached_on_first_serialization()
+    test_matcher_does_not_import_flask()
+    test_listing_endpoints()
+    print("✅ Catalogue listing tests passed")
@@ -0,0 +1,98 @@
+"""
+Test script to verify the precomputed /stats aggregates
+"""
+
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from catalogue_stats import CatalogueStats
+from catalogue_views import CatalogueViews
+from internship_matcher import UserProfile, Internship
+
+
+def make_user(user_id, domain, location):
+    return UserProfile(user_id, 'B.Tech', 'Python', domain, location, '3 months', 'Not in full-time')
+
+
+def make_internship(internship_id, role, domain, location):
+    return Internship(internship_id, 'Acme', role, domain, location, 'Full-time', '3 months', '10000')
+
+
+def test_incremental_updates_match_rebuild():
+    """Ingesting rows incrementally gives the same snapshot and ETag as recomputing."""
+    users = [make_user(1, 'Data Science', 'Delhi'), make_user(2, 'Web Development', 'Delhi')]
+    internships = [make_internship(1, 'Data Analyst', 'Data Science', 'Pune')]
+    stats = CatalogueStats(users, internships)
+    etag = stats.etag
+
+    new_users = [make_user(3, 'Data Science', 'Mumbai')]
+    new_internships = [make_internship(2, 'Web Developer', 'Web Development', 'Pune')]
+    stats.add('users', new_users)
+    stats.add('internships', new_internships)
+
+    rebuilt = CatalogueStats(users + new_users, internships + new_internships)
+    assert stats.snapshot() == rebuilt.snapshot()
+    assert stats.etag == rebuilt.etag != etag
+    assert stats.snapshot()['user_domains'] == {'Data Science': 2, 'Web Development': 1}
+    assert stats.snapshot()['internship_locations'] == {'Pune': 2}
+    assert stats.snapshot()['total_users'] == 3
+
+
+def test_views_build_on_first_use_and_follow_the_matcher():
+    """Stats are built on first access, fold in ingested rows and are rebuilt after a reload."""
+    class Catalogue:
+        generation = 1
+        dataset_keys = {}
+        users = [make_user(1, 'Data Science', 'Delhi')]
+        internships = [make_internship(1, 'Data Analyst', 'Data Science', 'Pune')]
+
+    catalogue = Catalogue()
+    views = CatalogueViews(catalogue)
+    assert views._views == {}
+
+    stats = views.stats
+    assert stats.snapshot()['total_users'] == 1
+    catalogue.users = catalogue.users + [make_user(2, 'Data Science', 'Mumbai')]
+    assert views.stats is stats
+    assert stats.snapshot()['user_domains'] == {'Data Science': 2}
+    assert views.internship_listing.query({'location': 'pune'})[0] == 1
+
+    # A reload replaces the catalogue, so the next access rebuilds from scratch
+    catalogue.generation += 1
+    catalogue.users = [make_user(3, 'Web Development', 'Delhi')]
+    assert views.stats is not stats
+    assert views.stats.snapshot()['user_domains'] == {'Web Development': 1}
+
+
+def test_stats_endpoint_etag():
+    """/stats answers a matching If-None-Match with 304 until new users are ingested."""
+    import api_server
+
+    api_server.initialize_matchers()
+    client = api_server.app.test_client()
+
+    response = client.get('/stats')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    total_users = response.get_json()['total_users']
+
+    assert client.get('/stats', headers={'If-None-Match': etag}).status_code == 304
+
+    api_server.matcher.add_users([{'candidate_id': 999, 'job_role': 'Data Scientist', 'skills': 'Python'}])
+    response = client.get('/stats', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['total_users'] == total_users + 1
+
+    # Reloading drops the ingested user and restores the original snapshot
+    api_server.matcher.load_datasets()
+    assert client.get('/stats', headers={'If-None-Match': etag}).status_code == 304
+
+
+if __name__ == "__main__":
+    test_incremental_updates_match_rebuild()
+    test_views_build_on_first_use_and_follow_the_matcher()
+    test_stats_endpoint_etag()
+    print("✅ Catalogue stats tests passed")
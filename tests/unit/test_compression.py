@@ -0,0 +1,61 @@
+"""
+Test script to verify response compression and conditional GETs
+"""
+
+import sys
+import os
+import gzip
+import json
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+import compression
+
+
+def test_compressed_body_cache():
+    """Each (ETag, encoding) is compressed once and then served from the cache."""
+    cache = compression.CompressedBodyCache(max_entries=1)
+    body = b'{"rows": []}' * 200
+
+    first = cache.get_or_compress('"a"', 'gzip', body)
+    assert gzip.decompress(first) == body
+    assert cache.get_or_compress('"a"', 'gzip', b'ignored') is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get_or_compress('"b"', 'gzip', body)
+    cache.get_or_compress('"a"', 'gzip', body)
+    assert cache.misses == 3
+
+
+def test_negotiated_compression_and_revalidation():
+    """Large listings are gzipped on request and both ETag variants revalidate with 304."""
+    import api_server
+
+    api_server.initialize_matchers()
+    client = api_server.app.test_client()
+
+    response = client.get('/internships?limit=100', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert json.loads(gzip.decompress(response.data))['count'] == 100
+    gzip_etag = response.headers['ETag']
+    assert gzip_etag.endswith('-gzip"')
+
+    plain = client.get('/internships?limit=100')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.get_json()['count'] == 100
+
+    for etag in (gzip_etag, plain.headers['ETag']):
+        revalidated = client.get('/internships?limit=100', headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers['ETag'] == etag
+
+    docs = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert client.get('/', headers={'If-None-Match': docs.headers['ETag']}).status_code == 304
+
+
+if __name__ == "__main__":
+    test_compressed_body_cache()
+    test_negotiated_compression_and_revalidation()
+    print("✅ Compression tests passed")
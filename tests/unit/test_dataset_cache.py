@@ -0,0 +1,104 @@
+"""
+Test script to verify the shared binary dataset cache
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the ml_models directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+
+import dataset_cache
+
+
+def test_binary_cache_round_trip():
+    """A second process-level load reads the binary copy and matches read_csv exactly."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.csv')
+        pd.DataFrame({'company_name': ['a', None, 'c'], 'experience_enc': [1, 2, 3]}).to_csv(path, index=False)
+
+        first = dataset_cache.load_dataset(path)
+        assert dataset_cache.load_dataset(path) is first
+        cache_path, meta_path = dataset_cache._cache_paths(path)
+        assert os.path.exists(cache_path) and os.path.exists(meta_path)
+
+        dataset_cache.clear_memory_cache()
+        cached = dataset_cache.load_dataset(path)
+        assert cached is not first
+        pd.testing.assert_frame_equal(cached, dataset_cache.encode_categoricals(pd.read_csv(path)))
+
+        filled = dataset_cache.load_dataset(path, fill_value='')
+        assert filled['company_name'].tolist() == ['a', '', 'c']
+        assert dataset_cache.load_dataset(path, fill_value='') is filled
+
+
+def test_changed_source_is_reparsed():
+    """Editing the CSV invalidates both the in-memory and the on-disk copy."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.csv')
+        pd.DataFrame({'location': ['delhi']}).to_csv(path, index=False)
+        assert dataset_cache.load_dataset(path)['location'].tolist() == ['delhi']
+
+        pd.DataFrame({'location': ['pune', 'mumbai']}).to_csv(path, index=False)
+        assert dataset_cache.load_dataset(path)['location'].tolist() == ['pune', 'mumbai']
+
+        dataset_cache.clear_memory_cache()
+        assert dataset_cache.load_dataset(path)['location'].tolist() == ['pune', 'mumbai']
+
+
+def test_repetitive_columns_are_categorical():
+    """Listed text columns become categoricals sharing one string object per distinct value."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.csv')
+        pd.DataFrame({'location': ['Delhi', 'Pune', None, 'Delhi'], 'skills': ['a', 'b', 'c', 'd']}).to_csv(path, index=False)
+
+        raw = dataset_cache.load_dataset(path)
+        assert isinstance(raw['location'].dtype, pd.CategoricalDtype)
+        assert not isinstance(raw['skills'].dtype, pd.CategoricalDtype)
+        locations = raw['location'].tolist()
+        assert locations[0] is locations[3] and pd.isna(locations[2])
+
+        filled = dataset_cache.load_dataset(path, fill_value='')
+        assert isinstance(filled['location'].dtype, pd.CategoricalDtype)
+        assert filled['location'].tolist() == ['Delhi', 'Pune', '', 'Delhi']
+
+
+def test_text_helpers_match_string_operations():
+    """as_text and lower_categorical give the same values as fillna('') and str.lower()."""
+    values = pd.Series(['Delhi', None, 'DELHI', 'Remote', 'delhi'])
+    encoded = values.astype('category')
+    expected = values.fillna('').astype(str)
+
+    assert dataset_cache.as_text(encoded).tolist() == expected.tolist()
+    assert dataset_cache.as_text(values).tolist() == expected.tolist()
+
+    lowered = dataset_cache.lower_categorical(encoded)
+    assert lowered.tolist() == expected.str.lower().tolist()
+    assert list(lowered.cat.categories) == ['', 'delhi', 'remote']
+    assert (lowered == 'delhi').tolist() == [True, False, True, False, True]
+
+
+def test_filled_frame_shares_complete_columns():
+    """The filled frame reuses the arrays of columns without missing cells and leaves the shared frame as is."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.csv')
+        pd.DataFrame({'location': ['Delhi', None], 'experience_enc': [1, 2]}).to_csv(path, index=False)
+
+        raw = dataset_cache.load_dataset(path)
+        filled = dataset_cache.load_dataset(path, fill_value='')
+        assert np.shares_memory(filled['experience_enc'].to_numpy(), raw['experience_enc'].to_numpy())
+        assert list(filled['location'].cat.categories) == ['', 'Delhi']
+        assert pd.isna(raw['location'].tolist()[1])
+
+
+if __name__ == "__main__":
+    test_binary_cache_round_trip()
+    test_changed_source_is_reparsed()
+    test_repetitive_columns_are_categorical()
+    test_text_helpers_match_string_operations()
+    test_filled_frame_shares_complete_columns()
+    print("✅ Dataset cache tests passed")
@@ -0,0 +1,75 @@
+"""
+Test script to verify the shared compiled domain classifier
+"""
+
+import sys
+import os
+
+# Add the ml_models directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+
+import pandas as pd
+from domain_classifier import DomainClassifier, ROLE_DOMAINS, SIMPLE_ROLE_DOMAINS, SKILL_DOMAINS
+
+
+def test_role_domains():
+    """Roles map to the same domains as the original keyword checks."""
+    test_cases = [
+        ("full stack developer", "Web Development"),
+        ("data scientist", "Data Science"),
+        ("data entry operator", "General"),
+        ("qa engineer", "Quality Assurance"),
+        ("business analyst", "Business Development"),
+        ("financial analyst", "Finance"),
+        ("graphic designer", "Design"),
+        ("hr manager", "Human Resources"),
+        ("technical writer", "Content Writing"),
+        ("growth manager", "Business Development"),
+        ("insurance advisor", "Finance"),
+        ("project manager", "General"),
+        (float('nan'), "General")
+    ]
+    for role, expected in test_cases:
+        assert ROLE_DOMAINS.classify(role) == expected, role
+
+
+def test_rule_priority_not_text_position():
+    """An earlier rule wins even when a later rule's keyword appears first in the text."""
+    assert ROLE_DOMAINS.classify("web designer for sales team") == "Business Development"
+    assert SIMPLE_ROLE_DOMAINS.classify("software engineer - data platform") == "Data Science"
+    assert SKILL_DOMAINS.classify("Communication") == ""
+
+
+def test_label_column():
+    """Whole columns are labelled and keep their index."""
+    roles = pd.Series(['php developer', None, 'sales executive', 'php developer'], index=[10, 11, 12, 13])
+    labels = ROLE_DOMAINS.label(roles)
+
+    assert labels.tolist() == ['Web Development', 'General', 'Business Development', 'Web Development']
+    assert labels.index.tolist() == [10, 11, 12, 13]
+
+
+def test_boost_factors():
+    """Preferred domain is boosted, other specific domains are penalized."""
+    labels = pd.Series(['Design', 'General', 'Finance'])
+
+    assert ROLE_DOMAINS.boost_factors(labels, 'design').tolist() == [2.0, 1.0, 0.3]
+    assert ROLE_DOMAINS.boost_factors(labels, 'general').tolist() == [1.0, 2.0, 1.0]
+
+
+def test_custom_rules():
+    """Custom rule sets compile the same way."""
+    classifier = DomainClassifier([('A', ['ab']), ('B', ['b'])], default='none')
+
+    assert classifier.classify('xab') == 'A'
+    assert classifier.classify('xb') == 'B'
+    assert classifier.classify('x') == 'none'
+
+
+if __name__ == "__main__":
+    test_role_domains()
+    test_rule_priority_not_text_position()
+    test_label_column()
+    test_boost_factors()
+    test_custom_rules()
+    print("✅ Domain classifier tests passed")
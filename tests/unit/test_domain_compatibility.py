@@ -0,0 +1,64 @@
+"""
+Test script to verify the precomputed domain compatibility table
+"""
+
+import sys
+import os
+
+# Add the ml_models and backend directories to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from domain_compatibility import DomainCompatibility, match_level, MATCH, RELATED, NO_MATCH
+
+
+def test_table_matches_pairwise_rules():
+    """Every table cell equals match_level(), whether built at once, extended on ingest or decided per query."""
+    user_domains = ['Data Science', 'Marketing', 'machine learning', '']
+    domains = ['data science', 'data analytics', 'sales & marketing', 'ai research', 'design']
+
+    full = DomainCompatibility(user_domains, domains)
+    grown = DomainCompatibility(user_domains[:2], domains[:3])
+    grown.add(user_domains=user_domains[2:])
+    grown.add(domains=domains[3:])
+    assert full.shape == grown.shape == (4, 5)
+
+    for user_domain in user_domains + ['AI Engineer']:
+        for domain in domains:
+            expected = match_level(user_domain.lower(), domain)
+            assert full.level(user_domain, domain) == grown.level(user_domain, domain) == expected
+        assert full.compatible_domains(user_domain) == [d for d in domains if match_level(user_domain.lower(), d)]
+
+    assert full.level('Data Science', 'Data Science') == MATCH
+    assert full.level('Data Science', 'data analytics') == RELATED
+    assert full.level('Marketing', 'design') == NO_MATCH
+    assert full.compatible_domains('Data Science', MATCH) == ['data science']
+
+    # Domains only seen in queries are decided per call, never stored
+    for i in range(100):
+        full.level(f'Query domain {i}', 'design')
+        full.compatible_domains(f'Query domain {i}')
+    assert full.shape == (4, 5)
+
+
+def test_reasons_use_table_wording():
+    """Recommendation reasons say 'matches' only for direct or partial domain matches."""
+    from internship_matcher import InternshipMatcher, UserProfile
+
+    root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+    matcher = InternshipMatcher(os.path.join(root_dir, 'dataset', 'Candidates_cleaned.csv'),
+                                os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'))
+    user = UserProfile(0, '', '', 'Machine Learning Research', 'Remote', '3 months', '')
+    for internship in matcher.internships[:200]:
+        reason = matcher.generate_recommendation_reason(user, internship, 'short')
+        domain = internship.domain.lower()
+        if domain in 'machine learning research' or 'machine learning research' in domain:
+            assert 'matches your preferred domain' in reason
+        else:
+            assert 'related to your skills' in reason
+
+
+if __name__ == "__main__":
+    test_table_matches_pairwise_rules()
+    test_reasons_use_table_wording()
+    print("✅ Domain compatibility tests passed")
@@ -0,0 +1,64 @@
+"""
+Test script to verify experience-range filtering over the experience_enc column
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the ml_models directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+
+from experience_filter import ExperienceFilter, parse_experience, MAX_YEARS
+
+
+def test_parse_experience():
+    """Ranges, open-ended ranges, single values and level words map to (min, max) years."""
+    assert parse_experience('0-2 years') == (0, 2)
+    assert parse_experience('10-15 years') == (10, 15)
+    assert parse_experience('5+ years') == (5, MAX_YEARS)
+    assert parse_experience('3 years') == (3, 3)
+    assert parse_experience('Fresher') == (0, 1)
+    assert parse_experience('') is None
+    assert parse_experience(np.nan) is None
+
+
+def test_mask_matches_per_row_check():
+    """The per-code lookup agrees with parsing every row, and unknown requirements accept everyone."""
+    experience = pd.Series(['0-2 years', '10-15 years', np.nan, '2-5 years', '0-2 years', '5-10 years'],
+                           dtype='category')
+    # experience_enc is a label code per distinct string, not an ordinal
+    codes = pd.Series([1, 2, 0, 3, 1, 4])
+    experience_filter = ExperienceFilter(experience, codes)
+
+    assert experience_filter.encode(' 0-2 Years ') == 1
+    assert experience_filter.mask('0-2 years').tolist() == [True, False, True, True, True, False]
+    assert experience_filter.mask('6 years').tolist() == [False, False, True, False, False, True]
+    assert experience_filter.mask('something else') is None
+
+    # Without experience_enc the codes are derived from the text
+    derived = ExperienceFilter(experience)
+    assert derived.mask('0-2 years').tolist() == experience_filter.mask('0-2 years').tolist()
+
+
+def test_recommenders_exclude_ineligible_jobs():
+    """Job recommendations for a 0-2 years candidate only include overlapping experience ranges."""
+    from job_recommender import JobRecommender
+
+    root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+    recommender = JobRecommender(os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'),
+                                 os.path.join(root_dir, 'ml_models', 'jobs_matcher_model.joblib'))
+    recommendations = recommender.get_recommendations('python, sql, machine learning', 'any', '0-2 years', 20)
+    assert recommendations
+    for rec in recommendations:
+        years = parse_experience(rec['experience_required'])
+        assert years is None or years[0] <= 2
+
+
+if __name__ == "__main__":
+    test_parse_experience()
+    test_mask_matches_per_row_check()
+    test_recommenders_exclude_ineligible_jobs()
+    print("✅ Experience filter tests passed")
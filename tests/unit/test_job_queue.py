@@ -0,0 +1,158 @@
+"""
+Test script to verify the in-process job queue and the resume upload endpoints
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the backend directory to the Python path
+root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.append(os.path.join(root_dir, 'backend'))
+
+from job_queue import JobQueue, QueueFullError, JobTooLargeError
+
+
+def wait_for(job, timeout=5.0):
+    deadline = time.time() + timeout
+    while job.status != 'done' and time.time() < deadline:
+        time.sleep(0.01)
+    return job.status == 'done'
+
+
+def test_jobs_are_processed_by_workers():
+    """Every item of a job produces a result, failures included."""
+    def handler(item):
+        if item == 'bad':
+            raise ValueError('cannot parse')
+        return {'item': item}
+
+    job_queue = JobQueue(handler, workers=2)
+    job = job_queue.submit(['a', 'bad', 'c'])
+
+    assert wait_for(job)
+    data = job.to_dict()
+    assert data['completed'] == 3
+    assert data['failed'] == 1
+    assert sorted(r.get('item', 'error') for r in data['results']) == ['a', 'c', 'error']
+    assert job_queue.metrics()['items_processed'] == 3
+    job_queue.shutdown()
+
+
+def test_queue_applies_backpressure():
+    """Jobs that do not fit in the queue are rejected."""
+    release = threading.Event()
+    job_queue = JobQueue(lambda item: release.wait(5), workers=1, max_queue_size=2)
+    try:
+        job_queue.submit(['running'])
+        time.sleep(0.05)
+        job_queue.submit(['waiting-1', 'waiting-2'])
+        try:
+            job_queue.submit(['overflow'])
+            assert False, 'Expected QueueFullError'
+        except QueueFullError:
+            pass
+        metrics = job_queue.metrics()
+        assert metrics['queue_depth'] == 2
+        assert metrics['jobs_rejected'] == 1
+    finally:
+        release.set()
+        job_queue.shutdown()
+
+
+def test_oversized_job_is_rejected_outright():
+    """A job larger than the whole queue fails with JobTooLargeError even when the queue is idle."""
+    job_queue = JobQueue(lambda item: item, workers=1, max_queue_size=2)
+    try:
+        job_queue.submit(['a', 'b', 'c'])
+        assert False, 'Expected JobTooLargeError'
+    except JobTooLargeError:
+        pass
+    assert job_queue.metrics()['jobs_rejected'] == 0
+    assert wait_for(job_queue.submit(['a', 'b']))
+    job_queue.shutdown()
+
+
+def test_job_is_running_while_first_item_is_processed():
+    """started_at is set when a worker picks up the first item, before any result exists."""
+    release = threading.Event()
+    job_queue = JobQueue(lambda item: release.wait(5), workers=1)
+    try:
+        job = job_queue.submit(['slow'])
+        deadline = time.time() + 5
+        while job.status == 'queued' and time.time() < deadline:
+            time.sleep(0.01)
+        assert job.status == 'running'
+        assert job.to_dict()['completed'] == 0
+    finally:
+        release.set()
+        job_queue.shutdown()
+
+
+def test_results_stream_in_completion_order():
+    """iter_results yields each result once and stops when the job is done."""
+    job_queue = JobQueue(lambda item: {'n': item}, workers=1)
+    job = job_queue.submit([1, 2, 3])
+
+    streamed = [r['n'] for r in job.iter_results(timeout=5)]
+
+    assert streamed == [1, 2, 3]
+    job_queue.shutdown()
+
+
+def test_resume_upload_endpoint():
+    """Uploaded resumes are queued, parsed and scored in the background."""
+    import api_server
+    import resume_ingestion
+
+    if not resume_ingestion.PDF_SUPPORT_AVAILABLE:
+        print("⚠️ pypdf not installed, skipping resume upload test")
+        return
+
+    class FakeMLMatcher:
+        def get_recommendations_for_profile(self, user_profile, top_k=5):
+            return [{'role': 'software developer', 'skills_seen': user_profile['skills']}][:top_k]
+
+    original = (api_server.ml_matcher, api_server.ml_model_loaded, api_server.resume_queue)
+    api_server.ml_matcher = FakeMLMatcher()
+    api_server.ml_model_loaded = True
+    api_server.resume_queue = None
+    try:
+        client = api_server.app.test_client()
+        with open(os.path.join(root_dir, 'test_resume2.pdf'), 'rb') as f:
+            response = client.post('/resume_recommend', data={'resumes': (f, 'test_resume2.pdf'), 'top_k': '1'},
+                                   content_type='multipart/form-data')
+        assert response.status_code == 202
+        job_id = response.get_json()['job_id']
+
+        stream = client.get(f'/resume_jobs/{job_id}/stream').get_data(as_text=True)
+        assert 'event: result' in stream and 'event: done' in stream
+
+        data = client.get(f'/resume_jobs/{job_id}').get_json()
+        assert data['status'] == 'done'
+        assert data['results'][0]['user_profile']['name'] == 'Priya Sharma'
+        assert 'Python' in data['results'][0]['recommendations'][0]['skills_seen']
+
+        for top_k in ('0', '-1', 'many'):
+            with open(os.path.join(root_dir, 'test_resume2.pdf'), 'rb') as f:
+                response = client.post('/resume_recommend', data={'resumes': (f, 'test_resume2.pdf'), 'top_k': top_k},
+                                       content_type='multipart/form-data')
+            assert response.status_code == 400
+
+        assert client.get('/resume_jobs/unknown').status_code == 404
+        assert client.get('/resume_jobs/metrics').get_json()['items_processed'] == 1
+    finally:
+        if api_server.resume_queue:
+            api_server.resume_queue.shutdown()
+        api_server.ml_matcher, api_server.ml_model_loaded, api_server.resume_queue = original
+
+
+if __name__ == "__main__":
+    test_jobs_are_processed_by_workers()
+    test_queue_applies_backpressure()
+    test_oversized_job_is_rejected_outright()
+    test_job_is_running_while_first_item_is_processed()
+    test_results_stream_in_completion_order()
+    test_resume_upload_endpoint()
+    print("✅ Job queue tests passed")
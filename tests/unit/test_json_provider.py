@@ -0,0 +1,55 @@
+"""
+Test script to verify the fast JSON serialization layer
+"""
+
+import sys
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+import json_provider
+from json_provider import dumps_bytes
+
+
+def test_numpy_and_pandas_values():
+    """NumPy and pandas values serialize with or without orjson."""
+    payload = {'b': np.int64(3), 'a': np.float32(1.5), 'c': np.array([1, 2]), 'd': pd.Series(['x', 'y']),
+               'e': np.bool_(True), 'f': pd.NA}
+    expected = {'a': 1.5, 'b': 3, 'c': [1, 2], 'd': ['x', 'y'], 'e': True, 'f': None}
+
+    assert json.loads(dumps_bytes(payload)) == expected
+    available = json_provider.ORJSON_AVAILABLE
+    try:
+        json_provider.ORJSON_AVAILABLE = False
+        assert json.loads(dumps_bytes(payload)) == expected
+    finally:
+        json_provider.ORJSON_AVAILABLE = available
+
+
+def test_fragment_responses():
+    """Listing pages built from cached row fragments match a regular encoding."""
+    import api_server
+
+    api_server.initialize_matchers()
+    client = api_server.app.test_client()
+
+    data = client.get('/internships?limit=3&location=delhi').get_json()
+    projected = client.get('/internships?limit=3&location=delhi&fields=company,stipend').get_json()
+    assert data['count'] == 3 and len(data['internships']) == 3
+    assert [{'company': row['company'], 'stipend': row['stipend']} for row in data['internships']] == \
+        projected['internships']
+
+    with api_server.app.app_context():
+        response = api_server.app.json.fragment_response({}, 'rows', [])
+    assert json.loads(response.get_data()) == {'rows': []}
+
+
+if __name__ == "__main__":
+    test_numpy_and_pandas_values()
+    test_fragment_responses()
+    print("✅ JSON provider tests passed")
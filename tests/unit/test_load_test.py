@@ -0,0 +1,69 @@
+"""
+Test script to verify the open-loop load driver against a local stub server
+"""
+
+import sys
+import os
+import threading
+from types import SimpleNamespace
+
+# Add the benchmarks directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'benchmarks'))
+
+from flask import Flask, jsonify
+from werkzeug.serving import make_server
+from load_test import parse_mix, build_schedule, build_report, LoadDriver
+
+ARGS = SimpleNamespace(profiles=20, max_user_id=8, batch_size=3, target_lang='hi')
+
+
+def test_schedule_is_seeded_and_follows_the_mix():
+    """Same seed gives the same schedule; arrivals stay inside the duration."""
+    mix = parse_mix('ai_recommend=3,job_recommend=1')
+    first = build_schedule(mix, rate=200, duration=5, seed=3, args=ARGS)
+    second = build_schedule(mix, rate=200, duration=5, seed=3, args=ARGS)
+
+    assert [r['at'] for r in first] == [r['at'] for r in second]
+    assert 800 < len(first) < 1200
+    assert all(0 <= r['at'] < 5 for r in first)
+    share = sum(r['endpoint'] == 'ai_recommend' for r in first) / len(first)
+    assert 0.65 < share < 0.85
+    assert set(first[0]['payload']) >= {'skills', 'location'}
+
+
+def test_driver_reports_latency_and_errors_per_endpoint():
+    """Responses are recorded per endpoint and HTTP errors count towards the error rate."""
+    app = Flask(__name__)
+
+    @app.route('/ai_recommend', methods=['POST'])
+    def ai_recommend():
+        return jsonify({'recommendations': []})
+
+    @app.route('/ml_recommend', methods=['POST'])
+    def ml_recommend():
+        return jsonify({'error': 'boom'}), 500
+
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        mix = parse_mix('ai_recommend=1,ml_recommend=1')
+        schedule = build_schedule(mix, rate=100, duration=0.5, seed=1, args=ARGS)
+        driver = LoadDriver(f'http://127.0.0.1:{server.server_port}', max_in_flight=8, timeout=5)
+        elapsed = driver.run(schedule)
+        report = build_report(driver.records, elapsed, {'rate': 100})
+    finally:
+        server.shutdown()
+
+    assert report['overall']['requests'] == len(schedule)
+    assert report['endpoints']['ai_recommend']['error_rate'] == 0
+    assert report['endpoints']['ml_recommend']['error_rate'] == 1
+    assert report['endpoints']['ml_recommend']['error_breakdown'] == {'HTTP 500': len(
+        [r for r in schedule if r['endpoint'] == 'ml_recommend'])}
+    assert report['endpoints']['ai_recommend']['p99_ms'] >= report['endpoints']['ai_recommend']['p50_ms']
+
+
+if __name__ == "__main__":
+    test_schedule_is_seeded_and_follows_the_mix()
+    test_driver_reports_latency_and_errors_per_endpoint()
+    print("✅ Load driver tests passed")
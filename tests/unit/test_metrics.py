@@ -0,0 +1,55 @@
+"""
+Test script to verify the Prometheus /metrics exposition
+"""
+
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+import metrics
+
+
+def test_registry_render():
+    """Counters, histograms and collectors render in the Prometheus text format."""
+    registry = metrics.Registry()
+    requests_total = registry.counter('requests_total', 'Requests', ['route', 'status'])
+    latency = registry.histogram('latency_seconds', 'Latency', ['route'], buckets=(0.1, 1.0))
+    registry.register_collector(lambda: [metrics.MetricFamily('queue_depth', 'Depth').add(3, queue='a"b')])
+
+    requests_total.inc(route='/x', status=200)
+    requests_total.inc(route='/x', status=200)
+    latency.observe(0.05, route='/x')
+    latency.observe(0.5, route='/x')
+
+    text = registry.render()
+    assert '# TYPE requests_total counter' in text
+    assert 'requests_total{route="/x",status="200"} 2' in text
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{route="/x"} 2' in text
+    assert 'queue_depth{queue="a\\"b"} 3' in text
+
+
+def test_metrics_endpoint():
+    """/metrics counts handled requests by route and reports catalogue sizes."""
+    import api_server
+
+    api_server.initialize_matchers()
+    client = api_server.app.test_client()
+    client.get('/health')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    text = response.get_data(as_text=True)
+    assert 'http_requests_total{route="/health",method="GET",status="200"}' in text
+    assert 'catalogue_size{catalogue="internships"}' in text
+    assert 'ml_model_loaded ' in text
+
+
+if __name__ == "__main__":
+    test_registry_render()
+    test_metrics_endpoint()
+    print("✅ Metrics tests passed")
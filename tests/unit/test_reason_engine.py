@@ -0,0 +1,104 @@
+"""
+Test script to verify batched recommendation reason generation
+"""
+
+import sys
+import os
+
+# Add the ml_models directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+
+from reason_engine import SkillQuery, internship_reasons, job_reasons, validate_explain_level
+
+
+def test_skill_matching():
+    """Whole-skill containment first, then word-level partial matches."""
+    query = SkillQuery('Java, Data Analysis, UI')
+
+    assert query.matched_skills('javascript developer') == ['java']
+    assert query.matched_skills('business analysis associate') == ['data analysis']
+    assert query.matched_skills('sales executive') == []
+
+
+def test_internship_reasons():
+    """Reasons for all rows are built in one call."""
+    user_profile = {
+        'skills': 'JavaScript, React, Node.js',
+        'preferred_domain': 'Web Development',
+        'preferred_location': 'bangalore'
+    }
+
+    reasons = internship_reasons(
+        ['react developer', 'accountant'],
+        ['Web Development', 'Finance'],
+        ['remote', 'delhi'],
+        user_profile
+    )
+
+    assert reasons == [
+        "This internship matches your skills (react) and matches your preferred domain (Web Development) "
+        "and available in your preferred location (Bangalore).",
+        "This internship matches your profile based on our AI analysis."
+    ]
+
+
+def test_job_reasons():
+    """Job reasons include domain and experience clauses."""
+    reasons = job_reasons(
+        ['python developer'], ['Web Development'], ['pune'], ['0-2 years'],
+        'Python', 'Pune', '0-2 years'
+    )
+
+    assert reasons == [
+        "This job matches your skills (python) and matches your domain expertise (Web Development) "
+        "and available in your preferred location (Pune) and matches your experience level (0-2 years)."
+    ]
+
+
+def test_explain_levels():
+    """'short' keeps the first clause only and unknown levels are rejected."""
+    reasons = job_reasons(
+        ['python developer'], ['Web Development'], ['pune'], ['0-2 years'],
+        'Python', 'Pune', '0-2 years', 'short'
+    )
+
+    assert reasons == ["This job matches your skills (python)."]
+    assert validate_explain_level('NONE') == 'none'
+    try:
+        validate_explain_level('verbose')
+        assert False, 'Expected ValueError'
+    except ValueError:
+        pass
+
+
+def test_explain_endpoint():
+    """Recommendations can omit reasons and fetch them one at a time."""
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+    import api_server
+
+    if not api_server.initialize_matchers() or not api_server.ml_model_loaded:
+        print("⚠️ ML model not available, skipping explain endpoint test")
+        return
+
+    client = api_server.app.test_client()
+    form = {'skills': 'Python, SQL', 'domain': 'Data Science', 'location': 'Bangalore'}
+
+    data = client.post('/ai_recommend', json=dict(form, explain='none')).get_json()
+    recommendation = data['recommendations'][0]
+    assert 'reason' not in recommendation
+
+    full = client.post('/ai_recommend', json=form).get_json()['recommendations'][0]
+    explained = client.post('/explain', json=dict(form, internship_id=recommendation['internship_id'])).get_json()
+    assert explained['reason'] == full['reason']
+
+    assert client.post('/explain', json=dict(form, internship_id=-1)).status_code == 404
+    assert client.post('/ml_recommend', json={'user_id': 1, 'explain': 'verbose'}).status_code == 400
+
+
+if __name__ == "__main__":
+    test_skill_matching()
+    test_internship_reasons()
+    test_job_reasons()
+    test_explain_levels()
+    test_explain_endpoint()
+    print("✅ Reason engine tests passed")
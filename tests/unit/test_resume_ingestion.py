@@ -0,0 +1,109 @@
+"""
+Test script to verify server-side resume parsing and batch scoring
+"""
+
+import sys
+import os
+
+# Add the backend and ml_models directories to the Python path
+root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.append(os.path.join(root_dir, 'backend'))
+sys.path.append(os.path.join(root_dir, 'ml_models'))
+
+import resume_ingestion
+from resume_ingestion import parse_resume_text, iter_profiles, score_profiles
+
+SAMPLE_RESUME = """Name: Priya Sharma
+Email: priya.sharma@example.com
+Education:
+B.Sc Computer Science, Delhi University
+Higher Secondary
+Skills:
+Python, JavaScript, Node.js, HTML/CSS, Machine Learning
+"""
+
+
+def test_parse_resume_text():
+    """Skills, education, location and name are pulled from plain text."""
+    profile = parse_resume_text(SAMPLE_RESUME, source='sample.txt')
+
+    assert profile['name'] == 'Priya Sharma'
+    assert profile['skills'] == 'Python, Javascript, Html, Css, Node.js, Machine Learning'
+    assert profile['education'] == 'B.Sc'
+    assert profile['preferred_location'] == 'Delhi'
+    assert profile['preferred_domain'] == 'Web Development'
+
+
+def test_keyword_boundaries():
+    """Keywords only match as whole words."""
+    profile = parse_resume_text('Experienced with Javascript and Sketching. Contact me.')
+
+    assert profile['skills'] == 'Javascript'
+    assert profile['education'] == ''
+
+
+def test_parse_pdf_resumes():
+    """Sample PDFs are parsed in the worker pool, failures are reported per file."""
+    if not resume_ingestion.PDF_SUPPORT_AVAILABLE:
+        print("⚠️ pypdf not installed, skipping PDF parsing test")
+        return
+
+    paths = [os.path.join(root_dir, 'test_resume2.pdf'), os.path.join(root_dir, 'missing.pdf')]
+    profiles = list(iter_profiles(paths, workers=2))
+
+    assert profiles[0]['name'] == 'Priya Sharma'
+    assert 'Python' in profiles[0]['skills']
+    assert 'error' in profiles[1]
+
+
+def test_batch_scoring_matches_single_profile():
+    """Batch scoring returns the same recommendations as one profile at a time."""
+    from ml_internship_matcher import MLInternshipMatcher
+
+    ml_matcher = MLInternshipMatcher(
+        user_dataset_path=os.path.join(root_dir, 'dataset', 'Candidates_cleaned.csv'),
+        internship_dataset_path=os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'),
+        model_path=os.path.join(root_dir, 'ml_models', 'internship_matcher_model.joblib')
+    )
+
+    profiles = [
+        parse_resume_text(SAMPLE_RESUME),
+        parse_resume_text('Skills: Sales, Communication. Based in Mumbai. MBA'),
+        {'source': 'broken.pdf', 'error': 'unreadable'}
+    ]
+    results = list(score_profiles(profiles, ml_matcher, top_k=3, batch_size=2))
+
+    assert len(results) == 3
+    for profile, recommendations in results[:2]:
+        assert recommendations == ml_matcher.get_recommendations_for_profile(profile, 3)
+    assert results[2][1] == []
+
+
+def test_scoring_keeps_input_order_with_failures():
+    """Failed parses interleaved with good profiles come back in input order, paired correctly."""
+    class FakeMLMatcher:
+        def get_recommendations_for_profiles(self, user_profiles, top_k=5, batch_size=64):
+            return [[{'for': profile['source']}] for profile in user_profiles]
+
+    profiles = []
+    for i in range(7):
+        profile = {'source': f'resume-{i}.pdf'}
+        if i in (1, 2, 5):
+            profile['error'] = 'unreadable'
+        profiles.append(profile)
+
+    results = list(score_profiles(profiles, FakeMLMatcher(), top_k=3, batch_size=2))
+
+    assert [profile['source'] for profile, _ in results] == [f'resume-{i}.pdf' for i in range(7)]
+    for profile, recommendations in results:
+        expected = [] if 'error' in profile else [{'for': profile['source']}]
+        assert recommendations == expected
+
+
+if __name__ == "__main__":
+    test_parse_resume_text()
+    test_keyword_boundaries()
+    test_parse_pdf_resumes()
+    test_batch_scoring_matches_single_profile()
+    test_scoring_keeps_input_order_with_failures()
+    print("✅ Resume ingestion tests passed")
@@ -0,0 +1,94 @@
+"""
+Test script to verify the declarative rule pipeline behind InternshipMatcher
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add the ml_models and backend directories to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from bitmap_index import BitmapIndex
+from rule_pipeline import RulePipeline, Rule, ValueRule, ColumnRule, ALL_ROWS
+
+
+class User:
+    def __init__(self, domain, location):
+        self.domain = domain
+        self.location = location
+
+
+def build_pipeline():
+    domains = ['data science', 'marketing', 'data science', 'sales', 'marketing', 'design']
+    locations = ['delhi', 'remote', 'pune', 'delhi', 'delhi', 'remote']
+    bitmaps = BitmapIndex(('domain', 'location'))
+    bitmaps.rebuild({'domain': domains, 'location': locations})
+    columns = {'stipend_value': np.array([0, 5e5, 2e5, 0, 1e6, 3e5])}
+    return RulePipeline(bitmaps, columns, [
+        ValueRule('domain', 'domain', lambda user, domain: user.domain in domain, key=lambda user: user.domain,
+                  fallback=ALL_ROWS),
+        Rule('location', lambda user, pipeline: pipeline.bitmaps.any_of('location', [user.location, 'remote']),
+             fallback='domain'),
+        ColumnRule('paid', 'stipend_value', lambda user, stipends: stipends > 0, fallback='location', fallback_limit=1)
+    ])
+
+
+def test_stage_counts_and_fallbacks():
+    """Each stage reports its surviving rows; empty stages fall back to an earlier stage's stored result."""
+    pipeline = build_pipeline()
+    bitmaps = pipeline.bitmaps
+
+    result = pipeline.run(User('marketing', 'delhi'))
+    assert result.counts == [('domain', 2, False), ('location', 2, False), ('paid', 2, False)]
+    assert bitmaps.positions(result.rows).tolist() == [1, 4]
+
+    # Unknown domain: every row; unpaid Delhi sales role: first location match
+    result = pipeline.run(User('finance', 'delhi'))
+    assert result.counts[0] == ('domain', 0, True)
+    assert bitmaps.positions(result.stages['domain']).tolist() == list(range(6))
+
+    result = pipeline.run(User('sales', 'delhi'))
+    assert result.counts == [('domain', 1, False), ('location', 1, False), ('paid', 0, True)]
+    assert bitmaps.positions(result.rows).tolist() == [3]
+
+
+def test_custom_rules_plug_in():
+    """Custom rules can be inserted before an existing stage and removed again; bad fallbacks are rejected."""
+    pipeline = build_pipeline()
+    pipeline.add(ColumnRule('well_paid', 'stipend_value', lambda user, stipends: stipends >= 5e5), before='paid')
+    result = pipeline.run(User('marketing', 'delhi'))
+    assert [stage for stage, _, _ in result.counts] == ['domain', 'location', 'well_paid', 'paid']
+    assert pipeline.bitmaps.positions(result.rows).tolist() == [1, 4]
+
+    for rule in [Rule('domain'), Rule('late', fallback='missing')]:
+        try:
+            pipeline.add(rule)
+            assert False, "invalid rule accepted"
+        except ValueError:
+            pass
+    pipeline.remove('well_paid')
+    assert [rule.name for rule in pipeline.rules] == ['domain', 'location', 'paid']
+
+
+def test_matcher_pipeline_matches_filter_chain():
+    """The matcher's pipeline keeps the same internships as chaining its apply_* filters with the fallbacks."""
+    from internship_matcher import InternshipMatcher, UserProfile
+
+    root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+    matcher = InternshipMatcher(os.path.join(root_dir, 'dataset', 'Candidates_cleaned.csv'),
+                                os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'))
+    for user in matcher.users + [UserProfile(0, '', '', 'Astronomy', 'Atlantis', '3 months', '')]:
+        domain_filtered = matcher.apply_domain_filter(user, matcher.internships) or matcher.internships
+        location_filtered = matcher.apply_location_filter(user, domain_filtered) or domain_filtered
+        result = matcher.pipeline.run(user)
+        assert matcher.bitmaps.positions(result.rows).tolist() == [matcher._positions[id(i)] for i in location_filtered]
+
+
+if __name__ == "__main__":
+    test_stage_counts_and_fallbacks()
+    test_custom_rules_plug_in()
+    test_matcher_pipeline_matches_filter_chain()
+    print("✅ Rule pipeline tests passed")
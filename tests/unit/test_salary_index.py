@@ -0,0 +1,140 @@
+"""
+Test script to verify the sorted salary index and the min_salary / sort=salary options
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add the ml_models and backend directories to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from salary_index import SalaryIndex
+
+
+def brute_force_top(salaries, locations, k, buckets=None, min_salary=None, allowed=None):
+    salaries = np.nan_to_num(salaries)
+    rows = [i for i in range(len(salaries))
+            if (buckets is None or locations[i].lower() in buckets)
+            and (min_salary is None or salaries[i] >= min_salary)
+            and (allowed is None or allowed[i])]
+    return sorted(rows, key=lambda i: (-salaries[i], i))[:k]
+
+
+def test_top_and_floor_match_brute_force():
+    """Bucket merges and salary floors agree with filtering and sorting every row, including after add()."""
+    rng = np.random.default_rng(7)
+    salaries = rng.choice([0, 1e5, 2.5e5, np.nan, 6e5, 1.2e6], 3000)
+    locations = rng.choice(['Delhi', 'pune', 'Remote', 'delhi'], 3000)
+    domains = rng.choice(['Data Science', 'Marketing'], 3000)
+
+    index = SalaryIndex()
+    index.rebuild(salaries[:2000], {'location': locations[:2000], 'domain': domains[:2000]})
+    index.add(salaries[2000:], {'location': locations[2000:], 'domain': domains[2000:]})
+    assert len(index) == 3000
+
+    allowed = rng.random(3000) < 0.25
+    for k, buckets, min_salary, mask in [(10, None, None, None), (25, ['delhi', 'remote'], 2.5e5, None),
+                                          (40, ['pune', 'remote'], None, allowed), (5, ['delhi'], 1.2e6, allowed)]:
+        got = index.top(k, 'location' if buckets else None, buckets or (), min_salary, mask)
+        assert got == brute_force_top(salaries, locations, k, buckets, min_salary, mask)
+
+    floor = index.at_least(6e5, 'location', ['Delhi'])
+    assert floor.tolist() == [i for i in range(3000) if locations[i].lower() == 'delhi' and salaries[i] >= 6e5]
+    assert index.top(3, 'location', ['nowhere']) == []
+
+
+def test_salary_options_on_recommendation_endpoints():
+    """sort=salary returns the best paid jobs first, min_salary is a floor and bad values are rejected."""
+    import api_server
+
+    client = api_server.app.test_client()
+    body = {'skills': 'python, sql', 'location': 'bangalore', 'top_k': 5, 'explain': 'none'}
+
+    response = client.post('/job_recommend', json=dict(body, sort='salary', min_salary=500000))
+    assert response.status_code == 200
+    jobs = response.get_json()['recommendations']
+    recommender = api_server.get_job_recommender()
+    salaries = [float(recommender.model['job_features'].loc[job['job_id'], 'salary_mid']) for job in jobs]
+    assert jobs and salaries == sorted(salaries, reverse=True) and min(salaries) >= 500000
+
+    assert client.post('/job_recommend', json=dict(body, min_salary='lots')).status_code == 400
+    assert client.post('/job_recommend', json=dict(body, sort='newest')).status_code == 400
+
+
+def test_unreachable_salary_floor_returns_no_recommendations():
+    """A floor above every salary gives an empty list (not an error) for both sort orders."""
+    import api_server
+
+    client = api_server.app.test_client()
+    body = {'skills': 'python', 'location': 'bangalore', 'experience': '0-2 years', 'top_k': 5,
+            'explain': 'none', 'min_salary': 1000000000}
+    for sort in ('relevance', 'salary'):
+        response = client.post('/job_recommend', json=dict(body, sort=sort))
+        assert response.status_code == 200, (sort, response.get_json())
+        assert response.get_json()['recommendations'] == []
+
+    recommender = api_server.get_job_recommender()
+    assert recommender.get_recommendations('python', 'any', '0-2 years', 5, min_salary=1e9) == []
+    assert recommender.get_recommendations('python', 'any', '0-2 years', 5, min_salary=1e9, sort='salary') == []
+
+
+def test_job_endpoints_share_one_recommender():
+    """/job_recommend and /explain (model='job') load the job recommender once and reuse it."""
+    import api_server
+
+    created = []
+    create = api_server.create_job_recommender
+
+    def counting_create():
+        created.append(create())
+        return created[-1]
+
+    api_server.job_recommender = None
+    api_server.create_job_recommender = counting_create
+    try:
+        client = api_server.app.test_client()
+        body = {'skills': 'python, sql', 'location': 'bangalore', 'top_k': 3, 'explain': 'none'}
+        jobs = client.post('/job_recommend', json=body).get_json()['recommendations']
+        assert client.post('/job_recommend', json=body).status_code == 200
+        response = client.post('/explain', json=dict(body, model='job', job_id=jobs[0]['job_id'], explain='short'))
+        assert response.status_code == 200, response.get_json()
+    finally:
+        api_server.create_job_recommender = create
+    assert len(created) == 1 and api_server.get_job_recommender() is created[0]
+
+
+def test_user_and_profile_salary_order_agree():
+    """sort='salary' ranks a stored user's results like the same user's profile (preferred domain first)."""
+    from ml_internship_matcher import MLInternshipMatcher
+
+    root_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+    with tempfile.TemporaryDirectory() as tmp:
+        users_path = os.path.join(tmp, 'users.csv')
+        with open(users_path, 'w') as f:
+            f.write('UserID,Skills,PreferredDomain,PreferredLocation,Education,experience_level\n'
+                    '1,"Python, SQL",Data Science,Delhi,B.Tech,0-2 years\n'
+                    '2,"Excel, Communication",Marketing,Mumbai,BBA,\n')
+        matcher = MLInternshipMatcher(users_path, os.path.join(root_dir, 'dataset', 'Jobs_cleaned.csv'))
+        matcher.train_model()
+
+    for user_id, profile in [(1, {'skills': 'Python, SQL', 'preferred_domain': 'Data Science',
+                                  'preferred_location': 'Delhi', 'education': 'B.Tech',
+                                  'experience_level': '0-2 years'}),
+                             (2, {'skills': 'Excel, Communication', 'preferred_domain': 'Marketing',
+                                  'preferred_location': 'Mumbai', 'education': 'BBA'})]:
+        by_user = matcher.get_recommendations(user_id, 5, explain='none', sort='salary')
+        by_profile = matcher.get_recommendations_for_profile(profile, 5, explain='none', sort='salary')
+        assert by_user and [r['internship_id'] for r in by_user] == [r['internship_id'] for r in by_profile]
+
+
+if __name__ == "__main__":
+    test_top_and_floor_match_brute_force()
+    test_salary_options_on_recommendation_endpoints()
+    test_unreachable_salary_floor_returns_no_recommendations()
+    test_job_endpoints_share_one_recommender()
+    test_user_and_profile_salary_order_agree()
+    print("✅ Salary index tests passed")
@@ -0,0 +1,66 @@
+"""
+Test script to verify the vectorized salary/stipend parser
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the ml_models and backend directories to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from salary_parser import parse_salaries, parse_salary, SALARY_COLUMNS
+
+
+def test_units_and_periods():
+    """Amounts are normalized to INR/year from lpa, k and monthly/weekly stipends."""
+    assert parse_salary('₹  2 - 2.5 lpa') == (200000.0, 250000.0, 225000.0)
+    assert parse_salary('₹  8 lpa') == (800000.0, 800000.0, 800000.0)
+    assert parse_salary('₹ 15,000 /month') == (180000.0, 180000.0, 180000.0)
+    assert parse_salary('10k - 15k per month') == (120000.0, 180000.0, 150000.0)
+    assert parse_salary('5000 per week') == (260000.0, 260000.0, 260000.0)
+    assert parse_salary('20000 INR') == (20000.0, 20000.0, 20000.0)
+    assert parse_salary('Unpaid') == (0.0, 0.0, 0.0)
+    assert all(np.isnan(value) for value in parse_salary('competitive salary'))
+
+
+def test_durations_are_not_amounts():
+    """Numbers directly followed by a period unit are durations: they are neither amounts nor the pay period."""
+    assert parse_salary('4 weeks stipend 5000') == (5000.0, 5000.0, 5000.0)
+    assert parse_salary('6 months 15000/month') == (180000.0, 180000.0, 180000.0)
+    assert parse_salary('5000 per month for 3 months') == (60000.0, 60000.0, 60000.0)
+    assert parse_salary('2-3 months, 8,000 per month') == (96000.0, 96000.0, 96000.0)
+    assert all(np.isnan(value) for value in parse_salary('3 months'))
+
+
+def test_columns_are_float32_and_aligned():
+    """Plain and categorical columns parse to the same float32 frame; missing cells are NaN."""
+    values = pd.Series(['₹  2 lpa', None, '₹  2 lpa', 'Unpaid'], index=[10, 11, 12, 13])
+    parsed = parse_salaries(values)
+    assert list(parsed.columns) == SALARY_COLUMNS
+    assert all(dtype == np.float32 for dtype in parsed.dtypes)
+    assert parsed.index.tolist() == [10, 11, 12, 13]
+    assert parsed['salary_mid'].tolist()[0] == 200000.0 and np.isnan(parsed['salary_mid'].tolist()[1])
+    pd.testing.assert_frame_equal(parse_salaries(values.astype('category')), parsed)
+
+
+def test_internship_salary_range():
+    """Internships carry the parsed range and rank by its midpoint."""
+    from internship_matcher import Internship
+
+    internships = Internship.from_records([{'salary': '₹  2 - 3 lpa'}, {'Stipend': '₹ 10000 /month'},
+                                          {'salary': 'competitive salary'}])
+    assert [internship.salary_mid for internship in internships] == [250000.0, 120000.0, None]
+    assert [internship.stipend_value for internship in internships] == [250000.0, 120000.0, 0.0]
+    assert Internship(1, 'a', 'r', 'd', 'l', 't', '3 months', 'Unpaid').salary_max == 0.0
+
+
+if __name__ == "__main__":
+    test_units_and_periods()
+    test_durations_are_not_amounts()
+    test_columns_are_float32_and_aligned()
+    test_internship_salary_range()
+    print("✅ Salary parser tests passed")
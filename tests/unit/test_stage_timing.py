@@ -0,0 +1,60 @@
+"""
+Test script to verify per-stage latency instrumentation
+"""
+
+import sys
+import os
+import time
+
+# Add the ml_models directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+
+from stage_timing import Histogram, StageTimings
+
+
+def test_histogram_quantiles():
+    """Observations land in cumulative buckets and quantiles stay within them."""
+    histogram = Histogram(buckets=(0.001, 0.01, 0.1))
+    for seconds in [0.0005] * 50 + [0.005] * 45 + [0.05] * 5:
+        histogram.observe(seconds)
+
+    assert [count for _, count in histogram.cumulative_counts()] == [50, 95, 100, 100]
+    assert histogram.quantile(0.5) <= 0.001
+    assert 0.001 < histogram.quantile(0.9) <= 0.01
+    assert histogram.quantile(0.99) <= histogram.max == 0.05
+
+
+def test_clock_and_trace():
+    """Laps record consecutive stages, and a trace collects them for the X-Timing header."""
+    timings = StageTimings()
+    with timings.trace() as trace:
+        clock = timings.clock('pipeline')
+        time.sleep(0.002)
+        clock.lap('first')
+        with timings.stage('pipeline', 'second'):
+            pass
+
+    snapshot = timings.snapshot()
+    assert snapshot['pipeline']['first']['count'] == 1
+    assert snapshot['pipeline']['first']['max_ms'] >= 2.0
+    assert [name for name, _ in trace.stages] == ['pipeline.first', 'pipeline.second']
+    assert trace.header_value().startswith('pipeline.first;dur=')
+
+
+def test_unsampled_traces_record_nothing():
+    """With sampling off, stages and clocks are no-ops."""
+    timings = StageTimings(sample_rate=0.0)
+    with timings.trace() as trace:
+        timings.clock('pipeline').lap('stage')
+        with timings.stage('pipeline', 'other'):
+            pass
+
+    assert trace.stages == []
+    assert timings.snapshot() == {}
+
+
+if __name__ == "__main__":
+    test_histogram_quantiles()
+    test_clock_and_trace()
+    test_unsampled_traces_record_nothing()
+    print("✅ Stage timing tests passed")
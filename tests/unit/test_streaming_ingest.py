@@ -0,0 +1,72 @@
+"""
+Test script to verify chunked streaming ingest into the on-disk catalogue store
+"""
+
+import sys
+import os
+import tempfile
+
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+# Add the ml_models directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ml_models'))
+
+from ml_internship_matcher import MLInternshipMatcher
+import streaming_ingest
+from streaming_ingest import CatalogueStore, CatalogueStoreWriter, ingest_csv
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..', '..')
+USERS_PATH = os.path.join(ROOT_DIR, 'dataset', 'Candidates_cleaned.csv')
+JOBS_PATH = os.path.join(ROOT_DIR, 'dataset', 'Jobs_cleaned.csv')
+
+
+def test_streamed_store_matches_in_memory_catalogue():
+    """Chunked ingest produces the same vectors, columns and recommendations as the in-memory model."""
+    matcher = MLInternshipMatcher(USERS_PATH, JOBS_PATH)
+    matcher.train_model()
+    in_memory_vectors = matcher.model['internship_vectors']
+    in_memory_features = matcher.model['internship_features']
+
+    profile = {'skills': 'Python, SQL', 'preferred_domain': 'Data Science',
+               'preferred_location': 'Delhi', 'education': 'B.Tech'}
+    expected = matcher.get_recommendations_for_profile(profile, top_k=10)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ingest_csv(JOBS_PATH, tmp, matcher, chunk_size=999, verbose=False)
+        assert store.rows == len(in_memory_features)
+
+        vectors = store.vectors()
+        assert abs(vectors - in_memory_vectors).max() == 0
+        features = store.features()
+        for column in ['company_name', 'location_lower', 'domain', 'salary']:
+            assert features[column].dtype == 'category'
+            assert features[column].tolist() == in_memory_features[column].tolist()
+
+        # Serving loads only the columns ranking reads
+        matcher.use_catalogue_store(CatalogueStore(tmp))
+        assert 'salary_min' not in matcher.model['internship_features'].columns
+        assert matcher.get_recommendations_for_profile(profile, top_k=10) == expected
+
+
+def test_string_columns_round_trip_across_blocks():
+    """Values of any length (empty, multi-byte, one very long) decode to the same sorted Categorical."""
+    values = ['delhi', '', 'pune', 'x' * 5000, 'bengaluru', 'delhi', 'pune', 'mumbaï', '', 'delhi'] * 3
+    block_rows = streaming_ingest.STRING_BLOCK_ROWS
+    streaming_ingest.STRING_BLOCK_ROWS = 4
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = CatalogueStoreWriter(tmp, n_features=1)
+            writer.append(pd.DataFrame({'location': values}), csr_matrix((len(values), 1)))
+            writer.close()
+            column = CatalogueStore(tmp).column('location')
+    finally:
+        streaming_ingest.STRING_BLOCK_ROWS = block_rows
+    assert column.tolist() == values
+    assert list(column.categories) == sorted(set(values))
+
+
+if __name__ == "__main__":
+    test_streamed_store_matches_in_memory_catalogue()
+    test_string_columns_round_trip_across_blocks()
+    print("✅ Streaming ingest tests passed")
@@ -0,0 +1,55 @@
+"""
+Test script to verify the seeded synthetic dataset generator
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the benchmarks directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'benchmarks'))
+
+import pandas as pd
+from synthetic_data import write_jobs, write_candidates, JOBS_DATASET_PATH, CANDIDATES_DATASET_PATH
+
+
+def test_jobs_match_schema_and_are_reproducible():
+    """Chunked output keeps the source schema and the same seed gives the same file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = write_jobs(os.path.join(tmp, 'a.csv'), 2500, seed=7, chunk_size=1000)
+        second = write_jobs(os.path.join(tmp, 'b.csv'), 2500, seed=7, chunk_size=1000)
+        jobs = pd.read_csv(first)
+
+        with open(first, 'rb') as f1, open(second, 'rb') as f2:
+            assert f1.read() == f2.read()
+
+    source = pd.read_csv(JOBS_DATASET_PATH)
+    assert len(jobs) == 2500
+    assert jobs.columns.tolist() == source.columns.tolist()
+
+    # experience_enc stays consistent with experience
+    source_pairs = set(zip(source['experience'].dropna(), source['experience_enc']))
+    generated = jobs.dropna(subset=['experience'])
+    assert set(zip(generated['experience'], generated['experience_enc'])) <= source_pairs
+
+    # Salaries keep the source formats
+    formats = jobs['salary'].dropna().str.replace(r'\d+(?:\.\d+)?', 'N', regex=True).unique()
+    assert set(formats) <= {'₹  N - N lpa', '₹  N lpa', 'competitive salary'}
+
+
+def test_candidates_match_schema():
+    """Candidates get sequential IDs and role-consistent skills."""
+    with tempfile.TemporaryDirectory() as tmp:
+        candidates = pd.read_csv(write_candidates(os.path.join(tmp, 'c.csv'), 300, seed=1, chunk_size=128))
+
+    source = pd.read_csv(CANDIDATES_DATASET_PATH)
+    assert candidates.columns.tolist() == source.columns.tolist()
+    assert candidates['candidate_id'].tolist() == list(range(1, 301))
+    assert set(candidates['job_role']) <= set(source['job_role'])
+    assert candidates['skills'].str.len().min() > 0
+
+
+if __name__ == "__main__":
+    test_jobs_match_schema_and_are_reproducible()
+    test_candidates_match_schema()
+    print("✅ Synthetic data tests passed")
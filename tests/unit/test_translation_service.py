@@ -0,0 +1,135 @@
+"""
+Test script to verify the translation engine, its cache and the in-process mode of the API server
+"""
+
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+import translation_service
+from translation_service import TranslationEngine
+
+
+class FakeResult:
+    def __init__(self, text, src):
+        self.text = text
+        self.src = src
+
+
+class FakeTranslator:
+    """Translator stand-in that records calls and can fail on demand."""
+
+    def __init__(self, fail_on=(), failures=0):
+        self.calls = 0
+        self.fail_on = set(fail_on)
+        self.failures = failures
+
+    def translate(self, text, dest):
+        self.calls += 1
+        if text in self.fail_on or self.calls <= self.failures:
+            raise RuntimeError('translator down')
+        return FakeResult(f'{dest}:{text}', 'en')
+
+
+def test_batch_translation_uses_cache():
+    """Repeated texts are served from the cache."""
+    translator = FakeTranslator()
+    engine = TranslationEngine(translator=translator)
+
+    first = engine.translate_batch(['Data Scientist', '', 'Data Scientist'], 'hi')
+    second = engine.translate_batch(['Data Scientist'], 'hi')
+
+    assert first[0] == {'original': 'Data Scientist', 'translated': 'hi:Data Scientist', 'source_lang': 'en'}
+    assert first[1]['translated'] == ''
+    assert second[0] == first[0]
+    assert translator.calls == 1
+    assert engine.cache.stats()['hits'] == 2
+
+
+def test_failed_translation_keeps_original():
+    """Failures keep the original text and are not cached."""
+    translator = FakeTranslator(fail_on={'Sales'})
+    engine = TranslationEngine(translator=translator, max_retries=2)
+
+    result = engine.translate_batch(['Sales'], 'bn')
+
+    assert result[0]['translated'] == 'Sales'
+    assert result[0]['source_lang'] == 'unknown'
+    assert 'error' in result[0]
+    assert engine.cache.stats()['size'] == 0
+
+
+def test_retries_count_one_cache_miss():
+    """A text that needs retries is looked up in the cache once."""
+    translator = FakeTranslator(failures=2)
+    engine = TranslationEngine(translator=translator, max_retries=3)
+
+    result = engine.translate_batch(['Sales'], 'hi')
+
+    assert result[0]['translated'] == 'hi:Sales'
+    assert translator.calls == 3
+    assert engine.cache.stats() == {'size': 1, 'hits': 0, 'misses': 1}
+
+
+def test_default_translator_is_created_on_first_use():
+    """The googletrans Translator is only built when the engine first translates."""
+    created = []
+
+    class CountingTranslator(FakeTranslator):
+        def __init__(self):
+            super().__init__()
+            created.append(self)
+
+    original = translation_service.Translator, translation_service.TRANSLATOR_AVAILABLE
+    translation_service.Translator, translation_service.TRANSLATOR_AVAILABLE = CountingTranslator, True
+    try:
+        engine = TranslationEngine()
+        assert created == []
+        assert engine.translate('Remote', 'hi')['translated'] == 'hi:Remote'
+        engine.translate('Sales', 'hi')
+        assert len(created) == 1
+    finally:
+        translation_service.Translator, translation_service.TRANSLATOR_AVAILABLE = original
+
+
+def test_unsupported_language():
+    """Unsupported languages are rejected before translating."""
+    engine = TranslationEngine(translator=FakeTranslator())
+    try:
+        engine.translate_batch(['Hello'], 'fr')
+    except ValueError:
+        return
+    assert False, 'Expected ValueError for unsupported language'
+
+
+def test_api_server_inprocess_translation():
+    """api_server answers /translate_batch without the standalone service in inprocess mode."""
+    import api_server
+
+    original_mode = api_server.TRANSLATION_MODE
+    original_engine = translation_service.engine
+    translation_service.engine = TranslationEngine(translator=FakeTranslator())
+    api_server.TRANSLATION_MODE = 'inprocess'
+    try:
+        client = api_server.app.test_client()
+        response = client.post('/translate_batch', json={'texts': ['Remote'], 'target_lang': 'hi'})
+        assert response.status_code == 200
+        assert response.get_json()['translations'][0]['translated'] == 'hi:Remote'
+
+        response = client.post('/translate_batch', json={'texts': ['Remote'], 'target_lang': 'xx'})
+        assert response.status_code == 400
+    finally:
+        api_server.TRANSLATION_MODE = original_mode
+        translation_service.engine = original_engine
+
+
+if __name__ == "__main__":
+    test_batch_translation_uses_cache()
+    test_failed_translation_keeps_original()
+    test_retries_count_one_cache_miss()
+    test_default_translator_is_created_on_first_use()
+    test_unsupported_language()
+    test_api_server_inprocess_translation()
+    print("✅ Translation service tests passed")